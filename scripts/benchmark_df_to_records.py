@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark ``df_to_records`` and ``df_to_json`` over wide and tall frames, compared
+to the previous row-by-row implementation:
+
+    python scripts/benchmark_df_to_records.py --rows 100000 --columns 50
+"""
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+import simplejson as json
+
+from superset.dataframe import _convert_big_integers, df_to_json, df_to_records
+from superset.utils.core import json_iso_dttm_ser
+
+
+def legacy_df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
+    columns = dframe.columns
+    return list(
+        dict(zip(columns, map(_convert_big_integers, row)))
+        for row in zip(*[dframe[col] for col in columns])
+    )
+
+
+def generate_df(rows: int, columns: int) -> pd.DataFrame:
+    generators: list[Callable[[int], Any]] = [
+        lambda i: np.arange(rows, dtype=np.int64) * i,
+        lambda i: np.random.rand(rows),
+        lambda i: np.array([f"value {j % 1000}" for j in range(rows)], dtype=object),
+        lambda i: pd.date_range("2023-01-01", periods=rows, freq="min"),
+        lambda i: np.arange(rows) % 2 == 0,
+    ]
+    return pd.DataFrame(
+        {f"col_{i}": generators[i % len(generators)](i) for i in range(columns)}
+    )
+
+
+def measure(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def dumps(records: list[dict[str, Any]]) -> str:
+    return json.dumps(records, default=json_iso_dttm_ser, ignore_nan=True)
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows of the wide frame.")
+@click.option("--columns", default=50, help="Number of columns of the wide frame.")
+def main(rows: int, columns: int) -> None:
+    for label, df in [
+        ("wide", generate_df(rows, columns)),
+        ("tall", generate_df(rows * 10, 5)),
+    ]:
+        click.echo(f"{label} frame, {len(df)} rows x {len(df.columns)} columns:")
+        for name, func in [
+            ("legacy df_to_records", lambda: legacy_df_to_records(df)),
+            ("df_to_records", lambda: df_to_records(df)),
+            ("legacy df_to_records + dumps", lambda: dumps(legacy_df_to_records(df))),
+            ("df_to_records + dumps", lambda: dumps(df_to_records(df))),
+            ("df_to_json", lambda: df_to_json(df)),
+        ]:
+            click.echo(f"{name:>30}: {measure(func):.3f}s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
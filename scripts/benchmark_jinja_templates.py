@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the cost of rendering the SQL of a large templated virtual dataset when it's
+compiled by a new sandboxed environment every time (the previous behavior) and when
+the compiled template is reused from ``CompiledTemplateCache``:
+
+    python scripts/benchmark_jinja_templates.py --branches 200 --renders 500
+"""
+import time
+from typing import Any
+
+import click
+from flask import Flask
+from jinja2 import DebugUndefined
+from jinja2.sandbox import SandboxedEnvironment
+
+from superset.jinja_context import CompiledTemplateCache, where_in
+from superset.stats_logger import DummyStatsLogger
+
+
+def generate_template(branches: int) -> str:
+    """
+    A virtual dataset in the style of our heaviest ones: a macro, loops over filter
+    values, URL parameters and a long CASE expression.
+    """
+    cases = "\n".join(
+        f"    WHEN category = 'category_{i}' THEN {{{{ weight({i}) }}}}"
+        for i in range(branches)
+    )
+    return f"""
+{{% macro weight(i) -%}}
+  {{{{ (i * 1.5) | round(2) }}}}
+{{%- endmacro %}}
+{{% set regions = filter_values('region') %}}
+SELECT
+  ds,
+  region,
+  CASE
+{cases}
+    ELSE 0
+  END AS weight,
+  {{% for metric in ['revenue', 'cost', 'margin'] %}}
+  SUM({{{{ metric }}}}) AS {{{{ metric }}}}_total{{{{ "," if not loop.last }}}}
+  {{% endfor %}}
+FROM sales
+WHERE ds >= '{{{{ url_param('since', '2023-01-01') }}}}'
+{{% if regions %}}
+  AND region IN {{{{ regions | where_in }}}}
+{{% endif %}}
+GROUP BY ds, region, category
+"""
+
+
+def get_context() -> dict[str, Any]:
+    return {
+        "filter_values": lambda column: ["EMEA", "APAC"],
+        "url_param": lambda param, default=None: default,
+    }
+
+
+def render_legacy(sql: str) -> str:
+    environment = SandboxedEnvironment(undefined=DebugUndefined)
+    environment.filters["where_in"] = where_in
+    return environment.from_string(sql).render(get_context())
+
+
+@click.command()
+@click.option("--branches", default=200, help="Number of CASE branches.")
+@click.option("--renders", default=500, help="Number of renders of the template.")
+def main(branches: int, renders: int) -> None:
+    sql = generate_template(branches)
+    app = Flask(__name__)
+    app.config["STATS_LOGGER"] = DummyStatsLogger()
+    with app.app_context():
+        environment = SandboxedEnvironment(undefined=DebugUndefined)
+        environment.filters["where_in"] = where_in
+        cache = CompiledTemplateCache(environment, max_size=1000)
+        assert render_legacy(sql) == cache.get(sql).render(get_context())
+
+        timings = []
+        for render in (render_legacy, lambda sql: cache.get(sql).render(get_context())):
+            start = time.perf_counter()
+            for _ in range(renders):
+                render(sql)
+            timings.append((time.perf_counter() - start) / renders * 1000)
+
+    click.echo(
+        f"{len(sql)} characters, {branches} branches: "
+        f"{timings[0]:.2f} ms -> {timings[1]:.2f} ms per render "
+        f"({timings[0] / timings[1]:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,186 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the latency of metastore cache writes as the ``key_value`` table grows, when
+every write deletes all the expired entries (the previous behavior) and when expired
+entries are deleted in bounded batches using the ``(resource, expires_on)`` index, at
+most once every ``--prune-every`` writes:
+
+    python scripts/benchmark_metastore_cache.py --sizes 10000,100000,1000000
+
+Runs against a temporary SQLite database unless ``--uri`` is given.
+"""
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+import click
+from sqlalchemy import (
+    Column,
+    create_engine,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+)
+from sqlalchemy.engine import Connection
+
+RESOURCE = "superset_metastore_cache"
+VALUE = b'{"native_filters": {}, "data_mask": {}}' * 10
+
+
+def create_table(metadata: MetaData, indexed: bool) -> Table:
+    table = Table(
+        "key_value",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("resource", String(32), nullable=False),
+        Column("value", LargeBinary, nullable=False),
+        Column("uuid", String(36), unique=True),
+        Column("created_on", DateTime),
+        Column("expires_on", DateTime),
+    )
+    if indexed:
+        Index("ix_key_value_resource_expires_on", table.c.resource, table.c.expires_on)
+    return table
+
+
+def populate(connection: Connection, table: Table, rows: int) -> None:
+    now = datetime.now()
+    batch = []
+    for i in range(rows):
+        # about 10% of the entries have expired
+        expires_on = now + timedelta(days=-1 if i % 10 == 0 else 90)
+        batch.append(
+            {
+                "resource": RESOURCE,
+                "value": VALUE,
+                "uuid": str(uuid.uuid4()),
+                "created_on": now,
+                "expires_on": expires_on,
+            }
+        )
+        if len(batch) == 10_000:
+            connection.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(table.insert(), batch)
+
+
+def write(connection: Connection, table: Table) -> None:
+    connection.execute(
+        table.insert(),
+        {
+            "resource": RESOURCE,
+            "value": VALUE,
+            "uuid": str(uuid.uuid4()),
+            "created_on": datetime.now(),
+            "expires_on": datetime.now() + timedelta(days=90),
+        },
+    )
+
+
+def prune_all(connection: Connection, table: Table) -> None:
+    connection.execute(
+        table.delete().where(
+            (table.c.resource == RESOURCE) & (table.c.expires_on <= datetime.now())
+        )
+    )
+
+
+def prune_batch(connection: Connection, table: Table, max_rows: int) -> None:
+    ids = [
+        id_
+        for (id_,) in connection.execute(
+            table.select()
+            .with_only_columns(table.c.id)
+            .where(
+                (table.c.resource == RESOURCE) & (table.c.expires_on <= datetime.now())
+            )
+            .limit(max_rows)
+        )
+    ]
+    if ids:
+        connection.execute(table.delete().where(table.c.id.in_(ids)))
+
+
+def measure(
+    uri: str, rows: int, writes: int, indexed: bool, prune: Callable[[int], bool]
+) -> list[float]:
+    engine = create_engine(uri)
+    metadata = MetaData()
+    table = create_table(metadata, indexed)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        populate(connection, table, rows)
+
+    timings = []
+    for i in range(writes):
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            write(connection, table)
+            if prune(i):
+                if indexed:
+                    prune_batch(connection, table, max_rows=1000)
+                else:
+                    prune_all(connection, table)
+        timings.append((time.perf_counter() - start) * 1000)
+    metadata.drop_all(engine)
+    engine.dispose()
+    return timings
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="10000,100000,1000000",
+    help="Comma separated numbers of rows in the key_value table.",
+)
+@click.option("--writes", default=200, help="Number of writes to measure per size.")
+@click.option(
+    "--prune-every",
+    default=100,
+    help="Number of writes between two batched prunes.",
+)
+@click.option("--uri", default=None, help="SQLAlchemy URI of the database to use.")
+def main(sizes: str, writes: int, prune_every: int, uri: Optional[str]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        uri = uri or f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        for rows in (int(size) for size in sizes.split(",")):
+            for label, indexed, prune in [
+                ("prune on every write", False, lambda i: True),
+                ("batched prune", True, lambda i: i % prune_every == 0),
+            ]:
+                timings = measure(uri, rows, writes, indexed, prune)
+                click.echo(
+                    f"{rows:>9} rows, {label:>20}: "
+                    f"mean {statistics.mean(timings):.2f} ms, "
+                    f"p95 {statistics.quantiles(timings, n=20)[-1]:.2f} ms, "
+                    f"max {max(timings):.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
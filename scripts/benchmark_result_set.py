@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare wall time and peak RSS of building a ``SupersetResultSet`` from DB-API rows
+against the previous implementation, which went through a NumPy structured array.
+
+Each run happens in a fresh process so the peak RSS of one doesn't leak into the
+other:
+
+    python scripts/benchmark_result_set.py --rows 1000000
+"""
+import datetime
+import multiprocessing
+import resource
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pyarrow as pa
+
+DESCRIPTION = [
+    ("id", "INT"),
+    ("name", "VARCHAR"),
+    ("value", "FLOAT"),
+    ("flag", "BOOL"),
+    ("ts", "TIMESTAMP"),
+    ("nullable", "INT"),
+]
+
+
+def generate_rows(rows: int) -> list[tuple[Any, ...]]:
+    start = datetime.datetime(2023, 1, 1)
+    return [
+        (
+            i,
+            f"name {i % 1000}",
+            i * 0.5,
+            i % 2 == 0,
+            start + datetime.timedelta(seconds=i),
+            None if i % 3 else i,
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_result_set(data: list[tuple[Any, ...]]) -> pa.Table:
+    names = [col[0] for col in DESCRIPTION]
+    array = np.array(data, dtype=[(name, "object") for name in names])
+    return pa.Table.from_arrays(
+        [pa.array(array[name].tolist()) for name in names], names=names
+    )
+
+
+def columnar_result_set(data: list[tuple[Any, ...]]) -> pa.Table:
+    # pylint: disable=import-outside-toplevel
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    return SupersetResultSet(data, DESCRIPTION, BaseEngineSpec).pa_table
+
+
+def run(
+    func: Callable[[list[tuple[Any, ...]]], pa.Table],
+    rows: int,
+    queue: "multiprocessing.Queue[tuple[float, int]]",
+) -> None:
+    # warm up, so imports aren't part of the measurement
+    func(generate_rows(10))
+    data = generate_rows(rows)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    func(data)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    queue.put((elapsed, peak))
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows in the result set.")
+def main(rows: int) -> None:
+    for label, func in [
+        ("structured array", legacy_result_set),
+        ("columnar", columnar_result_set),
+    ]:
+        queue: "multiprocessing.Queue[tuple[float, int]]" = multiprocessing.Queue()
+        process = multiprocessing.Process(target=run, args=(func, rows, queue))
+        process.start()
+        elapsed, peak = queue.get()
+        process.join()
+        click.echo(
+            f"{label:>16}: {elapsed:.3f}s, "
+            f"peak RSS increase {peak / 1024:.1f} MiB ({rows} rows)"
+        )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmarks for ``stringify_values`` over the kind of payloads that make
+``pa.array`` reject a column (ARRAY, ROW/STRUCT, MAP and mixed-type columns), compared
+to the previous cell-by-cell implementation:
+
+    python scripts/benchmark_stringify_values.py --rows 500000
+"""
+import datetime
+import json
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from superset.result_set import stringify_values, to_object_array
+from superset.utils import core as utils
+
+
+def legacy_stringify_values(array: NDArray[Any]) -> NDArray[Any]:
+    result = np.copy(array)
+
+    with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
+        for obj in it:
+            if na_obj := pd.isna(obj):
+                obj[na_obj] = None
+            else:
+                try:
+                    obj[...] = obj.astype(str)
+                except ValueError:
+                    obj[...] = json.dumps(obj, default=utils.json_iso_dttm_ser)
+
+    return result
+
+
+def row(i: int) -> Any:
+    # Presto/Trino ROW values come back as lists
+    return [f"name {i}", i, [i * 0.5, None], datetime.date(2023, 1, 1 + i % 28)]
+
+
+PAYLOADS: dict[str, Callable[[int], Any]] = {
+    "array<int>": lambda i: list(range(i % 10)),
+    "array<row>": lambda i: [row(i), row(i + 1)],
+    "map<varchar,int>": lambda i: {"a": i, "b": i + 1},
+    "json with nulls": lambda i: None if i % 4 == 0 else [{"key": str(i)}],
+    "mixed int/str/bool": lambda i: (i, str(i), i % 2 == 0)[i % 3],
+    "bytes": lambda i: f"value {i}".encode(),
+}
+
+
+@click.command()
+@click.option("--rows", default=500_000, help="Number of values in each column.")
+def main(rows: int) -> None:
+    for name, generate in PAYLOADS.items():
+        array = to_object_array([generate(i) for i in range(rows)])
+        timings = []
+        for func in (legacy_stringify_values, stringify_values):
+            start = time.perf_counter()
+            func(array)
+            timings.append(time.perf_counter() - start)
+        click.echo(
+            f"{name:>20}: {timings[0]:.3f}s -> {timings[1]:.3f}s "
+            f"({timings[0] / timings[1]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
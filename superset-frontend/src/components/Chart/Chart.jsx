@@ -68,6 +68,7 @@ const propTypes = {
   chartAlert: PropTypes.string,
   chartStatus: PropTypes.string,
   chartStackTrace: PropTypes.string,
+  chartUpdateEndTime: PropTypes.number,
   queriesResponse: PropTypes.arrayOf(PropTypes.object),
   triggerQuery: PropTypes.bool,
   chartIsStale: PropTypes.bool,
@@ -244,7 +245,7 @@ class Chart extends React.PureComponent {
     );
   }
 
-  render() {
+  renderChart() {
     const {
       height,
       chartAlert,
@@ -327,6 +328,28 @@ class Chart extends React.PureComponent {
       </ErrorBoundary>
     );
   }
+
+  render() {
+    const { chartId, chartStatus, chartUpdateEndTime, dashboardId } =
+      this.props;
+
+    // Dashboards expose the render status on their chart slices instead
+    if (dashboardId) {
+      return this.renderChart();
+    }
+
+    // signals when the chart is ready, e.g. for screenshots, including when it
+    // failed or has nothing to show
+    return (
+      <div
+        data-chart-id={chartId}
+        data-chart-status={chartStatus}
+        data-chart-updated-at={chartUpdateEndTime}
+      >
+        {this.renderChart()}
+      </div>
+    );
+  }
 }
 
 Chart.propTypes = propTypes;
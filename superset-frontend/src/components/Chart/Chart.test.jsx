@@ -0,0 +1,63 @@
+/**
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+import React from 'react';
+import { shallow } from 'enzyme';
+
+import Chart from 'src/components/Chart/Chart';
+import { ChartErrorMessage } from 'src/components/Chart/ChartErrorMessage';
+
+const requiredProps = {
+  actions: {},
+  chartId: 1,
+  formData: {},
+  vizType: 'table',
+  chartUpdateEndTime: 1000,
+};
+
+describe('Chart', () => {
+  it('should expose the render status of a rendered chart', () => {
+    const wrapper = shallow(
+      <Chart {...requiredProps} chartStatus="rendered" />,
+    );
+    const status = wrapper.find('[data-chart-status="rendered"]');
+    expect(status).toExist();
+    expect(status.prop('data-chart-id')).toBe(1);
+    expect(status.prop('data-chart-updated-at')).toBe(1000);
+  });
+
+  it('should expose the render status of a failed chart', () => {
+    const wrapper = shallow(
+      <Chart
+        {...requiredProps}
+        chartStatus="failed"
+        queriesResponse={[{ message: 'Error' }]}
+      />,
+    );
+    const status = wrapper.find('[data-chart-status="failed"]');
+    expect(status).toExist();
+    expect(status.find(ChartErrorMessage)).toExist();
+  });
+
+  it('should not expose the render status of dashboard charts', () => {
+    const wrapper = shallow(
+      <Chart {...requiredProps} dashboardId={1} chartStatus="rendered" />,
+    );
+    expect(wrapper.find('[data-chart-status]')).not.toExist();
+  });
+});
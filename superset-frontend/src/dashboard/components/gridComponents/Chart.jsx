@@ -436,6 +436,9 @@ class Chart extends React.Component {
         data-test-chart-id={id}
         data-test-viz-type={slice.viz_type}
         data-test-chart-name={slice.slice_name}
+        data-chart-id={id}
+        data-chart-status={chartStatus}
+        data-chart-updated-at={chartUpdateEndTime}
       >
         <SliceHeader
           innerRef={this.setHeaderRef}
@@ -89,6 +89,15 @@ describe('Chart', () => {
     expect(wrapper.find(ChartContainer)).toExist();
   });
 
+  it('should expose the chart status for screenshots', () => {
+    const wrapper = setup({
+      chart: { ...props.chart, chartStatus: 'rendered' },
+    });
+    const slice = wrapper.find('[data-chart-id]');
+    expect(slice.prop('data-chart-id')).toBe(queryId);
+    expect(slice.prop('data-chart-status')).toBe('rendered');
+  });
+
   it('should render a description if it has one and isExpanded=true', () => {
     const wrapper = setup();
     expect(wrapper.find('.slice_description')).not.toExist();
@@ -256,6 +256,7 @@ const ExploreChartPanel = ({
             chartStackTrace={chart.chartStackTrace}
             chartId={chart.id}
             chartStatus={chart.chartStatus}
+            chartUpdateEndTime={chart.chartUpdateEndTime}
             triggerRender={triggerRender}
             force={force}
             datasource={datasource}
@@ -279,6 +280,7 @@ const ExploreChartPanel = ({
       chart.chartAlert,
       chart.chartStackTrace,
       chart.chartStatus,
+      chart.chartUpdateEndTime,
       chart.id,
       chart.latestQueryFormData,
       chart.queriesResponse,
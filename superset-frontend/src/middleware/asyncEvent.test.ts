@@ -158,6 +158,36 @@ describe('asyncEvent middleware', () => {
     });
   });
 
+  describe('long polling transport', () => {
+    const config = {
+      GLOBAL_ASYNC_QUERIES_TRANSPORT: 'polling',
+      GLOBAL_ASYNC_QUERIES_POLLING_DELAY: 50,
+      GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT: 30000,
+      GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL: '',
+    };
+
+    beforeEach(async () => {
+      fetchMock.get(EVENTS_ENDPOINT, {
+        status: 200,
+        body: { result: [asyncDoneEvent] },
+      });
+      fetchMock.get(CACHED_DATA_ENDPOINT, {
+        status: 200,
+        body: { result: chartData },
+      });
+      asyncEvent.init(config);
+    });
+
+    it('asks the server to wait for events', async () => {
+      await expect(
+        asyncEvent.waitForAsyncData(asyncPendingEvent),
+      ).resolves.toEqual([chartData]);
+
+      expect(fetchMock.lastUrl(EVENTS_ENDPOINT)).toContain('timeout=30000');
+      expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(1);
+    });
+  });
+
   describe('ws transport', () => {
     let wsServer: WS;
     const config = {
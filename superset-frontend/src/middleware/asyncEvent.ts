@@ -64,6 +64,7 @@ const RETRY_DELAY = 100;
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollingTimeoutMs: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Record<string, ListenerFn>;
 let retriesByJobId: Record<string, number>;
@@ -126,7 +127,7 @@ export const waitForAsyncData = async (asyncResponse: AsyncEvent) =>
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -169,18 +170,24 @@ export const processEvents = async (events: AsyncEvent[]) => {
 };
 
 const loadEventsFromApi = async () => {
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs = {
+    ...(lastReceivedEventId ? { last_id: lastReceivedEventId } : {}),
+    ...(longPollingTimeoutMs ? { timeout: longPollingTimeoutMs } : {}),
+  };
+  let delayMs = pollingDelayMs;
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
       if (events?.length) await processEvents(events);
+      // the server already waited for events, poll again right away
+      if (longPollingTimeoutMs) delayMs = 0;
     } catch (err) {
       logging.warn(err);
     }
   }
 
   if (transport === TRANSPORT_POLLING) {
-    pollingTimeoutId = window.setTimeout(loadEventsFromApi, pollingDelayMs);
+    pollingTimeoutId = window.setTimeout(loadEventsFromApi, delayMs);
   }
 };
 
@@ -240,6 +247,7 @@ export const init = (appConfig?: AppConfig) => {
   config = appConfig || getBootstrapData().common.conf;
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollingTimeoutMs = config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT || 0;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
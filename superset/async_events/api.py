@@ -53,6 +53,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Milliseconds to wait for new events when there are none, capped by
+              GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT
+            schema:
+                type: integer
           responses:
             200:
               description: Async event results
@@ -92,7 +99,10 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 "channel"
             ]
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = request.args.get("timeout", 0, type=int)
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, timeout
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
@@ -382,7 +382,13 @@ class ChartDataRestApi(ChartRestApi):
             def _process_data(query_data: Any) -> Any:
                 if result_format == ChartDataResultFormat.CSV:
                     encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+                    if not isinstance(query_data, str):
+                        # streamed CSV, the zip file needs the whole content
+                        query_data = "".join(query_data)
                     return query_data.encode(encoding)
+                if not isinstance(query_data, bytes):
+                    # streamed XLSX, the zip file needs the whole content
+                    query_data = b"".join(query_data)
                 return query_data
 
             files = {
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
@@ -88,7 +89,7 @@ class QueryContext:
     def get_data(
         self,
         df: pd.DataFrame,
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | Iterator[str] | Iterator[bytes] | list[dict[str, Any]]:
         return self._processor.get_data(df)
 
     def get_payload(
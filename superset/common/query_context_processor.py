@@ -17,8 +17,10 @@
 from __future__ import annotations
 
 import copy
+import io
 import logging
 import re
+from collections.abc import Iterator
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import numpy as np
@@ -28,7 +30,7 @@ from pandas import DateOffset
 from typing_extensions import TypedDict
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
@@ -47,7 +49,7 @@ from superset.exceptions import (
     SupersetException,
 )
 from superset.extensions import cache_manager, security_manager
-from superset.models.helpers import QueryResult
+from superset.models.helpers import memoize_sqla_queries, QueryResult
 from superset.models.sql_lab import Query
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
@@ -62,9 +64,11 @@ from superset.utils.core import (
     get_metric_names,
     get_xaxis_label,
     normalize_dttm_col,
+    parallel_map,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.dates import now_as_float
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -361,8 +365,6 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: list[pd.DataFrame] = []
@@ -399,7 +401,11 @@ class QueryContextProcessor:
         metric_names = get_metric_names(query_object.metrics)
         join_keys = [col for col in columns if col not in metric_names]
 
-        for offset in query_object.time_offsets:
+        def get_offset_result(
+            offset: str,
+        ) -> tuple[pd.DataFrame, str, str | None]:
+            # each offset gets its own clone, as offsets may be queried concurrently
+            query_object_clone = copy.copy(query_object)
             try:
                 # pylint: disable=line-too-long
                 # Since the xaxis is also a column name for the time filter, xaxis_label will be set as granularity
@@ -443,10 +449,7 @@ class QueryContextProcessor:
             )
             # whether hit on the cache
             if cache.is_loaded:
-                offset_dfs.append(cache.df)
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
-                continue
+                return cache.df, cache.query, cache_key
 
             query_object_clone_dct = query_object_clone.to_dict()
             # rename metrics: SUM(value) => SUM(value) 1 year ago
@@ -460,9 +463,6 @@ class QueryContextProcessor:
             else:
                 result = self._qc_datasource.query(query_object_clone_dct)
 
-            queries.append(result.query)
-            cache_keys.append(None)
-
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
@@ -512,7 +512,16 @@ class QueryContextProcessor:
                 datasource_uid=query_context.datasource.uid,
                 region=CacheRegion.DATA,
             )
-            offset_dfs.append(offset_metrics_df)
+            return offset_metrics_df, result.query, None
+
+        for offset_df, query, cache_key in parallel_map(
+            get_offset_result,
+            query_object.time_offsets,
+            config["CHART_DATA_MAX_QUERY_WORKERS"],
+        ):
+            offset_dfs.append(offset_df)
+            queries.append(query)
+            cache_keys.append(cache_key)
 
         if offset_dfs:
             # iterate on offset_dfs, left join each with df
@@ -558,7 +567,9 @@ class QueryContextProcessor:
 
         return row[column_index].strftime("%Y")
 
-    def get_data(self, df: pd.DataFrame) -> str | list[dict[str, Any]]:
+    def get_data(
+        self, df: pd.DataFrame
+    ) -> str | bytes | Iterator[str] | Iterator[bytes] | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -568,15 +579,52 @@ class QueryContextProcessor:
 
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
+                # post-processing needs the whole CSV, so it's never streamed
+                if (
+                    config["CSV_STREAMING_EXPORT"]
+                    and self._query_context.result_type
+                    != ChartDataResultType.POST_PROCESSED
+                ):
+                    return csv.df_to_escaped_csv_chunks(
+                        df,
+                        chunk_size=config["CSV_STREAMING_CHUNK_SIZE"],
+                        index=include_index,
+                        **config["CSV_EXPORT"],
+                    )
                 result = csv.df_to_escaped_csv(
                     df, index=include_index, **config["CSV_EXPORT"]
                 )
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
-                result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
+                return self.get_xlsx_data(df)
             return result or ""
 
         return df.to_dict(orient="records")
 
+    def get_xlsx_data(self, df: pd.DataFrame) -> bytes | Iterator[bytes]:
+        start = now_as_float()
+        # post-processing needs the whole file, so it's never streamed
+        if (
+            config["EXCEL_STREAMING_EXPORT"]
+            and self._query_context.result_type != ChartDataResultType.POST_PROCESSED
+        ):
+            file = excel.df_to_excel_file(
+                df,
+                max_rows=config["EXCEL_EXPORT_MAX_ROWS"],
+                max_bytes=config["EXCEL_EXPORT_MAX_BYTES"],
+                **config["EXCEL_EXPORT"],
+            )
+            size = file.seek(0, io.SEEK_END)
+            file.seek(0)
+            result: bytes | Iterator[bytes] = excel.iter_file(file)
+        else:
+            result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
+            size = len(result)
+
+        stats_logger.timing("excel_export.time", now_as_float() - start)
+        stats_logger.gauge("excel_export.size", size)
+        stats_logger.gauge("excel_export.rows", len(df.index))
+        return result
+
     def get_payload(
         self,
         cache_query_context: bool | None = False,
@@ -584,16 +632,23 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
+        max_workers = config["CHART_DATA_MAX_QUERY_WORKERS"]
+        if max_workers > 1:
+            self._load_datasource_relationships()
+
+        # Get all the payloads from the QueryObjects, the queries built to compute
+        # their cache keys are reused to run them
+        with memoize_sqla_queries():
+            query_results = parallel_map(
+                lambda query_obj: get_query_results(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                ),
+                self._query_context.queries,
+                max_workers,
             )
-            for query_obj in self._query_context.queries
-        ]
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -608,6 +663,18 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _load_datasource_relationships(self) -> None:
+        """
+        Load the lazy relationships of the datasource, and its row level security
+        filters, before queries run in worker threads. The datasource belongs to the
+        session of the request thread, which can't be used concurrently.
+        """
+        datasource = self._qc_datasource
+        for attr in ("columns", "metrics", "database"):
+            getattr(datasource, attr, None)
+        if datasource.is_rls_supported:
+            security_manager.get_rls_filters(datasource)
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
@@ -21,6 +21,7 @@ from typing import Any, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 if TYPE_CHECKING:
     from superset.common.query_object import QueryObject
@@ -59,3 +60,39 @@ def is_datetime_series(series: Any) -> bool:
     return pd.api.types.is_datetime64_any_dtype(series) or (
         series.apply(lambda x: isinstance(x, datetime.date) or x is None).all()
     )
+
+
+def serialize_df(df: pd.DataFrame, compression: str | None = None) -> bytes | None:
+    """
+    Serialize a DataFrame as an Arrow IPC stream, keeping the pandas schema (dtypes,
+    index and column names) in the stream metadata.
+
+    Returns ``None`` when the DataFrame can't be represented losslessly in Arrow, eg
+    for non-string or duplicated column names, mixed-type object columns, integers
+    too large for 64 bits, or lists and dicts, which come back as arrays and structs.
+    """
+    if not all(isinstance(column, str) for column in df.columns):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, OverflowError, TypeError, ValueError):
+        return None
+
+    if any(pa.types.is_nested(field.type) for field in table.schema):
+        return None
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def deserialize_df(blob: bytes) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame written by ``serialize_df``.
+    """
+    table = pa.ipc.open_stream(pa.py_buffer(blob)).read_all()
+    # nullable integer columns come back as Python ints, as when read from a cursor
+    return table.to_pandas(integer_object_nulls=True)
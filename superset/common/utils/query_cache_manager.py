@@ -24,6 +24,7 @@ from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.dataframe_utils import deserialize_df, serialize_df
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -32,6 +33,7 @@ from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
+from superset.utils.dates import now_as_float
 
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
@@ -43,6 +45,36 @@ _cache: dict[CacheRegion, Cache] = {
 }
 
 
+def encode_df(df: DataFrame) -> dict[str, Any]:
+    """
+    Return the cache entry fields holding a DataFrame, serialized according to
+    ``DATA_CACHE_DATAFRAME_FORMAT``. DataFrames that can't be serialized losslessly
+    are stored as they are.
+    """
+    if config["DATA_CACHE_DATAFRAME_FORMAT"] == "arrow":
+        start = now_as_float()
+        blob = serialize_df(df, config["DATA_CACHE_DATAFRAME_COMPRESSION"])
+        if blob is not None:
+            stats_logger.timing("cache.df_encode", now_as_float() - start)
+            stats_logger.gauge("cache.df_encoded_size", len(blob))
+            return {"df": blob, "df_format": "arrow"}
+        stats_logger.incr("cache.df_encode_fallback")
+    return {"df": df}
+
+
+def decode_df(cache_value: dict[str, Any]) -> DataFrame:
+    """
+    Return the DataFrame of a cache entry written by ``encode_df``, or by a version
+    of Superset that stored the DataFrame as is.
+    """
+    if cache_value.get("df_format") == "arrow":
+        start = now_as_float()
+        df = deserialize_df(cache_value["df"])
+        stats_logger.timing("cache.df_decode", now_as_float() - start)
+        return df
+    return cache_value["df"]
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -111,7 +143,7 @@ class QueryCacheManager:
                 self.is_loaded = True
 
             value = {
-                "df": self.df,
+                **encode_df(self.df),
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "applied_filter_columns": self.applied_filter_columns,
@@ -152,7 +184,7 @@ class QueryCacheManager:
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = decode_df(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -72,6 +72,9 @@ if TYPE_CHECKING:
 
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
+# The default event logger writes the logs of each request to the metadata database
+# before the request returns. Use superset.utils.log.BufferedDBEventLogger() to
+# write them in batches from a background thread instead.
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -504,6 +507,37 @@ SSH_TUNNEL_TIMEOUT_SEC = 10.0
 #: Timeout (seconds) for transport socket (``socket.settimeout``)
 SSH_TUNNEL_PACKET_TIMEOUT_SEC = 1.0
 
+# ----------------------------------------------------------------------
+# Connection pooling for the analytical databases
+# ----------------------------------------------------------------------
+# By default a new engine, without a connection pool, is created for every query.
+# When enabled, each process keeps pooled engines per database, effective user and
+# engine parameters, reusing connections across queries. Databases connected
+# through an SSH tunnel, databases that aren't saved yet and engine parameters that
+# can't be serialized to JSON are never pooled. The pool parameters below are
+# defaults, they can be overridden per database through ``engine_params`` in its
+# extra attributes, eg: {"engine_params": {"pool_size": 10, "max_overflow": 20}}
+DATABASE_ENGINE_POOLING = False
+DATABASE_ENGINE_POOL_PARAMS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+# Maximum number of pooled engines kept per process, the least recently used ones
+# are disposed first
+DATABASE_ENGINE_POOL_MAX_ENGINES = 100
+
+# The latest partition of Presto, Trino and Hive tables, used by the
+# ``latest_partition`` Jinja macros and when previewing tables, is looked up with a
+# query against the database. The result is cached in each process for this many
+# seconds, set it to 0 to disable the cache. Processes that miss their own cache
+# fall back to the result memoized for 60 seconds in the data cache
+# (``DATA_CACHE_CONFIG``), which invalidating the partition cache doesn't clear.
+PARTITION_CACHE_TIMEOUT = 60
+# Maximum number of partition lookups cached per process
+PARTITION_CACHE_MAX_ENTRIES = 1000
+
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
 DEFAULT_FEATURE_FLAGS.update(
@@ -649,6 +683,14 @@ SCREENSHOT_SELENIUM_RETRIES = 5
 SCREENSHOT_SELENIUM_HEADSTART = 3
 # Wait for the chart animation, in seconds
 SCREENSHOT_SELENIUM_ANIMATION_WAIT = 5
+# Wait for the page to signal that all of its charts have rendered, through their
+# ``data-chart-status`` attribute, instead of sleeping SCREENSHOT_SELENIUM_HEADSTART
+# and SCREENSHOT_SELENIUM_ANIMATION_WAIT. Pages that aren't ready within
+# SCREENSHOT_READY_WAIT seconds fall back to the fixed waits.
+SCREENSHOT_WAIT_FOR_READY = False
+SCREENSHOT_READY_WAIT = int(timedelta(minutes=1).total_seconds())
+# Wait for the chart animation once the page is ready, in seconds
+SCREENSHOT_READY_ANIMATION_WAIT = 1
 # Replace unexpected errors in screenshots with real error messages
 SCREENSHOT_REPLACE_UNEXPECTED_ERRORS = False
 # Max time to wait for error message modal to show up, in seconds
@@ -678,9 +720,36 @@ CACHE_DEFAULT_TIMEOUT = int(timedelta(days=1).total_seconds())
 # Default cache for Superset objects
 CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# The row level security filters of a table are resolved once per request for each
+# combination of roles. Set a timeout (in seconds) to also share them across requests
+# and processes through the cache configured in CACHE_CONFIG. Cached filters are
+# invalidated whenever a filter, or its roles or tables, are changed.
+RLS_FILTERS_CACHE_TIMEOUT: int | None = None
+
+# The view menus a user has a permission on, eg. the databases, schemas and datasets
+# the user can access, are resolved once per request for each user and permission.
+# Set a timeout (in seconds) to also share them across requests and processes through
+# the cache configured in CACHE_CONFIG. Cached permissions are invalidated whenever
+# users, roles or permissions are changed.
+PERMISSIONS_CACHE_TIMEOUT: int | None = None
+
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# The maximum number of threads used to run the queries of a chart data request, and
+# the time comparison queries of each query, concurrently against the database. With
+# the default of 1 they run one after the other.
+CHART_DATA_MAX_QUERY_WORKERS = 1
+
+# Store the DataFrames of cached chart data as compressed Arrow IPC streams ("arrow")
+# rather than pickling them along with the rest of the cache entry. Entries are
+# several times smaller and faster to load; DataFrames that can't be represented
+# losslessly in Arrow are still pickled. Entries written with this enabled can't be
+# read by versions of Superset that don't support it.
+DATA_CACHE_DATAFRAME_FORMAT: Literal["arrow"] | None = None
+# Compression codec used when DATA_CACHE_DATAFRAME_FORMAT is set, eg "zstd" or "lz4"
+DATA_CACHE_DATAFRAME_COMPRESSION: str | None = "zstd"
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -693,6 +762,11 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     # The following parameter only applies to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # At most how often, in seconds, and how many expired entries are deleted when
+    # an entry is added. Set to None to leave it to the `key_value.prune_expired`
+    # Celery task.
+    "PRUNE_INTERVAL": 60,
+    "PRUNE_MAX_ROWS": 1000,
 }
 
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
@@ -707,6 +781,11 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     # The following parameter only applies to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # At most how often, in seconds, and how many expired entries are deleted when
+    # an entry is added. Set to None to leave it to the `key_value.prune_expired`
+    # Celery task.
+    "PRUNE_INTERVAL": 60,
+    "PRUNE_MAX_ROWS": 1000,
 }
 
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
@@ -754,16 +833,37 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # Optional maximum file size in bytes when uploading a CSV
 CSV_UPLOAD_MAX_SIZE = None
 
+# Number of rows of the uploaded CSV and columnar files that are read, and inserted
+# into the database, at a time, so large files don't have to fit in memory. The
+# table is created with the column types inferred from the first chunk of rows.
+UPLOAD_CHUNK_ROWS = 100_000
+
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
 # method.
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# When enabled, CSV exports from the chart data and SQL Lab export endpoints are
+# streamed to the client in chunks of CSV_STREAMING_CHUNK_SIZE rows, instead of
+# building the whole CSV in memory first.
+CSV_STREAMING_EXPORT = False
+CSV_STREAMING_CHUNK_SIZE = 10_000
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# When enabled, XLSX exports from the chart data endpoint are written row by row to
+# a temporary file, using the constant memory mode of xlsxwriter, and streamed from
+# there instead of building the whole workbook in memory. Only the sheet_name and
+# header options of EXCEL_EXPORT are supported in this mode.
+EXCEL_STREAMING_EXPORT = False
+# Streamed XLSX exports with more rows, or larger files, fail with an error. By
+# default only the number of rows of a worksheet is limited.
+EXCEL_EXPORT_MAX_ROWS: int | None = None
+EXCEL_EXPORT_MAX_BYTES: int | None = None
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -924,6 +1024,10 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        "key_value.prune_expired": {
+            "task": "key_value.prune_expired",
+            "schedule": crontab(minute="*/10", hour="*"),
+        },
     }
 
 
@@ -932,6 +1036,16 @@ CELERY_CONFIG = CeleryConfig  # pylint: disable=invalid-name
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
+# Run the charts of the `cache-warmup` task in the Celery worker rather than
+# scheduling one `fetch_url` task per chart that calls the chart warm up API.
+# Charts are deduplicated by cache key, charts whose cache is still fresh are
+# skipped, and the most viewed charts are warmed up first.
+CACHE_WARMUP_IN_PROCESS = False
+# The maximum number of charts warmed up concurrently by the in-process warm up,
+# overall and against any single database
+CACHE_WARMUP_MAX_WORKERS = 8
+CACHE_WARMUP_MAX_WORKERS_PER_DATABASE = 2
+
 # Additional static HTTP headers to be served by your Superset server. Note
 # Flask-Talisman applies the relevant security HTTP headers.
 #
@@ -995,6 +1109,11 @@ QUERY_COST_FORMATTERS_BY_ENGINE: dict[
 # Flag that controls if limit should be enforced on the CTA (create table as queries).
 SQLLAB_CTAS_NO_LIMIT = False
 
+# Fetch the results of SQL Lab queries from the cursor in batches of this many rows,
+# converting each batch to Arrow as it arrives, instead of fetching all the rows
+# at once. This bounds the memory used by the rows on the worker. Disabled when None.
+SQLLAB_FETCH_BATCH_SIZE: int | None = None
+
 # This allows you to define custom logic around the "CREATE TABLE AS" or CTAS feature
 # in SQL Lab that defines where the target schema should be for a given user.
 # Database `CTAS Schema` has a precedence over this setting.
@@ -1028,6 +1147,16 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Store the data of async query results in the results backend as an Arrow IPC file
+# ("arrow") or as Parquet ("parquet"), under its own key next to a small metadata
+# record, rather than inside a single zlib-compressed payload. This spares the
+# payload-wide serialization and compression and lets the results API decode only
+# the rows it returns. Requires RESULTS_BACKEND_USE_MSGPACK.
+RESULTS_BACKEND_DATA_FORMAT: Literal["arrow", "parquet"] | None = None
+# Compression codec used for the data when RESULTS_BACKEND_DATA_FORMAT is set, eg
+# "zstd" or "lz4"
+RESULTS_BACKEND_DATA_COMPRESSION: str | None = "zstd"
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1086,6 +1215,11 @@ JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: dict[str, type[BaseTemplateProcessor]] = {}
 
+# Number of compiled Jinja templates kept in memory by each process. Templates are
+# compiled by a sandboxed environment shared by all the template processors, so
+# rendering the same SQL again only evaluates it. Set to 0 to compile every time.
+JINJA_TEMPLATE_CACHE_SIZE = 1000
+
 # Roles that are controlled by the API / Superset and should not be changes
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -1159,6 +1293,16 @@ DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # pylint: disable=line-too-long,useless-suppression
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# When enabled, Presto queries are polled less often while they aren't making
+# progress, doubling the interval between polls up to PRESTO_POLL_MAX_INTERVAL
+# seconds, and progress is written to the metadata database only when it increased
+# by PRESTO_PROGRESS_UPDATE_DELTA percent or PRESTO_PROGRESS_UPDATE_INTERVAL seconds
+# went by since the last update, instead of on every poll.
+PRESTO_ADAPTIVE_POLLING = False
+PRESTO_POLL_MAX_INTERVAL = 10
+PRESTO_PROGRESS_UPDATE_INTERVAL = 5
+PRESTO_PROGRESS_UPDATE_DELTA = 5
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -1289,6 +1433,18 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Run the saved query context of charts inside the worker to generate the CSV and
+# embedded table of reports, instead of requesting them from the chart data API
+# with the credentials of the executor.
+ALERT_REPORTS_IN_PROCESS_DATA = False
+# Execute the reports that are due at the same time and render the same chart or
+# dashboard, as the same executor, in the same format and window size, in a single
+# task that renders the content once and sends it to all of their recipients.
+ALERT_REPORTS_BATCH_EXECUTION = False
+# Minimum delay, in seconds, between the start of the report tasks that are due at the
+# same time and query the same database. Spreads bursts of reports (e.g. every day at
+# 08:00) over time instead of sending all their queries at once. Disabled when 0.
+ALERT_REPORTS_DATABASE_DISPATCH_INTERVAL = 0
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -1330,6 +1486,15 @@ WEBDRIVER_CONFIGURATION: dict[Any, Any] = {"service_log_path": "/dev/null"}
 # Note: If using Chrome, you'll want to add the "--marionette" arg.
 WEBDRIVER_OPTION_ARGS = ["--headless"]
 
+# The maximum number of idle, logged in web drivers kept by each worker process to be
+# reused by later screenshots, per driver type, user and window size. Set to 0 to
+# start a new web driver for every screenshot.
+WEBDRIVER_POOL_SIZE = 0
+# Pooled web drivers are recycled after taking this many screenshots, or after being
+# alive for this many seconds
+WEBDRIVER_POOL_MAX_USES = 50
+WEBDRIVER_POOL_MAX_AGE = int(timedelta(hours=1).total_seconds())
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
@@ -1496,6 +1661,11 @@ GLOBAL_ASYNC_QUERIES_TRANSPORT = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# When above 0, polling requests wait for up to this many milliseconds for new
+# events instead of returning right away when there are none, and clients poll
+# again as soon as they get a response. Each waiting request holds a web server
+# worker, so this requires an async worker class (eg. gevent).
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
 # Embedded config options
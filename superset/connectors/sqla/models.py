@@ -838,7 +838,7 @@ class SqlaTable(
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
+        sqlaq = self.get_memoized_sqla_query(query_obj)
         sql = self.database.compile_sqla_query(sqlaq.sqla_query)
         sql = self._apply_cte(sql, sqlaq.cte)
         sql = sqlparse.format(sql, reindent=True)
@@ -1417,7 +1417,7 @@ class SqlaTable(
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
+            sqla_query = self.get_memoized_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
         return extra_cache_keys
 
@@ -1628,3 +1628,14 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(Text, nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.rls_filters_after_change
+)
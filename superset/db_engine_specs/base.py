@@ -21,11 +21,13 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Match, Pattern
 from typing import Any, Callable, cast, ContextManager, NamedTuple, TYPE_CHECKING, Union
 
 import pandas as pd
+import pyarrow as pa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -147,6 +149,29 @@ class LimitMethod:  # pylint: disable=too-few-public-methods
     FORCE_LIMIT = "force_limit"
 
 
+class BatchCursor:
+    """
+    Proxy to a DB-API cursor where ``fetchall`` only returns the next batch of rows,
+    so that ``fetch_data`` can be used to fetch the result one batch at a time.
+    """
+
+    def __init__(self, cursor: Any, batch_size: int) -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_batch_size", batch_size)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(self._batch_size)
+
+    def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(min(size or self._batch_size, self._batch_size))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._cursor, name, value)
+
+
 class MetricType(TypedDict, total=False):
     """
     Type for metrics return by `get_metrics`.
@@ -740,6 +765,53 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls, cursor: Any, batch_size: int, limit: int | None = None
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the result in batches of at most ``batch_size`` rows, so they can be
+        processed as they arrive instead of holding all the rows in memory. Each batch
+        goes through ``fetch_data``, so engine specific handling of the rows applies.
+
+        :param cursor: Cursor instance
+        :param batch_size: Maximum number of rows in each batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator over the batches of rows
+        """
+        fetched = 0
+        while limit is None or fetched < limit:
+            size = batch_size if limit is None else min(batch_size, limit - fetched)
+            rows = cls.fetch_data(BatchCursor(cursor, size), size)
+            if not rows:
+                break
+            fetched += len(rows)
+            yield rows
+            if len(rows) < size:
+                break
+
+    @classmethod
+    def fetch_data_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the result as an Arrow table, for drivers that can return columnar
+        batches natively. This skips building (and later transposing) row tuples.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or None if the driver doesn't support Arrow, in
+            which case ``fetch_data`` should be used instead
+        """
+        return None
+
+    @classmethod
+    def expands_data(cls) -> bool:
+        """
+        Whether ``expand_data`` may change the columns or rows of a result set.
+
+        :return: True if the result set must be passed through ``expand_data``
+        """
+        return False
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -799,6 +871,18 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             return type_code.upper()
         return None
 
+    @classmethod
+    def get_arrow_datatype(cls, type_code: Any) -> pa.DataType | None:
+        """
+        Map a column type code from the cursor description to an Arrow data type,
+        used as a hint when building the result set so pyarrow doesn't have to infer
+        the type from the values.
+
+        :param type_code: Type code from cursor description
+        :return: Arrow data type, or None to let pyarrow infer it
+        """
+        return None
+
     @classmethod
     @deprecated(deprecated_in="3.0")
     def normalize_indexes(cls, indexes: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -1004,11 +1088,69 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             to_sql_kwargs["schema"] = table.schema
 
         with cls.get_engine(database) as engine:
-            if engine.dialect.supports_multivalues_insert:
-                to_sql_kwargs["method"] = "multi"
+            to_sql_kwargs["method"] = cls.get_df_to_sql_method(engine)
 
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterator[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from an iterator of Pandas DataFrames to a database, eg. a file
+        read in chunks, so the whole file doesn't have to be loaded in memory.
+
+        The table is created from the schema inferred from the first chunk, according
+        to the `if_exists` argument, and the other chunks are appended to it, so all the
+        chunks need to have the same dtypes, and `object` columns an explicit SQL type
+        in the `dtype` argument. All the chunks are uploaded on one connection in a
+        single transaction, so a chunk that fails doesn't leave the table half loaded,
+        or dropped when it's replaced on databases with transactional DDL. Engines that
+        don't upload with `pandas.DataFrame.to_sql`, or stage the data before loading
+        it, can override this method.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        to_sql_kwargs = {**to_sql_kwargs, "name": table.table}
+
+        if table.schema:
+            # Only add schema when it is preset and non empty.
+            to_sql_kwargs["schema"] = table.schema
+
+        with cls.get_engine(database) as engine:
+            to_sql_kwargs["method"] = cls.get_df_to_sql_method(engine)
+
+            with engine.begin() as connection:
+                for idx, df in enumerate(chunks):
+                    df.to_sql(
+                        con=connection,
+                        **(
+                            {**to_sql_kwargs, "if_exists": "append"}
+                            if idx
+                            else to_sql_kwargs
+                        ),
+                    )
+
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` argument of `pandas.DataFrame.to_sql`, used to insert the
+        rows. Can be overridden for engines with a faster bulk load path.
+
+        :param engine: The engine the rows are inserted with
+        :return: The insertion method
+        """
+        return "multi" if engine.dialect.supports_multivalues_insert else None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
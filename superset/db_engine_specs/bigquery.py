@@ -17,6 +17,7 @@
 import json
 import re
 import urllib
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING
@@ -401,6 +402,36 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
 
         pandas_gbq.to_gbq(df, **to_gbq_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: "Database",
+        table: Table,
+        chunks: Iterator[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from an iterator of Pandas DataFrames to a database.
+
+        Each chunk is loaded with `df_to_sql`, the table is created from the first one
+        and the others are appended to it. Load jobs aren't transactional, so a chunk
+        that fails leaves the chunks before it loaded.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        for idx, df in enumerate(chunks):
+            cls.df_to_sql(
+                database,
+                table,
+                df,
+                {**to_sql_kwargs, "if_exists": "append"} if idx else to_sql_kwargs,
+            )
+
     @classmethod
     def _get_client(cls, engine: Engine) -> Any:
         """
@@ -21,6 +21,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING
 
+import pyarrow as pa
 from flask_babel import gettext as __
 from sqlalchemy import types
 from sqlalchemy.engine.reflection import Inspector
@@ -61,6 +62,27 @@ class DuckDBEngineSpec(BaseEngineSpec):
         ),
     }
 
+    @classmethod
+    def fetch_data_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        try:
+            if not limit:
+                return cursor.fetch_arrow_table()
+
+            # only read the record batches needed for the limit
+            reader = cursor.fetch_record_batch(min(limit, 1_000_000))
+            batches: list[pa.RecordBatch] = []
+            rows = 0
+            while rows < limit:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    break
+                batches.append(batch)
+                rows += batch.num_rows
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+        return pa.Table.from_batches(batches, schema=reader.schema).slice(0, limit)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
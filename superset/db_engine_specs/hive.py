@@ -21,6 +21,7 @@ import os
 import re
 import tempfile
 import time
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib import parse
@@ -91,6 +92,18 @@ def upload_to_s3(filename: str, upload_prefix: str, table: Table) -> str:
     return location
 
 
+def _stringify_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the values of the object columns of a chunk to strings, so they are
+    written as the STRING columns of the table whatever their type in the chunk.
+    """
+    df = df.copy(deep=False)
+    for name, dtype in df.dtypes.items():
+        if dtype == np.dtype("object"):
+            df[name] = df[name].where(df[name].isna(), df[name].astype(str))
+    return df
+
+
 class HiveEngineSpec(PrestoEngineSpec):
     """Reuses PrestoEngineSpec functionality."""
 
@@ -190,6 +203,29 @@ class HiveEngineSpec(PrestoEngineSpec):
         :param df: The dataframe with data to be uploaded
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
+        cls.df_chunks_to_sql(database, table, iter([df]), to_sql_kwargs)
+
+    @classmethod
+    def df_chunks_to_sql(  # pylint: disable=too-many-locals
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterator[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from an iterator of Pandas DataFrames to a database.
+
+        The chunks are staged in a single Parquet file, with the schema of the first
+        chunk, which is uploaded once all of them have been written.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param: table The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
 
         if to_sql_kwargs["if_exists"] == "append":
             raise SupersetException("Append operation not currently supported")
@@ -207,9 +243,6 @@ class HiveEngineSpec(PrestoEngineSpec):
 
             if table_exists:
                 raise SupersetException("Table already exists")
-        elif to_sql_kwargs["if_exists"] == "replace":
-            with cls.get_engine(database) as engine:
-                engine.execute(f"DROP TABLE IF EXISTS {str(table)}")
 
         def _get_hive_type(dtype: np.dtype[Any]) -> str:
             hive_type_by_dtype = {
@@ -221,16 +254,44 @@ class HiveEngineSpec(PrestoEngineSpec):
 
             return hive_type_by_dtype.get(dtype, "STRING")
 
-        schema_definition = ", ".join(
-            f"`{name}` {_get_hive_type(dtype)}" for name, dtype in df.dtypes.items()
-        )
-
         with tempfile.NamedTemporaryFile(
             dir=current_app.config["UPLOAD_FOLDER"], suffix=".parquet"
         ) as file:
-            pq.write_table(pa.Table.from_pandas(df), where=file.name)
+            first = _stringify_objects(next(chunks))
+            schema = pa.Table.from_pandas(first).schema
+            # object columns are STRING, even when the first chunk only has nulls
+            for name, dtype in first.dtypes.items():
+                if dtype == np.dtype("object"):
+                    index = schema.get_field_index(name)
+                    schema = schema.set(
+                        index, schema.field(index).with_type(pa.string())
+                    )
+
+            with pq.ParquetWriter(file.name, schema) as writer:
+                writer.write_table(pa.Table.from_pandas(first, schema=schema))
+                for df in chunks:
+                    writer.write_table(
+                        pa.Table.from_pandas(_stringify_objects(df), schema=schema)
+                    )
+
+            schema_definition = ", ".join(
+                f"`{name}` {_get_hive_type(dtype)}"
+                for name, dtype in first.dtypes.items()
+            )
+
+            location = upload_to_s3(
+                filename=file.name,
+                upload_prefix=current_app.config["CSV_TO_HIVE_UPLOAD_DIRECTORY_FUNC"](
+                    database, g.user, table.schema
+                ),
+                table=table,
+            )
 
             with cls.get_engine(database) as engine:
+                # the table is only replaced once all the chunks have been staged
+                if to_sql_kwargs["if_exists"] == "replace":
+                    engine.execute(f"DROP TABLE IF EXISTS {str(table)}")
+
                 engine.execute(
                     text(
                         f"""
@@ -239,13 +300,7 @@ class HiveEngineSpec(PrestoEngineSpec):
                         LOCATION :location
                         """
                     ),
-                    location=upload_to_s3(
-                        filename=file.name,
-                        upload_prefix=current_app.config[
-                            "CSV_TO_HIVE_UPLOAD_DIRECTORY_FUNC"
-                        ](database, g.user, table.schema),
-                        table=table,
-                    ),
+                    location=location,
                 )
 
     @classmethod
@@ -48,6 +48,7 @@ from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetTemplateException
+from superset.extensions import partition_cache
 from superset.models.sql_lab import Query
 from superset.models.sql_types.presto_sql_types import (
     Array,
@@ -528,7 +529,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
     def latest_partition(
         cls,
         table_name: str,
@@ -538,6 +538,9 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     ) -> tuple[list[str], list[str] | None]:
         """Returns col name and the latest (max) partition value for a table
 
+        The result is cached in the process for ``PARTITION_CACHE_TIMEOUT`` seconds,
+        and for 60 seconds in the data cache shared by all the processes.
+
         :param table_name: the name of the table
         :param schema: schema / database / namespace
         :param database: database query will be run against
@@ -549,7 +552,13 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
-        indexes = database.get_indexes(table_name, schema)
+        indexes, latest = partition_cache.get(
+            database,
+            schema,
+            table_name,
+            "latest_partition",
+            lambda: cls._get_latest_partition(table_name, schema, database),
+        )
         if not indexes:
             raise SupersetTemplateException(
                 f"Error getting partition for {schema}.{table_name}. "
@@ -568,9 +577,29 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
                 "`presto.latest_sub_partition`"
             )
 
+        return indexes[0]["column_names"], latest
+
+    @classmethod
+    @cache_manager.data_cache.memoize(timeout=60)
+    def _get_latest_partition(
+        cls,
+        table_name: str,
+        schema: str | None,
+        database: Database,
+    ) -> tuple[list[dict[str, Any]], list[str] | None]:
+        """
+        Returns the indexes of a table and its latest partition, if it's partitioned.
+
+        The lookup is memoized in the data cache, so that processes which miss their
+        own partition cache reuse the result of another process.
+        """
+        indexes = database.get_indexes(table_name, schema)
+        if not indexes or not indexes[0]["column_names"]:
+            return indexes, None
+
         column_names = indexes[0]["column_names"]
 
-        return column_names, cls._latest_partition_from_df(
+        return indexes, cls._latest_partition_from_df(
             df=database.get_df(
                 sql=cls._partition_query(
                     table_name,
@@ -599,6 +628,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         ``latest_sub_partition('my_table',
             event_category='page', event_type='click')``
 
+        The result is cached for ``PARTITION_CACHE_TIMEOUT`` seconds.
+
         :param table_name: the name of the table, can be just the table
             name or a fully qualified table name as ``schema_name.table_name``
         :type table_name: str
@@ -613,6 +644,20 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        return partition_cache.get(
+            database,
+            schema,
+            table_name,
+            ("latest_sub_partition", json.dumps(kwargs, sort_keys=True, default=str)),
+            lambda: cls._get_latest_sub_partition(
+                table_name, schema, database, **kwargs
+            ),
+        )
+
+    @classmethod
+    def _get_latest_sub_partition(
+        cls, table_name: str, schema: str | None, database: Database, **kwargs: Any
+    ) -> Any:
         indexes = database.get_indexes(table_name, schema)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -1103,6 +1148,10 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
             presto_cols,
         )
 
+    @classmethod
+    def expands_data(cls) -> bool:
+        return is_feature_enabled("PRESTO_EXPAND_DATA")
+
     @classmethod
     def expand_data(  # pylint: disable=too-many-locals
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1226,12 +1275,13 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                 table_name, schema_name, database, show_first=True
             )
 
-            if not latest_parts:
-                latest_parts = tuple([None] * len(col_names))
+            partition_values: list[str | None] = [None] * len(col_names)
+            if latest_parts:
+                partition_values = list(latest_parts)
 
             metadata["partitions"] = {
                 "cols": sorted(indexes[0].get("column_names", [])),
-                "latest": dict(zip(col_names, latest_parts)),
+                "latest": dict(zip(col_names, partition_values)),
                 "partitionQuery": cls._partition_query(
                     table_name=table_name,
                     schema=schema_name,
@@ -1283,7 +1333,9 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         return None
 
     @classmethod
-    def handle_cursor(cls, cursor: Cursor, query: Query, session: Session) -> None:
+    def handle_cursor(  # pylint: disable=too-many-locals
+        cls, cursor: Cursor, query: Query, session: Session
+    ) -> None:
         """Updates progress information"""
         if tracking_url := cls.get_tracking_url(cursor):
             query.tracking_url = tracking_url
@@ -1293,6 +1345,20 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", current_app.config["PRESTO_POLL_INTERVAL"]
         )
+        max_poll_interval = poll_interval
+        progress_update_interval = progress_update_delta = 0
+        if current_app.config["PRESTO_ADAPTIVE_POLLING"]:
+            max_poll_interval = max(
+                poll_interval, current_app.config["PRESTO_POLL_MAX_INTERVAL"]
+            )
+            progress_update_interval = current_app.config[
+                "PRESTO_PROGRESS_UPDATE_INTERVAL"
+            ]
+            progress_update_delta = current_app.config["PRESTO_PROGRESS_UPDATE_DELTA"]
+
+        interval = poll_interval
+        last_completed_splits = None
+        last_progress_update = time.monotonic()
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
@@ -1325,10 +1391,24 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                         completed_splits,
                         total_splits,
                     )
-                    if progress > query.progress:
+                    # small progress changes are only written once in a while
+                    if progress > query.progress and (
+                        progress - query.progress >= progress_update_delta
+                        or time.monotonic() - last_progress_update
+                        >= progress_update_interval
+                    ):
                         query.progress = progress
+                        last_progress_update = time.monotonic()
                     session.commit()
-            time.sleep(poll_interval)
+
+                # back off while the query isn't making progress
+                if completed_splits == last_completed_splits:
+                    interval = min(interval * 2, max_poll_interval)
+                else:
+                    interval = poll_interval
+                last_completed_splits = completed_splits
+
+            time.sleep(interval)
             logger.info("Query %i: Polling the cursor for progress", query_id)
             polled = cursor.poll()
 
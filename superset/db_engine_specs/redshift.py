@@ -16,12 +16,14 @@
 # under the License.
 import logging
 import re
+from collections.abc import Iterator
+from itertools import chain
 from re import Pattern
 from typing import Any, Optional
 
 import pandas as pd
 from flask_babel import gettext as __
-from sqlalchemy.types import NVARCHAR
+from sqlalchemy.types import NVARCHAR, Text
 
 from superset.db_engine_specs.base import BasicParametersMixin
 from superset.db_engine_specs.postgres import PostgresBaseEngineSpec
@@ -125,7 +127,51 @@ class RedshiftEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
         to_sql_kwargs = to_sql_kwargs or {}
-        to_sql_kwargs["dtype"] = {
+        to_sql_kwargs["dtype"] = cls._get_string_dtypes(df)
+
+        super().df_to_sql(
+            df=df, database=database, table=table, to_sql_kwargs=to_sql_kwargs
+        )
+
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterator[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from an iterator of Pandas DataFrames to a database.
+
+        Overrides the base class like `df_to_sql`, for the pandas string types of the
+        first chunk, which the table is created from, and the text columns to be
+        created as nvarchar(max) columns.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        if (first := next(chunks, None)) is None:
+            return
+
+        dtype = {
+            col_name: NVARCHAR(length=65535) if isinstance(type, Text) else type
+            for col_name, type in to_sql_kwargs.get("dtype", {}).items()
+        }
+        super().df_chunks_to_sql(
+            database,
+            table,
+            chain([first], chunks),
+            {**to_sql_kwargs, "dtype": {**dtype, **cls._get_string_dtypes(first)}},
+        )
+
+    @staticmethod
+    def _get_string_dtypes(df: pd.DataFrame) -> dict[str, Any]:
+        return {
             # uses the max size for redshift nvarchar(65335)
             # the default object and string types create a varchar(256)
             col_name: NVARCHAR(length=65535)
@@ -133,10 +179,6 @@ class RedshiftEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
             if isinstance(type, pd.StringDtype)
         }
 
-        super().df_to_sql(
-            df=df, database=database, table=table, to_sql_kwargs=to_sql_kwargs
-        )
-
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
@@ -278,3 +278,16 @@ class QueryNotFoundException(SupersetException):
 
 class ColumnNotFoundException(SupersetException):
     status = 404
+
+
+class ExportTooLargeError(SupersetErrorException):
+    status = 413
+
+    def __init__(self, message: str) -> None:
+        super().__init__(
+            SupersetError(
+                message=message,
+                error_type=SupersetErrorType.GENERIC_BACKEND_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        )
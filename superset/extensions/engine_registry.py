@@ -0,0 +1,163 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, TYPE_CHECKING
+
+from flask import Flask
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import _ConnectionFairy, NullPool, QueuePool
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+from superset.utils.dates import now_as_float
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Mapper
+
+    from superset.models.core import Database
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A ``QueuePool`` that reports how long checkouts wait for a connection, and how
+    many connections are checked out, to the stats logger.
+    """
+
+    stats_logger: BaseStatsLogger = DummyStatsLogger()
+
+    def connect(self) -> _ConnectionFairy:
+        start = now_as_float()
+        try:
+            return super().connect()
+        finally:
+            self.stats_logger.timing(
+                "engine_pool.checkout_wait", now_as_float() - start
+            )
+            self.stats_logger.gauge("engine_pool.checked_out", self.checkedout())
+
+
+class EngineRegistry:
+    """
+    Process-local registry of pooled SQLAlchemy engines for the analytical databases.
+
+    By default an engine with a ``NullPool`` is created for every query, so each one
+    pays for a new connection to the database. When pooling is enabled engines are
+    kept per database, URL, effective user and engine parameters, so connections
+    are reused across requests. Engines are disposed when their database is updated
+    or deleted, and the least recently used ones are disposed when there are too many.
+
+    Engines of databases that aren't saved, eg. when testing a connection, and engines
+    whose parameters can't be serialized to a stable key, eg. callables in
+    ``connect_args``, aren't pooled.
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._pool_params: dict[str, Any] = {}
+        self._max_engines = 0
+        self._engines: OrderedDict[tuple[int, str], Engine] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def init_app(self, app: Flask) -> None:
+        self._enabled = app.config["DATABASE_ENGINE_POOLING"]
+        self._pool_params = app.config["DATABASE_ENGINE_POOL_PARAMS"]
+        self._max_engines = app.config["DATABASE_ENGINE_POOL_MAX_ENGINES"]
+        InstrumentedQueuePool.stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def get_engine(
+        self,
+        database_id: int | None,
+        url: URL,
+        params: dict[str, Any],
+    ) -> Engine:
+        """
+        Return the pooled engine for the given URL and engine parameters, creating it
+        if needed. The parameters configured for the database take precedence over the
+        default pool parameters.
+        """
+        try:
+            params_key = json.dumps(
+                [url.render_as_string(hide_password=False), params],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            params_key = None
+
+        if database_id is None or params_key is None:
+            # the engine could never be disposed or reused, don't keep it
+            return create_engine(url, **{"poolclass": NullPool, **params})
+
+        key = (database_id, params_key)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # connections can't be shared with the parent process after a fork
+                self._engines.clear()
+                self._pid = os.getpid()
+
+            if engine := self._engines.get(key):
+                self._engines.move_to_end(key)
+                return engine
+
+            pool_params = (
+                {}
+                if "poolclass" in params
+                else {"poolclass": InstrumentedQueuePool, **self._pool_params}
+            )
+            engine = create_engine(url, **{**pool_params, **params})
+            event.listen(engine, "connect", self._on_connect)
+            self._engines[key] = engine
+
+            while len(self._engines) > self._max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                evicted.dispose()
+
+        return engine
+
+    def dispose(self, database_id: int) -> None:
+        """
+        Dispose all the engines of a database.
+        """
+        with self._lock:
+            for key in [key for key in self._engines if key[0] == database_id]:
+                self._engines.pop(key).dispose()
+
+    def database_after_change(
+        self,
+        mapper: Mapper,  # pylint: disable=unused-argument
+        connection: Connection,  # pylint: disable=unused-argument
+        target: Database,
+    ) -> None:
+        self.dispose(target.id)
+
+    @staticmethod
+    def _on_connect(
+        dbapi_connection: Any,  # pylint: disable=unused-argument
+        connection_record: Any,  # pylint: disable=unused-argument
+    ) -> None:
+        InstrumentedQueuePool.stats_logger.incr("engine_pool.connect")
@@ -16,6 +16,7 @@
 # under the License.
 import logging
 from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any, Optional
 from uuid import UUID, uuid3
 
@@ -36,15 +37,29 @@ logger = logging.getLogger(__name__)
 
 
 class SupersetMetastoreCache(BaseCache):
-    def __init__(
+    """
+    Cache backed by the ``key_value`` table of the metadata database.
+
+    Expired entries are deleted by the ``key_value.prune_expired`` Celery task, and
+    by ``add`` at most once every ``prune_interval`` seconds per process, in batches
+    of at most ``prune_max_rows`` entries so writes don't pay for a full sweep of
+    the table.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         namespace: UUID,
         codec: KeyValueCodec,
         default_timeout: int = 300,
+        prune_interval: Optional[int] = 60,
+        prune_max_rows: int = 1000,
     ) -> None:
         super().__init__(default_timeout)
         self.namespace = namespace
         self.codec = codec
+        self.prune_interval = prune_interval
+        self.prune_max_rows = prune_max_rows
+        self._last_prune: Optional[float] = None
 
     @classmethod
     def factory(
@@ -63,19 +78,29 @@ class SupersetMetastoreCache(BaseCache):
                 "use at your own risk."
             )
         kwargs["codec"] = codec
+        kwargs["prune_interval"] = config.get("PRUNE_INTERVAL", 60)
+        kwargs["prune_max_rows"] = config.get("PRUNE_MAX_ROWS", 1000)
         return cls(*args, **kwargs)
 
     def get_key(self, key: str) -> UUID:
         return uuid3(self.namespace, key)
 
-    @staticmethod
-    def _prune() -> None:
+    def _prune(self) -> None:
+        if self.prune_interval is None or (
+            self._last_prune is not None
+            and monotonic() - self._last_prune < self.prune_interval
+        ):
+            return
+
         # pylint: disable=import-outside-toplevel
         from superset.key_value.commands.delete_expired import (
             DeleteExpiredKeyValueCommand,
         )
 
-        DeleteExpiredKeyValueCommand(resource=RESOURCE).run()
+        self._last_prune = monotonic()
+        DeleteExpiredKeyValueCommand(
+            resource=RESOURCE, max_rows=self.prune_max_rows
+        ).run()
 
     def _get_expiry(self, timeout: Optional[int]) -> Optional[datetime]:
         timeout = self._normalize_timeout(timeout)
@@ -96,6 +121,20 @@ class SupersetMetastoreCache(BaseCache):
         ).run()
         return True
 
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.key_value.commands.upsert_many import UpsertManyKeyValueCommand
+
+        UpsertManyKeyValueCommand(
+            resource=RESOURCE,
+            values={self.get_key(key): value for key, value in mapping.items()},
+            codec=self.codec,
+            expires_on=self._get_expiry(timeout),
+        ).run()
+        return list(mapping)
+
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.key_value.commands.create import CreateKeyValueCommand
@@ -123,6 +162,16 @@ class SupersetMetastoreCache(BaseCache):
             codec=self.codec,
         ).run()
 
+    def get_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.key_value.commands.get_many import GetManyKeyValueCommand
+
+        return GetManyKeyValueCommand(
+            resource=RESOURCE,
+            keys=[self.get_key(key) for key in keys],
+            codec=self.codec,
+        ).run()
+
     def has(self, key: str) -> bool:
         entry = self.get(key)
         if entry:
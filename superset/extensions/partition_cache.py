@@ -0,0 +1,171 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, TYPE_CHECKING, TypeVar
+
+from flask import Flask
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper
+
+    from superset.models.core import Database
+
+T = TypeVar("T")
+
+PartitionKey = tuple[int, Optional[str], str, Hashable]
+
+
+class _Lookup:
+    """
+    A partition lookup in progress, shared by the callers waiting on its result.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class PartitionCache:
+    """
+    Process-local cache of partition metadata, eg. the latest partition of a table.
+
+    Finding the latest partition runs a query against the warehouse, and templates
+    using ``presto.latest_partition(...)`` do it every time they are rendered, so a
+    dashboard with many charts on the same table runs the same query over and over.
+    Lookups are cached per database, schema and table for ``PARTITION_CACHE_TIMEOUT``
+    seconds, and concurrent lookups of the same key wait for a single query instead
+    of running their own. Failed lookups are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._timeout = 0
+        self._max_entries = 0
+        self._entries: OrderedDict[PartitionKey, tuple[float, Any]] = OrderedDict()
+        self._lookups: dict[PartitionKey, _Lookup] = {}
+        self._lock = threading.Lock()
+        self.stats_logger: BaseStatsLogger = DummyStatsLogger()
+
+    def init_app(self, app: Flask) -> None:
+        self._timeout = app.config["PARTITION_CACHE_TIMEOUT"]
+        self._max_entries = app.config["PARTITION_CACHE_MAX_ENTRIES"]
+        self.stats_logger = app.config["STATS_LOGGER"]
+
+    def get(  # pylint: disable=too-many-arguments
+        self,
+        database: Database,
+        schema: str | None,
+        table_name: str,
+        lookup: Hashable,
+        load: Callable[[], T],
+    ) -> T:
+        """
+        Return the cached result of a partition lookup, calling ``load`` if it isn't
+        cached or has expired.
+
+        :param database: the database the table belongs to
+        :param schema: the schema of the table
+        :param table_name: the name of the table
+        :param lookup: identifies the lookup among the ones cached for the table
+        :param load: runs the lookup against the database
+        """
+        if not self._timeout or database.id is None:
+            return load()
+
+        key = (database.id, schema, table_name, lookup)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats_logger.incr("partition_cache.hit")
+                return entry[1]
+
+            pending = self._lookups.get(key)
+            if pending is None:
+                pending = self._lookups[key] = _Lookup()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            self.stats_logger.incr("partition_cache.wait")
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        self.stats_logger.incr("partition_cache.miss")
+        try:
+            pending.value = load()
+        except BaseException as ex:
+            pending.error = ex
+            raise
+        finally:
+            with self._lock:
+                # the lookup was invalidated while it was running if it's gone
+                if self._lookups.get(key) is pending:
+                    del self._lookups[key]
+                    if pending.error is None:
+                        self._store(key, pending.value)
+            pending.done.set()
+
+        return pending.value
+
+    def invalidate(
+        self,
+        database_id: int,
+        schema: str | None = None,
+        table_name: str | None = None,
+    ) -> None:
+        """
+        Drop the cached lookups of a database, optionally only the ones of a schema
+        or a table. Lookups in progress aren't cached when they complete.
+        """
+
+        def matches(key: PartitionKey) -> bool:
+            return (
+                key[0] == database_id
+                and (schema is None or key[1] == schema)
+                and (table_name is None or key[2] == table_name)
+            )
+
+        with self._lock:
+            for key in [key for key in self._entries if matches(key)]:
+                del self._entries[key]
+            for key in [key for key in self._lookups if matches(key)]:
+                del self._lookups[key]
+
+    def database_after_change(
+        self,
+        mapper: Mapper,  # pylint: disable=unused-argument
+        connection: Connection,  # pylint: disable=unused-argument
+        target: Database,
+    ) -> None:
+        self.invalidate(target.id)
+
+    def _store(self, key: PartitionKey, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._timeout, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -21,6 +21,7 @@ import os
 import sys
 from typing import Any, Callable, TYPE_CHECKING
 
+import sqlalchemy as sqla
 import wtforms_json
 from deprecation import deprecated
 from flask import Flask, redirect
@@ -40,10 +41,12 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_registry,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
     migrate,
+    partition_cache,
     profiling,
     results_backend_manager,
     ssh_manager_factory,
@@ -435,6 +438,8 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_auth_provider()
         self.configure_async_queries()
         self.configure_ssh_manager()
+        self.configure_engine_registry()
+        self.configure_partition_cache()
         self.configure_stats_manager()
 
         # Hook that provides administrators a handle on the Flask APP
@@ -508,6 +513,12 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_ssh_manager(self) -> None:
         ssh_manager_factory.init_app(self.superset_app)
 
+    def configure_engine_registry(self) -> None:
+        engine_registry.init_app(self.superset_app)
+
+    def configure_partition_cache(self) -> None:
+        partition_cache.init_app(self.superset_app)
+
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
@@ -550,6 +561,17 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         appbuilder.security_manager_class = custom_sm
         appbuilder.init_app(self.superset_app, db.session)
 
+        # the cached permissions of users are invalidated when they change
+        for model in (
+            appbuilder.sm.user_model,
+            appbuilder.sm.role_model,
+            appbuilder.sm.permissionview_model,
+        ):
+            for identifier in ("after_insert", "after_update", "after_delete"):
+                sqla.event.listen(
+                    model, identifier, appbuilder.sm.permissions_after_change
+                )
+
     def configure_url_map_converters(self) -> None:
         #
         # Doing local imports here as model importing causes a reference to
@@ -17,12 +17,14 @@
 """Defines the templating context for SQL Lab"""
 import json
 import re
+import threading
+from collections import OrderedDict
 from functools import lru_cache, partial
 from typing import Any, Callable, cast, Optional, TYPE_CHECKING, Union
 
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined
+from jinja2 import DebugUndefined, Template
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.types import String
@@ -416,6 +418,77 @@ def where_in(values: list[Any], mark: str = "'") -> str:
     return f"({joined_values})"
 
 
+class CompiledTemplateCache:
+    """
+    LRU cache of the templates compiled by a sandboxed environment.
+
+    Compiling large templates is much more expensive than rendering them, and the
+    same SQL is rendered for every query of every chart of a virtual dataset, and
+    again to compute their cache keys.
+    """
+
+    def __init__(self, environment: SandboxedEnvironment, max_size: int) -> None:
+        self.environment = environment
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[str, Template] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def overlay(self) -> SandboxedEnvironment:
+        """
+        Return an environment for a template processor, with its own filters, globals
+        and tests, so the processor can customize them without changing the ones of
+        the shared environment.
+        """
+        environment = cast(SandboxedEnvironment, self.environment.overlay())
+        environment.filters = dict(self.environment.filters)
+        environment.globals = dict(self.environment.globals)
+        environment.tests = dict(self.environment.tests)
+        return environment
+
+    def can_compile(self, environment: SandboxedEnvironment) -> bool:
+        """
+        Whether templates for the environment can be compiled by the shared one, ie.
+        it's an overlay whose filters, globals and tests haven't been customized.
+        """
+        return environment is self.environment or (
+            environment.linked_to is self.environment
+            and environment.filters == self.environment.filters
+            and environment.globals == self.environment.globals
+            and environment.tests == self.environment.tests
+        )
+
+    def get(self, sql: str) -> Template:
+        stats_logger = current_app.config["STATS_LOGGER"]
+        with self._lock:
+            if template := self._templates.get(sql):
+                self._templates.move_to_end(sql)
+                self.hits += 1
+                stats_logger.incr("jinja_template_cache.hit")
+                return template
+            self.misses += 1
+
+        stats_logger.incr("jinja_template_cache.miss")
+        template = self.environment.from_string(sql)
+        if self.max_size > 0:
+            with self._lock:
+                self._templates[sql] = template
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+        return template
+
+
+@lru_cache(maxsize=1)
+def get_template_cache() -> CompiledTemplateCache:
+    environment = SandboxedEnvironment(undefined=DebugUndefined)
+    # custom filters
+    environment.filters["where_in"] = where_in
+    return CompiledTemplateCache(
+        environment, current_app.config["JINJA_TEMPLATE_CACHE_SIZE"]
+    )
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -445,16 +518,20 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self._env = SandboxedEnvironment(undefined=DebugUndefined)
+        self._env = get_template_cache().overlay()
         self.set_context(**kwargs)
 
-        # custom filters
-        self._env.filters["where_in"] = where_in
-
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
         self._context.update(context_addons())
 
+    def _get_template(self, sql: str) -> Template:
+        template_cache = get_template_cache()
+        if template_cache.can_compile(self._env):
+            return template_cache.get(sql)
+        # the processor customized its environment
+        return self._env.from_string(sql)
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -462,7 +539,7 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
-        template = self._env.from_string(sql)
+        template = self._get_template(sql)
         kwargs.update(self._context)
 
         context = validate_template_context(self.engine, kwargs)
@@ -576,7 +653,7 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self._env.from_string(sql)
+        template = self._get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
@@ -16,6 +16,7 @@
 # under the License.
 import logging
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy.exc import SQLAlchemyError
@@ -31,19 +32,30 @@ logger = logging.getLogger(__name__)
 
 class DeleteExpiredKeyValueCommand(BaseCommand):
     resource: KeyValueResource
+    max_rows: Optional[int]
+    batch_size: int
 
-    def __init__(self, resource: KeyValueResource):
+    def __init__(
+        self,
+        resource: KeyValueResource,
+        max_rows: Optional[int] = None,
+        batch_size: int = 1000,
+    ):
         """
-        Delete all expired key-value pairs
+        Delete expired key-value pairs, in batches
 
         :param resource: the resource (dashboard, chart etc)
-        :return: was the entry deleted or not
+        :param max_rows: maximum number of entries to delete (all if undefined)
+        :param batch_size: number of entries to delete per transaction
+        :return: the number of deleted entries
         """
         self.resource = resource
+        self.max_rows = max_rows
+        self.batch_size = batch_size
 
-    def run(self) -> None:
+    def run(self) -> int:
         try:
-            self.delete_expired()
+            return self.delete_expired()
         except SQLAlchemyError as ex:
             db.session.rollback()
             raise KeyValueDeleteFailedError() from ex
@@ -51,15 +63,31 @@ class DeleteExpiredKeyValueCommand(BaseCommand):
     def validate(self) -> None:
         pass
 
-    def delete_expired(self) -> None:
-        (
-            db.session.query(KeyValueEntry)
-            .filter(
-                and_(
-                    KeyValueEntry.resource == self.resource.value,
-                    KeyValueEntry.expires_on <= datetime.now(),
+    def delete_expired(self) -> int:
+        deleted = 0
+        now = datetime.now()
+        while self.max_rows is None or deleted < self.max_rows:
+            limit = self.batch_size
+            if self.max_rows is not None:
+                limit = min(limit, self.max_rows - deleted)
+            # uses the (resource, expires_on) index, and keeps the transactions short
+            ids = [
+                id_
+                for (id_,) in db.session.query(KeyValueEntry.id)
+                .filter(
+                    and_(
+                        KeyValueEntry.resource == self.resource.value,
+                        KeyValueEntry.expires_on <= now,
+                    )
                 )
-            )
-            .delete()
-        )
-        db.session.commit()
+                .limit(limit)
+            ]
+            if ids:
+                db.session.query(KeyValueEntry).filter(
+                    KeyValueEntry.id.in_(ids)
+                ).delete(synchronize_session=False)
+                db.session.commit()
+                deleted += len(ids)
+            if len(ids) < limit:
+                break
+        return deleted
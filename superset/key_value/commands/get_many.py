@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.key_value.exceptions import KeyValueGetFailedError
+from superset.key_value.models import KeyValueEntry
+from superset.key_value.types import KeyValueCodec, KeyValueResource
+
+logger = logging.getLogger(__name__)
+
+
+class GetManyKeyValueCommand(BaseCommand):
+    resource: KeyValueResource
+    keys: list[UUID]
+    codec: KeyValueCodec
+
+    def __init__(
+        self,
+        resource: KeyValueResource,
+        keys: list[UUID],
+        codec: KeyValueCodec,
+    ):
+        """
+        Retrieve several key value entries in a single query
+
+        :param resource: the resource (dashboard, chart etc)
+        :param keys: the keys to retrieve
+        :param codec: codec used to decode the values
+        :return: the values associated with the keys, or None for the keys that
+                 are missing or expired, in the order of the keys
+        """
+        self.resource = resource
+        self.keys = keys
+        self.codec = codec
+
+    def run(self) -> list[Optional[Any]]:
+        try:
+            return self.get_many()
+        except SQLAlchemyError as ex:
+            raise KeyValueGetFailedError() from ex
+
+    def validate(self) -> None:
+        pass
+
+    def get_many(self) -> list[Optional[Any]]:
+        if not self.keys:
+            return []
+
+        now = datetime.now()
+        entries = {
+            entry.uuid: entry
+            for entry in db.session.query(KeyValueEntry)
+            .filter(
+                KeyValueEntry.resource == self.resource.value,
+                KeyValueEntry.uuid.in_(self.keys),
+            )
+            .autoflush(False)
+        }
+        values: list[Optional[Any]] = []
+        for key in self.keys:
+            entry = entries.get(key)
+            if entry and (entry.expires_on is None or entry.expires_on > now):
+                values.append(self.codec.decode(entry.value))
+            else:
+                values.append(None)
+        return values
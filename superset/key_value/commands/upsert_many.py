@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.key_value.exceptions import KeyValueUpsertFailedError
+from superset.key_value.models import KeyValueEntry
+from superset.key_value.types import Key, KeyValueCodec, KeyValueResource
+from superset.utils.core import get_user_id
+
+logger = logging.getLogger(__name__)
+
+
+class UpsertManyKeyValueCommand(BaseCommand):
+    resource: KeyValueResource
+    values: dict[UUID, Any]
+    codec: KeyValueCodec
+    expires_on: Optional[datetime]
+
+    def __init__(
+        self,
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: Optional[datetime] = None,
+    ):
+        """
+        Upsert several key value entries in a single transaction
+
+        :param resource: the resource (dashboard, chart etc)
+        :param values: the values to persist in the key-value store, by key
+        :param codec: codec used to encode the values
+        :param expires_on: entries expiration time
+        :return: the keys associated with the persisted values
+        """
+        self.resource = resource
+        self.values = values
+        self.codec = codec
+        self.expires_on = expires_on
+
+    def run(self) -> list[Key]:
+        try:
+            return self.upsert_many()
+        except SQLAlchemyError as ex:
+            db.session.rollback()
+            raise KeyValueUpsertFailedError() from ex
+
+    def validate(self) -> None:
+        pass
+
+    def upsert_many(self) -> list[Key]:
+        if not self.values:
+            return []
+
+        encoded = {key: self.codec.encode(value) for key, value in self.values.items()}
+        now = datetime.now()
+        user_id = get_user_id()
+        entries = {
+            entry.uuid: entry
+            for entry in db.session.query(KeyValueEntry)
+            .filter(
+                KeyValueEntry.resource == self.resource.value,
+                KeyValueEntry.uuid.in_(list(encoded)),
+            )
+            .autoflush(False)
+        }
+        for key, value in encoded.items():
+            if entry := entries.get(key):
+                entry.value = value
+                entry.expires_on = self.expires_on
+                entry.changed_on = now
+                entry.changed_by_fk = user_id
+            else:
+                entries[key] = KeyValueEntry(
+                    resource=self.resource.value,
+                    value=value,
+                    uuid=key,
+                    created_on=now,
+                    created_by_fk=user_id,
+                    expires_on=self.expires_on,
+                )
+                db.session.add(entries[key])
+        db.session.commit()
+        return [Key(id=entries[key].id, uuid=key) for key in encoded]
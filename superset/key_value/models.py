@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 from flask_appbuilder import Model
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String
 from sqlalchemy.orm import relationship
 
 from superset import security_manager
@@ -28,6 +28,9 @@ class KeyValueEntry(Model, AuditMixinNullable, ImportExportMixin):
     """Key value store entity"""
 
     __tablename__ = "key_value"
+    __table_args__ = (
+        Index("ix_key_value_resource_expires_on", "resource", "expires_on"),
+    )
     id = Column(Integer, primary_key=True)
     resource = Column(String(32), nullable=False)
     value = Column(LargeBinary(length=VALUE_MAX_SIZE), nullable=False)
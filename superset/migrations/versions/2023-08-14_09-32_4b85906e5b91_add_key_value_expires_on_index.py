@@ -0,0 +1,42 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add index on key_value resource and expires_on
+
+Revision ID: 4b85906e5b91
+Revises: 8ace289026f3
+Create Date: 2023-08-14 09:32:18.205412
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "4b85906e5b91"
+down_revision = "8ace289026f3"
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index(
+        "ix_key_value_resource_expires_on",
+        "key_value",
+        ["resource", "expires_on"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_key_value_resource_expires_on", table_name="key_value")
@@ -66,6 +66,8 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_registry,
+    partition_cache,
     security_manager,
     ssh_manager_factory,
 )
@@ -424,6 +426,7 @@ class Database(
                 nullpool=nullpool,
                 source=source,
                 sqlalchemy_uri=sqlalchemy_uri,
+                pooled=not ssh_tunnel,
             )
 
     def _get_sqla_engine(
@@ -432,15 +435,19 @@ class Database(
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = True,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
         )
         self.db_engine_spec.validate_database_uri(sqlalchemy_url)
 
+        # reuse pooled engines when enabled, rather than a new engine for every query
+        pooled = pooled and engine_registry.enabled
+
         extra = self.get_extra()
         params = extra.get("engine_params", {})
-        if nullpool:
+        if nullpool and not pooled:
             params["poolclass"] = NullPool
         connect_args = params.get("connect_args", {})
 
@@ -509,6 +516,8 @@ class Database(
                 source,
             )
         try:
+            if pooled:
+                return engine_registry.get_engine(self.id, sqlalchemy_url, params)
             return create_engine(sqlalchemy_url, **params)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
@@ -526,11 +535,17 @@ class Database(
             with closing(engine.raw_connection()) as conn:
                 # pre-session queries are used to set the selected schema and, in the
                 # future, the selected catalog
-                for prequery in self.db_engine_spec.get_prequeries(schema=schema):
+                prequeries = self.db_engine_spec.get_prequeries(schema=schema)
+                for prequery in prequeries:
                     cursor = conn.cursor()
                     cursor.execute(prequery)
 
-                yield conn
+                try:
+                    yield conn
+                finally:
+                    # don't return connections with a modified session to the pool
+                    if prequeries and not isinstance(engine.pool, NullPool):
+                        conn.invalidate()
 
     def get_default_schema_for_query(self, query: Query) -> str | None:
         """
@@ -609,7 +624,9 @@ class Database(
                 _log_query(sqls[-1])
                 self.db_engine_spec.execute(cursor, sqls[-1])
 
-            data = self.db_engine_spec.fetch_data(cursor)
+            data = self.db_engine_spec.fetch_data_arrow(cursor)
+            if data is None:
+                data = self.db_engine_spec.fetch_data(cursor)
             result_set = SupersetResultSet(
                 data, cursor.description, self.db_engine_spec
             )
@@ -985,6 +1002,10 @@ class Database(
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", engine_registry.database_after_change)
+sqla.event.listen(Database, "after_delete", engine_registry.database_after_change)
+sqla.event.listen(Database, "after_update", partition_cache.database_after_change)
+sqla.event.listen(Database, "after_delete", partition_cache.database_after_change)
 
 
 class Log(Model):  # pylint: disable=too-few-public-methods
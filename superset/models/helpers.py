@@ -23,7 +23,8 @@ import logging
 import re
 import uuid
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from json.decoder import JSONDecodeError
 from typing import Any, cast, NamedTuple, Optional, TYPE_CHECKING, Union
@@ -36,7 +37,7 @@ import pytz
 import sqlalchemy as sa
 import sqlparse
 import yaml
-from flask import escape, g, Markup
+from flask import escape, g, has_app_context, Markup
 from flask_appbuilder import Model
 from flask_appbuilder.models.decorators import renders
 from flask_appbuilder.models.mixins import AuditMixin
@@ -83,6 +84,7 @@ from superset.utils.core import (
     GenericDataType,
     get_column_name,
     get_user_id,
+    get_username,
     is_adhoc_column,
     remove_duplicates,
 )
@@ -685,6 +687,25 @@ class SqlaQuery(NamedTuple):
     sqla_query: Select
 
 
+@contextmanager
+def memoize_sqla_queries() -> Iterator[None]:
+    """
+    Reuse the query built for a query object within the block, instead of building
+    it again each time it's needed, eg. when computing its cache key and then when
+    running it. Building a query renders its Jinja templates and applies the row
+    level security filters of the current user.
+    """
+    if not has_app_context() or g.get("sqla_query_memo") is not None:
+        yield
+        return
+
+    g.sqla_query_memo = {}
+    try:
+        yield
+    finally:
+        g.pop("sqla_query_memo", None)
+
+
 class ExploreMixin:  # pylint: disable=too-many-public-methods
     """
     Allows any flask_appbuilder.Model (Query, Table, etc.)
@@ -891,10 +912,36 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             sql = f"{cte}\n{sql}"
         return sql
 
+    def get_memoized_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Return the query built for the query object, reusing the one built earlier
+        for the same query object when within ``memoize_sqla_queries``.
+
+        :param query_obj: the query object
+        :returns: the query
+        """
+        memo = g.get("sqla_query_memo") if has_app_context() else None
+        if memo is None:
+            return self.get_sqla_query(**query_obj)
+
+        key = (
+            self.uid,
+            get_username(),
+            json.dumps(query_obj, sort_keys=True, default=str),
+        )
+        stats_logger = config["STATS_LOGGER"]
+        if (sqlaq := memo.get(key)) is not None:
+            stats_logger.incr("sqla_query_memo.hit")
+            return sqlaq
+
+        stats_logger.incr("sqla_query_memo.miss")
+        sqlaq = memo[key] = self.get_sqla_query(**query_obj)
+        return sqlaq
+
     def get_query_str_extended(
         self, query_obj: QueryObjectDict, mutate: bool = True
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
+        sqlaq = self.get_memoized_sqla_query(query_obj)
         sql = self.database.compile_sqla_query(sqlaq.sqla_query)  # type: ignore
         sql = self._apply_cte(sql, sqlaq.cte)
         sql = sqlparse.format(sql, reindent=True)
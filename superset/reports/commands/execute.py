@@ -17,14 +17,18 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
+from flask import g
 from sqlalchemy.orm import Session
 
 from superset import app, security_manager
+from superset.charts.data.commands.get_data_command import ChartDataCommand
+from superset.charts.post_processing import apply_post_process
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
 from superset.commands.exceptions import CommandException
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -69,15 +73,53 @@ from superset.reports.models import (
 from superset.reports.notifications import create_notification
 from superset.reports.notifications.base import NotificationContent
 from superset.reports.notifications.exceptions import NotificationError
+from superset.tasks.exceptions import ExecutorNotFoundError
 from superset.tasks.utils import get_executor
 from superset.utils.celery import session_scope
-from superset.utils.core import HeaderDataType, override_user
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.core import create_zip, HeaderDataType, override_user
+from superset.utils.csv import (
+    chart_data_to_dataframe,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
 from superset.utils.urls import get_url_path
 
 logger = logging.getLogger(__name__)
 
+ArtifactType = TypeVar("ArtifactType")
+
+
+def get_report_artifact_key(
+    report_schedule: ReportSchedule,
+) -> Optional[tuple[Any, ...]]:
+    """
+    Return the key of the content a report renders: reports with the same key render
+    the same screenshots or data, which can be shared. Alerts aren't shared, since
+    each one evaluates its own condition.
+    """
+    if report_schedule.type != ReportScheduleType.REPORT:
+        return None
+
+    try:
+        _, username = get_executor(
+            executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
+            model=report_schedule,
+        )
+    except ExecutorNotFoundError:
+        return None
+
+    return (
+        report_schedule.chart_id,
+        report_schedule.dashboard_id,
+        json.dumps(report_schedule.extra.get("dashboard"), sort_keys=True),
+        report_schedule.report_format,
+        report_schedule.custom_width,
+        report_schedule.custom_height,
+        report_schedule.force_screenshot,
+        username,
+    )
+
 
 class BaseReportState:
     current_states: list[ReportState] = []
@@ -245,21 +287,31 @@ class BaseReportState:
         return [image]
 
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                logger.info(
+                    "Getting chart %s data as user %s",
+                    self._report_schedule.chart_id,
+                    user.username,
+                )
+                csv_data = self._get_in_process_csv_data()
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.CSV)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -274,21 +326,36 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                logger.info(
+                    "Getting chart %s data as user %s",
+                    self._report_schedule.chart_id,
+                    user.username,
+                )
+                result = self._get_chart_data(ChartDataResultFormat.JSON)
+                dataframe = (
+                    chart_data_to_dataframe(result["queries"][0])
+                    if result["queries"]
+                    else None
+                )
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.JSON)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                dataframe = get_chart_dataframe(url, auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
@@ -299,6 +366,46 @@ class BaseReportState:
             raise ReportScheduleCsvFailedError()
         return dataframe
 
+    def _get_chart_data(self, result_format: ChartDataResultFormat) -> dict[str, Any]:
+        """
+        Run the saved query context of the chart as the current user, the executor
+        of the report, and post-process it like the chart data API does.
+        """
+        chart = self._report_schedule.chart
+        json_body = json.loads(chart.query_context)
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+        query_context = ChartDataQueryContextSchema().load(json_body)
+        command = ChartDataCommand(query_context)
+        command.validate()
+        result = command.run()
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.decoder.JSONDecodeError):
+            form_data = {}
+        return apply_post_process(result, form_data, query_context.datasource)
+
+    def _get_in_process_csv_data(self) -> Optional[bytes]:
+        """
+        Generate the CSV attachment without going through the chart data API: a
+        single file, or a zip file with one file per query.
+        """
+        if not security_manager.can_access("can_csv", "Superset"):
+            raise ReportScheduleCsvFailedError("The executor can't export CSV")
+
+        result = self._get_chart_data(ChartDataResultFormat.CSV)
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        files = [query["data"].encode(encoding) for query in result["queries"]]
+        if not files:
+            return None
+        if len(files) == 1:
+            return files[0]
+        return create_zip(
+            {f"query_{idx + 1}.csv": data for idx, data in enumerate(files)}
+        ).getvalue()
+
     def _update_query_context(self) -> None:
         """
         Update chart query context.
@@ -320,6 +427,28 @@ class BaseReportState:
                 "Please try loading the chart and saving it again."
             ) from ex
 
+    def _get_artifact(
+        self, name: str, generate: Callable[[], ArtifactType]
+    ) -> ArtifactType:
+        """
+        Generate the content of the report once for all the reports that share it,
+        when executed as a group. Failures aren't shared, so the next report of the
+        group tries again.
+        """
+        artifacts = g.get("report_artifacts")
+        key = get_report_artifact_key(self._report_schedule)
+        if artifacts is None or key is None:
+            return generate()
+
+        key = (name, *key)
+        if key not in artifacts:
+            artifacts[key] = generate()
+        else:
+            logger.info(
+                "Report %s reuses the %s of its group", self._report_schedule.name, name
+            )
+        return artifacts[key]
+
     def _get_log_data(self) -> HeaderDataType:
         chart_id = None
         dashboard_id = None
@@ -358,14 +487,16 @@ class BaseReportState:
             or self._report_schedule.type == ReportScheduleType.REPORT
         ):
             if self._report_schedule.report_format == ReportDataFormat.VISUALIZATION:
-                screenshot_data = self._get_screenshots()
+                screenshot_data = self._get_artifact(
+                    "screenshots", self._get_screenshots
+                )
                 if not screenshot_data:
                     error_text = "Unexpected missing screenshot"
             elif (
                 self._report_schedule.chart
                 and self._report_schedule.report_format == ReportDataFormat.DATA
             ):
-                csv_data = self._get_csv_data()
+                csv_data = self._get_artifact("csv", self._get_csv_data)
                 if not csv_data:
                     error_text = "Unexpected missing csv file"
             if error_text:
@@ -379,7 +510,7 @@ class BaseReportState:
             self._report_schedule.chart
             and self._report_schedule.report_format == ReportDataFormat.TEXT
         ):
-            embedded_data = self._get_embedded_data()
+            embedded_data = self._get_artifact("embedded_data", self._get_embedded_data)
 
         if self._report_schedule.chart:
             name = (
@@ -19,7 +19,9 @@
 import datetime
 import json
 import logging
-from typing import Any, Optional
+from collections.abc import Iterable, Sequence
+from operator import itemgetter
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -63,21 +65,52 @@ def stringify(obj: Any) -> str:
     return json.dumps(obj, default=utils.json_iso_dttm_ser)
 
 
+# reused across calls, ``json.dumps`` builds a new encoder whenever ``default`` is set
+_json_encoder = json.JSONEncoder(default=utils.json_iso_dttm_ser)
+
+
+def _stringify_bytes(obj: bytes) -> str:
+    try:
+        return obj.decode("ascii")
+    except UnicodeDecodeError:
+        return stringify(obj)
+
+
+def get_stringifier(type_: type) -> Callable[[Any], str]:
+    """
+    Return the function used to serialize values of a given type as strings.
+
+    Sequences (arrays, rows) are serialized as JSON, everything else through ``str``.
+    """
+    if issubclass(type_, (list, tuple, np.ndarray)):
+        return _json_encoder.encode
+    if issubclass(type_, bytes):
+        return _stringify_bytes
+    return str
+
+
 def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
+    """
+    Serialize the values of an object array as strings, keeping nulls as ``None``.
+
+    Nulls are handled with a mask and the serializer for each type present in the
+    column is resolved once, instead of inspecting every cell on its own.
+    """
     result = np.copy(array)
 
-    with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
-        for obj in it:
-            if na_obj := pd.isna(obj):
-                # pandas <NA> type cannot be converted to string
-                obj[na_obj] = None
-            else:
-                try:
-                    # for simple string conversions
-                    # this handles odd character types better
-                    obj[...] = obj.astype(str)
-                except ValueError:
-                    obj[...] = stringify(obj)
+    # pandas <NA> type cannot be converted to string
+    null_mask = pd.isna(result)
+    result[null_mask] = None
+
+    if values := result[~null_mask].tolist():
+        stringifiers = {
+            type_: get_stringifier(type_) for type_ in set(map(type, values))
+        }
+        result[~null_mask] = np.fromiter(
+            (stringifiers[type(value)](value) for value in values),
+            dtype=object,
+            count=len(values),
+        )
 
     return result
 
@@ -86,6 +119,94 @@ def destringify(obj: str) -> Any:
     return json.loads(obj)
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a 1-D object array from a column of values.
+
+    Unlike ``np.array`` this never tries to broadcast nested sequences (eg, ARRAY
+    columns) into extra dimensions.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def get_common_type(types: set[pa.DataType]) -> pa.DataType:
+    """
+    Return the type that holds the values of all the given types, like the one
+    inferred for a column with values of these types: integers and floats are
+    promoted to the widest type that holds them, decimals to the precision and scale
+    that hold all of them, and other types that can't be combined to strings.
+    """
+    if (
+        all(pa.types.is_integer(type_) for type_ in types)
+        and len({pa.types.is_signed_integer(type_) for type_ in types}) == 1
+    ):
+        return max(types, key=lambda type_: type_.bit_width)
+
+    if all(
+        pa.types.is_integer(type_) or pa.types.is_floating(type_) for type_ in types
+    ):
+        return pa.float64()
+
+    if all(pa.types.is_decimal(type_) for type_ in types):
+        scale = max(type_.scale for type_ in types)
+        precision = max(type_.precision - type_.scale for type_ in types) + scale
+        if precision <= 38:
+            return pa.decimal128(precision, scale)
+        if precision <= 76:
+            return pa.decimal256(precision, scale)
+
+    if (
+        all(pa.types.is_timestamp(type_) for type_ in types)
+        and len({type_.tz for type_ in types}) == 1
+    ):
+        units = ["s", "ms", "us", "ns"]
+        return max(types, key=lambda type_: units.index(type_.unit))
+
+    return pa.string()
+
+
+def concat_tables(tables: list[pa.Table]) -> pa.Table:
+    """
+    Concatenate tables built from separate batches of the same result.
+
+    Columns that were null in a batch take the type of the other batches, and columns
+    whose values were inferred as different types in different batches (eg, integers
+    in one and floats in another) are converted to a type that holds all of them, like
+    they would be if all the values had been in the same batch.
+    """
+    types: dict[str, set[pa.DataType]] = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+
+    common_types = {
+        name: get_common_type(column_types)
+        for name, column_types in types.items()
+        if len(column_types) > 1
+    }
+    if common_types:
+        tables = [
+            pa.Table.from_arrays(
+                [
+                    # integers are converted to floats even if they lose precision,
+                    # as they would in a single batch
+                    column.cast(
+                        common_types[name],
+                        safe=not pa.types.is_floating(common_types[name]),
+                    )
+                    if name in common_types and not pa.types.is_null(column.type)
+                    else column
+                    for name, column in zip(table.column_names, table.columns)
+                ],
+                names=table.column_names,
+            )
+            for table in tables
+        ]
+
+    return pa.concat_tables(tables, promote=True)
+
+
 def convert_to_string(value: Any) -> str:
     """
     Used to ensure column names from the cursor description are strings.
@@ -100,18 +221,17 @@ def convert_to_string(value: Any) -> str:
 
 
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals
+    def __init__(  # pylint: disable=too-many-locals,too-many-branches
         self,
-        data: DbapiResult,
+        data: Union[DbapiResult, pa.Table],
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[Union[pa.Array, pa.ChunkedArray]] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
+        columns: dict[int, Sequence[Any]] = {}
         stringified_arr: NDArray[Any]
 
         if cursor_description:
@@ -126,28 +246,33 @@ class SupersetResultSet:
                 for column_name, description in zip(column_names, cursor_description)
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
+        if isinstance(data, pa.Table):
+            # the driver returned a columnar result natively, no conversion needed
+            if data.num_rows > 0:
+                if not column_names:
+                    column_names = dedup(data.column_names)
+                pa_data = list(data.columns)
+                columns = {
+                    i: column.to_pylist()
+                    for i, column in enumerate(pa_data)
+                    if pa.types.is_nested(column.type)
+                }
+        elif data:
+            # transpose the rows into columns one at a time, handing each one to
+            # pyarrow directly; the Python values are only kept around for the
+            # columns that need to be post-processed below
+            for i in range(len(data[0])):
+                values = list(map(itemgetter(i), data))
+                type_code = (
+                    deduped_cursor_desc[i][1]
+                    if i < len(deduped_cursor_desc) and len(deduped_cursor_desc[i]) > 1
+                    else None
+                )
+                pa_data.append(self.to_pa_array(values, type_code, db_engine_spec))
+                if pa.types.is_nested(pa_data[i].type) or pa.types.is_temporal(
+                    pa_data[i].type
                 ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
+                    columns[i] = values
 
         if pa_data:  # pylint: disable=too-many-nested-blocks
             for i, column in enumerate(column_names):
@@ -155,20 +280,21 @@ class SupersetResultSet:
                     # TODO: revisit nested column serialization once nested types
                     #  are added as a natively supported column type in Superset
                     #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
+                    stringified_arr = stringify_values(to_object_array(columns[i]))
                     pa_data[i] = pa.array(stringified_arr.tolist())
 
                 elif pa.types.is_temporal(pa_data[i].type):
                     # workaround for bug converting
                     # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
                     # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
+                    sample = self.first_nonempty(columns.get(i, []))
                     if sample and isinstance(sample, datetime.datetime):
                         try:
                             if sample.tzinfo:
                                 tz = sample.tzinfo
                                 series = pd.Series(
-                                    array[column], dtype="datetime64[ns]"
+                                    to_object_array(columns[i]),
+                                    dtype="datetime64[ns]",
                                 )
                                 series = pd.to_datetime(series).dt.tz_localize(tz)
                                 pa_data[i] = pa.Array.from_pandas(
@@ -192,6 +318,69 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from batches of rows, converting each batch to Arrow as it
+        arrives so that only one batch of rows is held in memory at a time.
+        """
+        tables = [
+            cls(batch, cursor_description, db_engine_spec).pa_table for batch in batches
+        ]
+        if not tables:
+            return cls([], cursor_description, db_engine_spec)
+        return cls(concat_tables(tables), cursor_description, db_engine_spec)
+
+    @staticmethod
+    def to_pa_array(
+        values: Sequence[Any],
+        type_code: Any,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> pa.Array:
+        """
+        Convert a column of values to a pyarrow array.
+
+        The engine spec may provide the expected Arrow type for the column based on
+        the type code in the cursor description, which spares pyarrow the type
+        inference. If the values don't fit the hinted (or inferred) type they are
+        serialized as strings.
+        """
+        try:
+            pa_type = db_engine_spec.get_arrow_datatype(type_code)
+        except Exception:  # pylint: disable=broad-except
+            pa_type = None
+
+        if pa_type is not None:
+            try:
+                return pa.array(values, type=pa_type)
+            except (
+                pa.lib.ArrowInvalid,
+                pa.lib.ArrowTypeError,
+                pa.lib.ArrowNotImplementedError,
+                ValueError,
+                TypeError,
+            ):
+                pass
+
+        try:
+            return pa.array(values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            stringified_arr = stringify_values(to_object_array(values))
+            return pa.array(stringified_arr.tolist())
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -19,10 +19,12 @@
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING, Union
 
-from flask import current_app, Flask, g, Request
+import flask
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
@@ -45,7 +47,7 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.mapper import Mapper
@@ -78,7 +80,7 @@ from superset.utils.urls import get_url_host
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.connectors.base.models import BaseDatasource
-    from superset.connectors.sqla.models import SqlaTable
+    from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
     from superset.models.sql_lab import Query
@@ -89,12 +91,26 @@ logger = logging.getLogger(__name__)
 
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
+RLS_FILTERS_GENERATION_KEY = "rls_filters_generation"
+PERMISSIONS_GENERATION_KEY = "permissions_generation"
+
 
 class DatabaseAndSchema(NamedTuple):
     database: str
     schema: str
 
 
+def _reset_cache_generations(session: Session) -> None:
+    """
+    Delete the generation tokens of the caches changed by a session once it commits.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    for key in session.info.pop("reset_cache_generations", ()):
+        cache_manager.cache.delete(key)
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -329,7 +345,12 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         user = g.user
         if user.is_anonymous:
             return self.is_item_public(permission_name, view_name)
-        return self._has_view_access(user, permission_name, view_name)
+        if get_user_id() is None or any(
+            role.name in self.builtin_roles for role in user.roles
+        ):
+            return self._has_view_access(user, permission_name, view_name)
+        # evaluated against the view menu names of the user, resolved once per request
+        return view_name in self.user_view_menu_names(permission_name)
 
     def can_access_all_queries(self) -> bool:
         """
@@ -570,6 +591,56 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        """
+        Return the names of the view menus the current user, or the public role for
+        anonymous users, has the permission on.
+
+        The names are resolved once per request for each user and permission, since
+        listing databases, schemas or datasets checks them for every item.
+
+        :param permission_name: The FAB permission name
+        :returns: The names of the FAB view-menus
+        """
+        user_id = None if g.user.is_anonymous else get_user_id()
+        if user_id is None and not g.user.is_anonymous:
+            # eg. guest users, which aren't stored in the metastore
+            return set()
+
+        key = (user_id, permission_name)
+        # flask.g rather than g, which is replaced to impersonate users
+        view_menu_names = flask.g.setdefault("user_view_menu_names", {})
+        if key not in view_menu_names:
+            view_menu_names[key] = self._get_cached_view_menu_names(
+                user_id, permission_name
+            )
+        return set(view_menu_names[key])
+
+    def _get_cached_view_menu_names(
+        self, user_id: Optional[int], permission_name: str
+    ) -> frozenset[str]:
+        """
+        Retrieves the names of the view menus the user, or the public role when the
+        user is ``None``, has the permission on from the cache when
+        ``PERMISSIONS_CACHE_TIMEOUT`` is set, or from the metastore.
+        """
+        timeout = current_app.config["PERMISSIONS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return self._query_view_menu_names(user_id, permission_name)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        generation = self._get_cache_generation(PERMISSIONS_GENERATION_KEY)
+        key = f"user_view_menu_names:{generation}:{user_id}:{permission_name}"
+        view_menu_names = cache_manager.cache.get(key)
+        if view_menu_names is None:
+            view_menu_names = self._query_view_menu_names(user_id, permission_name)
+            cache_manager.cache.set(key, view_menu_names, timeout=timeout)
+        return view_menu_names
+
+    def _query_view_menu_names(
+        self, user_id: Optional[int], permission_name: str
+    ) -> frozenset[str]:
         base_query = (
             self.get_session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -578,15 +649,15 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .join(self.role_model)
         )
 
-        if not g.user.is_anonymous:
+        if user_id is not None:
             # filter by user id
             view_menu_names = (
                 base_query.join(assoc_user_role)
                 .join(self.user_model)
-                .filter(self.user_model.id == get_user_id())
+                .filter(self.user_model.id == user_id)
                 .filter(self.permission_model.name == permission_name)
             ).all()
-            return {s.name for s in view_menu_names}
+            return frozenset(s.name for s in view_menu_names)
 
         # Properly treat anonymous user
         if public_role := self.get_public_role():
@@ -596,8 +667,56 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                     self.permission_model.name == permission_name
                 )
             ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+            return frozenset(s.name for s in view_menu_names)
+        return frozenset()
+
+    def permissions_after_change(
+        self,
+        mapper: Mapper,  # pylint: disable=unused-argument
+        connection: Connection,  # pylint: disable=unused-argument
+        target: Model,  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Invalidates the cached view menu names of the users when roles, users or
+        permissions change. Triggered by SQLAlchemy after_insert, after_update and
+        after_delete events, and when view menus are renamed or deleted.
+        """
+        if has_app_context():
+            flask.g.pop("user_view_menu_names", None)
+            if current_app.config["PERMISSIONS_CACHE_TIMEOUT"] is not None:
+                self._reset_cache_generation(PERMISSIONS_GENERATION_KEY)
+
+    @staticmethod
+    def _get_cache_generation(key: str) -> str:
+        """
+        Return the generation token stored in the cache under the key, creating it if
+        needed. Entries keyed by the token are never read again once it's deleted.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        if not (generation := cache.get(key)):
+            cache.add(key, uuid.uuid4().hex, timeout=0)
+            generation = cache.get(key)
+        return generation
+
+    def _reset_cache_generation(self, key: str) -> None:
+        """
+        Delete the generation token stored in the cache under the key when a change is
+        flushed, and again once the session commits it: until then concurrent requests
+        still read the previous data, which they may cache under a new token.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.delete(key)
+
+        session = self.get_session()
+        keys = session.info.setdefault("reset_cache_generations", set())
+        if not keys:
+            event.listen(session, "after_commit", _reset_cache_generations, once=True)
+        keys.add(key)
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -1158,6 +1277,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
 
         self.on_view_menu_after_update(mapper, connection, new_db_view_menu)
+        self.permissions_after_change(mapper, connection, new_db_view_menu)
         return new_db_view_menu
 
     def _update_vm_datasources_access(  # pylint: disable=too-many-locals
@@ -1229,6 +1349,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 .values(perm=new_dataset_vm_name)
             )
             self.on_view_menu_after_update(mapper, connection, new_dataset_view_menu)
+            self.permissions_after_change(mapper, connection, new_dataset_view_menu)
             updated_view_menus.append(new_dataset_view_menu)
         return updated_view_menus
 
@@ -1484,6 +1605,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         # VM changed, so call hook
         new_dataset_view_menu = self.find_view_menu(new_permission_name)
         self.on_view_menu_after_update(mapper, connection, new_dataset_view_menu)
+        self.permissions_after_change(mapper, connection, new_dataset_view_menu)
         # Update dataset (SqlaTable perm field)
         connection.execute(
             sqlatable_table.update()
@@ -1543,6 +1665,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             )
         )
         self.on_permission_view_after_delete(mapper, connection, pvm)
+        self.permissions_after_change(mapper, connection, pvm)
         connection.execute(
             view_menu_table.delete().where(view_menu_table.c.id == pvm.view_menu_id)
         )
@@ -1963,6 +2086,43 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        key = (tuple(user_roles), table.id)
+        # resolved once per request, as it's needed by every query of every chart
+        rls_filters = g.setdefault("rls_filters", {})
+        if key not in rls_filters:
+            rls_filters[key] = self._get_cached_rls_filters(user_roles, table.id)
+        return rls_filters[key]
+
+    def _get_cached_rls_filters(
+        self, user_roles: list[int], table_id: int
+    ) -> list[SqlaQuery]:
+        """
+        Retrieves the row level security filters for the roles and the table from the
+        cache when ``RLS_FILTERS_CACHE_TIMEOUT`` is set, or from the metastore.
+        """
+        timeout = current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return self._query_rls_filters(user_roles, table_id)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        # entries are keyed by a generation token that is reset whenever the filters
+        # change, so stale entries are never read again
+        generation = self._get_cache_generation(RLS_FILTERS_GENERATION_KEY)
+
+        key = f"rls_filters:{generation}:{table_id}:{user_roles}"
+        rls_filters = cache.get(key)
+        if rls_filters is None:
+            rls_filters = self._query_rls_filters(user_roles, table_id)
+            cache.set(key, rls_filters, timeout=timeout)
+        return rls_filters
+
+    def _query_rls_filters(
+        self, user_roles: list[int], table_id: int
+    ) -> list[SqlaQuery]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -1970,7 +2130,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -1992,7 +2151,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         filter_tables = (
             self.get_session()
             .query(RLSFilterTables.c.rls_filter_id)
-            .filter(RLSFilterTables.c.table_id == table.id)
+            .filter(RLSFilterTables.c.table_id == table_id)
         )
         query = (
             self.get_session()
@@ -2019,6 +2178,22 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    def rls_filters_after_change(
+        self,
+        mapper: Mapper,  # pylint: disable=unused-argument
+        connection: Connection,  # pylint: disable=unused-argument
+        target: "RowLevelSecurityFilter",  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Invalidates the cached row level security filters when a filter, or its
+        roles or tables, change. Triggered by SQLAlchemy after_insert, after_update
+        and after_delete events.
+        """
+        if has_app_context():
+            g.pop("rls_filters", None)
+            if current_app.config["RLS_FILTERS_CACHE_TIMEOUT"] is not None:
+                self._reset_cache_generation(RLS_FILTERS_GENERATION_KEY)
+
     def get_rls_ids(self, table: "BaseDatasource") -> list[int]:
         """
         Retrieves the appropriate row level security filters IDs for the current user
@@ -50,7 +50,11 @@ from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql_parse import CtasMethod, insert_rls, ParsedQuery
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import (
+    get_results_data_key,
+    write_ipc_buffer,
+    write_results_table,
+)
 from superset.utils.celery import session_scope
 from superset.utils.core import (
     json_iso_dttm_ser,
@@ -67,7 +71,10 @@ SQLLAB_TIMEOUT = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
+SQLLAB_FETCH_BATCH_SIZE = config["SQLLAB_FETCH_BATCH_SIZE"]
 SQL_QUERY_MUTATOR = config["SQL_QUERY_MUTATOR"]
+RESULTS_BACKEND_DATA_FORMAT = config["RESULTS_BACKEND_DATA_FORMAT"]
+RESULTS_BACKEND_DATA_COMPRESSION = config["RESULTS_BACKEND_DATA_COMPRESSION"]
 log_query = config["QUERY_LOGGER"]
 logger = logging.getLogger(__name__)
 
@@ -281,7 +288,17 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
                 query.id,
                 str(query.to_dict()),
             )
-            data = db_engine_spec.fetch_data(cursor, increased_limit)
+            data = db_engine_spec.fetch_data_arrow(cursor, increased_limit)
+            if data is None and SQLLAB_FETCH_BATCH_SIZE:
+                data = SupersetResultSet.from_batches(
+                    db_engine_spec.fetch_data_in_batches(
+                        cursor, SQLLAB_FETCH_BATCH_SIZE, increased_limit
+                    ),
+                    cursor.description,
+                    db_engine_spec,
+                ).pa_table
+            if data is None:
+                data = db_engine_spec.fetch_data(cursor, increased_limit)
             if query.limit is None or len(data) <= query.limit:
                 query.limiting_factor = LimitingFactor.NOT_LIMITED
             else:
@@ -346,6 +363,7 @@ def _serialize_and_expand_data(
     db_engine_spec: BaseEngineSpec,
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
+    data_format: Optional[str] = None,
 ) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
     selected_columns = result_set.columns
     all_columns: list[Any]
@@ -355,7 +373,12 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = write_ipc_buffer(result_set.pa_table).to_pybytes()
+            if data_format:
+                data = write_results_table(
+                    result_set.pa_table, data_format, RESULTS_BACKEND_DATA_COMPRESSION
+                )
+            else:
+                data = write_ipc_buffer(result_set.pa_table).to_pybytes()
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
@@ -532,11 +555,11 @@ def execute_sql_statements(
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
+    data_format = RESULTS_BACKEND_DATA_FORMAT if use_arrow_data else None
     data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+        result_set, db_engine_spec, use_arrow_data, expand_data, data_format
     )
 
-    # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
         {
             "status": QueryStatus.SUCCESS,
@@ -556,16 +579,24 @@ def execute_sql_statements(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
         )
         with stats_timing("sqllab.query.results_backend_write", stats_logger):
+            cache_timeout = database.cache_timeout
+            if cache_timeout is None:
+                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+            stored_payload = payload
+            if data_format:
+                # the data is already serialized and compressed, store it next to
+                # the metadata so it can be read without the rest of the payload
+                results_backend.set(get_results_data_key(key), data, cache_timeout)
+                logger.debug("*** data size: %i", getsizeof(data))
+                stored_payload = {**payload, "data": None, "data_format": data_format}
+
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
                 serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
+                    stored_payload, cast(bool, results_backend_use_msgpack)
                 )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
-
             compressed = zlib_compress(serialized_payload)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from typing import cast, TypedDict
 
 import pandas as pd
 from flask_babel import gettext as __
@@ -40,7 +41,7 @@ logger = logging.getLogger(__name__)
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: str | Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -125,7 +126,16 @@ class SqlResultExportCommand(BaseCommand):
                 limit -= 1
             df = self._query.database.get_df(sql, self._query.schema)[:limit]
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+        csv_data: str | Iterator[str]
+        if config["CSV_STREAMING_EXPORT"]:
+            csv_data = csv.df_to_escaped_csv_chunks(
+                df,
+                chunk_size=config["CSV_STREAMING_CHUNK_SIZE"],
+                index=False,
+                **config["CSV_EXPORT"],
+            )
+        else:
+            csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
 
         return {
             "query": self._query,
@@ -108,7 +108,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         )
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                rows=self._rows,
+                encode_data=True,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -14,9 +14,10 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any
+from typing import Any, Optional
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 
 from superset.common.db_query_status import QueryStatus
 
@@ -44,7 +45,9 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
         )
 
     if is_require_to_apply():
-        sql_results["data"] = sql_results["data"][:max_rows_in_result]
+        # encoded data has already been limited when it was deserialized
+        if isinstance(sql_results["data"], list):
+            sql_results["data"] = sql_results["data"][:max_rows_in_result]
         sql_results["displayLimitReached"] = True
     return sql_results
 
@@ -56,3 +59,80 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
         writer.write_table(table)
 
     return sink.getvalue()
+
+
+# rows per IPC record batch / Parquet row group, the unit in which stored results are
+# read back when only a window of rows is needed
+RESULTS_BATCH_SIZE = 65536
+
+
+def get_results_data_key(key: str) -> str:
+    """
+    Return the results backend key where the data of a query is stored when it's
+    kept separately from the rest of the payload.
+    """
+    return f"{key}__data"
+
+
+def write_results_table(
+    table: pa.Table, data_format: str, compression: Optional[str] = None
+) -> bytes:
+    """
+    Serialize a table for the results backend, either as an Arrow IPC file or as
+    Parquet, compressed with the given codec (eg, ``zstd`` or ``lz4``).
+    """
+    sink = pa.BufferOutputStream()
+
+    if data_format == "parquet":
+        pq.write_table(
+            table,
+            sink,
+            row_group_size=RESULTS_BATCH_SIZE,
+            compression=compression or "none",
+        )
+    elif data_format == "arrow":
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=RESULTS_BATCH_SIZE)
+    else:
+        raise ValueError(f"Unsupported results format: {data_format}")
+
+    return sink.getvalue().to_pybytes()
+
+
+def read_results_table(
+    blob: bytes,
+    data_format: str,
+    rows: Optional[int] = None,
+) -> pa.Table:
+    """
+    Deserialize a table written by ``write_results_table``.
+
+    Only the batches/row groups covering the first ``rows`` rows are decompressed.
+    """
+    source = pa.BufferReader(blob)
+
+    if data_format == "parquet":
+        parquet_file = pq.ParquetFile(source)
+        if rows is None:
+            return parquet_file.read()
+        batches = parquet_file.iter_batches(batch_size=RESULTS_BATCH_SIZE)
+        schema = parquet_file.schema_arrow
+    elif data_format == "arrow":
+        reader = pa.ipc.open_file(source)
+        if rows is None:
+            return reader.read_all()
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        schema = reader.schema
+    else:
+        raise ValueError(f"Unsupported results format: {data_format}")
+
+    window = []
+    remaining = rows
+    for batch in batches:
+        if remaining <= 0:
+            break
+        window.append(batch.slice(0, remaining))
+        remaining -= window[-1].num_rows
+
+    return pa.Table.from_batches(window, schema=schema)
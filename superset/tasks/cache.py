@@ -16,26 +16,37 @@
 # under the License.
 import json
 import logging
-from typing import Any, Optional, Union
+from datetime import datetime, timedelta
+from typing import Any, cast, Optional, Union
 from urllib import request
 from urllib.error import URLError
 
 from celery.beat import SchedulingError
 from celery.utils.log import get_task_logger
+from flask_appbuilder.security.sqla.models import User
 from sqlalchemy import and_, func
 
 from superset import app, db, security_manager
+from superset.charts.commands.warm_up_cache import ChartWarmUpCacheCommand
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
 from superset.extensions import celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
+from superset.utils.core import error_msg_from_exception, override_user, parallel_map
 from superset.utils.date_parser import parse_human_datetime
+from superset.utils.dates import now_as_float
 from superset.utils.machine_auth import MachineAuthProvider
+from superset.viz import viz_types
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
 
+# How far back chart views are counted when prioritizing the in-process warm up
+CHART_VIEWS_LOOKBACK = timedelta(days=7)
+
 
 def get_payload(chart: Slice, dashboard: Optional[Dashboard] = None) -> dict[str, int]:
     """Return payload for warming up a given chart/table cache."""
@@ -249,6 +260,147 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def get_chart_views(chart_ids: list[int], since: datetime) -> dict[int, int]:
+    """Return how many times each chart was viewed since a given time."""
+    records = (
+        db.session.query(Log.slice_id, func.count(Log.slice_id))
+        .filter(and_(Log.slice_id.in_(chart_ids), Log.dttm >= since))
+        .group_by(Log.slice_id)
+        .all()
+    )
+    return dict(records)
+
+
+def get_cache_keys(chart: Slice) -> Optional[list[str]]:
+    """
+    Return the data cache keys of the queries of a chart, or `None` when they can't
+    be worked out, eg for legacy charts.
+    """
+    if chart.viz_type in viz_types:
+        return None
+
+    try:
+        query_context = chart.get_query_context()
+        if not query_context:
+            return None
+        cache_keys = [
+            query_context.query_cache_key(query_obj)
+            for query_obj in query_context.queries
+        ]
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to compute the cache keys of chart %s", chart.id)
+        return None
+
+    return None if None in cache_keys else cast(list[str], cache_keys)
+
+
+def warm_up_in_process(
+    payloads: list[dict[str, int]], user: Optional[User]
+) -> dict[str, list[str]]:
+    """
+    Warm up the cache of charts in the current process.
+
+    Charts that share their cache keys, eg when they are part of several dashboards,
+    are warmed up once, and charts whose cache is still fresh are skipped. The most
+    viewed charts are warmed up first, with a bounded number of concurrent queries
+    against each database.
+    """
+    start = now_as_float()
+    results: dict[str, list[str]] = {"warmed": [], "skipped": [], "errors": []}
+
+    charts = {
+        chart.id: chart
+        for chart in db.session.query(Slice).filter(
+            Slice.id.in_({payload["chart_id"] for payload in payloads})
+        )
+    }
+    views = get_chart_views(list(charts), datetime.now() - CHART_VIEWS_LOOKBACK)
+
+    with override_user(user):
+        if user:
+            # loaded here, as the user belongs to the session of the current thread
+            security_manager.get_user_roles(user)
+
+        seen: set[tuple[Any, ...]] = set()
+        work: list[tuple[dict[str, int], Optional[int]]] = []
+        for payload in payloads:
+            if not (chart := charts.get(payload["chart_id"])):
+                results["errors"].append(json.dumps(payload))
+                continue
+
+            cache_keys = get_cache_keys(chart)
+            if cache_keys is None:
+                key: tuple[Any, ...] = (chart.id, payload.get("dashboard_id"))
+            else:
+                # the dashboard only affects the extra filters of legacy charts
+                key = tuple(cache_keys)
+                payload = get_payload(chart)
+
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if cache_keys and all(
+                QueryCacheManager.has(cache_key, CacheRegion.DATA)
+                for cache_key in cache_keys
+            ):
+                results["skipped"].append(json.dumps(payload))
+                continue
+
+            database = getattr(chart.datasource, "database", None)
+            work.append((payload, database.id if database else None))
+
+        work.sort(key=lambda item: views.get(item[0]["chart_id"], 0), reverse=True)
+
+        # split the charts of each database into as many lanes as the queries it
+        # may run concurrently, each lane being warmed up sequentially by a single
+        # worker, so that a slow database doesn't hold workers other databases
+        # could use
+        lanes: dict[tuple[Optional[int], int], list[dict[str, int]]] = {}
+        counts: dict[Optional[int], int] = {}
+        for payload, database_id in work:
+            count = counts.get(database_id, 0)
+            counts[database_id] = count + 1
+            lane = count % app.config["CACHE_WARMUP_MAX_WORKERS_PER_DATABASE"]
+            lanes.setdefault((database_id, lane), []).append(payload)
+
+        def warm_up(lane: list[dict[str, int]]) -> list[dict[str, Any]]:
+            lane_results = []
+            for payload in lane:
+                try:
+                    result = ChartWarmUpCacheCommand(
+                        payload["chart_id"], payload.get("dashboard_id"), None
+                    ).run()
+                except Exception as ex:  # pylint: disable=broad-except
+                    result = {"viz_error": error_msg_from_exception(ex)}
+                lane_results.append(result)
+            return lane_results
+
+        for lane, lane_results in zip(
+            lanes.values(),
+            parallel_map(
+                warm_up, lanes.values(), app.config["CACHE_WARMUP_MAX_WORKERS"]
+            ),
+        ):
+            for payload, result in zip(lane, lane_results):
+                if result["viz_error"]:
+                    logger.error(
+                        "Error warming up cache for %s: %s",
+                        payload,
+                        result["viz_error"],
+                    )
+                    results["errors"].append(json.dumps(payload))
+                else:
+                    results["warmed"].append(json.dumps(payload))
+
+    stats_logger = app.config["STATS_LOGGER"]
+    stats_logger.gauge("cache_warmup.hits", len(results["skipped"]))
+    stats_logger.gauge("cache_warmup.misses", len(results["warmed"]))
+    stats_logger.gauge("cache_warmup.errors", len(results["errors"]))
+    stats_logger.timing("cache_warmup.duration", now_as_float() - start)
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -279,6 +431,9 @@ def cache_warmup(
         return message
 
     user = security_manager.get_user_by_username(app.config["THUMBNAIL_SELENIUM_USER"])
+    if app.config["CACHE_WARMUP_IN_PROCESS"]:
+        return warm_up_in_process(strategy.get_payloads(), user)
+
     cookies = MachineAuthProvider.get_auth_cookies(user)
     headers = {
         "Cookie": f"session={cookies.get('session', '')}",
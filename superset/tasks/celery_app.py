@@ -21,7 +21,7 @@ it needs to call create_app() in order to initialize things properly
 """
 from typing import Any
 
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Superset framework imports
 from superset import create_app
@@ -32,7 +32,7 @@ flask_app = create_app()
 
 # Need to import late, as the celery_app will have been setup by "create_app()"
 # pylint: disable=wrong-import-position, unused-import
-from . import cache, scheduler  # isort:skip
+from . import cache, key_value, scheduler  # isort:skip
 
 # Export the celery app globally for Celery (as run on the cmd line) to find
 app = celery_app
@@ -43,3 +43,12 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
     with flask_app.app_context():
         # https://docs.sqlalchemy.org/en/14/core/connections.html#engine-disposal
         db.engine.dispose()
+
+
+@worker_process_shutdown.connect
+def dispose_webdrivers(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.webdriver import webdriver_pool
+
+    with flask_app.app_context():
+        webdriver_pool.dispose()
@@ -0,0 +1,42 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+from superset.commands.exceptions import CommandException
+from superset.extensions import celery_app
+from superset.key_value.commands.delete_expired import DeleteExpiredKeyValueCommand
+from superset.key_value.types import KeyValueResource
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="key_value.prune_expired")
+def prune_expired(max_rows: int = 100_000) -> None:
+    """
+    Delete up to ``max_rows`` expired entries of the metastore cache, in batches
+    """
+    try:
+        deleted = DeleteExpiredKeyValueCommand(
+            resource=KeyValueResource.METASTORE_CACHE, max_rows=max_rows
+        ).run()
+        logger.info("Deleted %i expired metastore cache entries", deleted)
+    except SoftTimeLimitExceeded as ex:
+        logger.warning("A timeout occurred while pruning the metastore cache: %s", ex)
+    except CommandException:
+        logger.exception("An exception occurred while pruning the metastore cache")
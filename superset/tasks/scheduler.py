@@ -15,17 +15,26 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Union
+from uuid import uuid4
 
 from celery import Celery
 from celery.exceptions import SoftTimeLimitExceeded
+from flask import g
 
 from superset import app, is_feature_enabled
 from superset.commands.exceptions import CommandException
 from superset.daos.report import ReportScheduleDAO
 from superset.extensions import celery_app
 from superset.reports.commands.exceptions import ReportScheduleUnexpectedError
-from superset.reports.commands.execute import AsyncExecuteReportScheduleCommand
+from superset.reports.commands.execute import (
+    AsyncExecuteReportScheduleCommand,
+    get_report_artifact_key,
+)
 from superset.reports.commands.log_prune import AsyncPruneReportScheduleLogCommand
+from superset.reports.models import ReportSchedule
 from superset.tasks.cron_util import cron_schedule_window
 from superset.utils.celery import session_scope
 from superset.utils.core import LoggerLevel
@@ -34,6 +43,68 @@ from superset.utils.log import get_logger_from_status
 logger = logging.getLogger(__name__)
 
 
+class DatabaseDispatchLimiter:
+    """
+    Delays the tasks that are due at the same time and query the same database, so
+    they start at least ``interval`` seconds apart.
+    """
+
+    def __init__(self, interval: int) -> None:
+        self.interval = interval
+        self._next_eta: dict[tuple[datetime, int], datetime] = {}
+
+    def get_eta(self, eta: datetime, database_ids: set[int]) -> datetime:
+        if not self.interval:
+            return eta
+
+        delayed_eta = max(
+            [eta, *(self._next_eta.get((eta, id_), eta) for id_ in database_ids)]
+        )
+        for id_ in database_ids:
+            self._next_eta[(eta, id_)] = delayed_eta + timedelta(seconds=self.interval)
+        return delayed_eta
+
+
+def get_database_ids(report_schedule: ReportSchedule) -> set[int]:
+    """
+    Return the databases queried by a report schedule: the one of the alert
+    condition, and the ones of the chart or dashboard.
+    """
+    database_ids = set()
+    if report_schedule.database_id:
+        database_ids.add(report_schedule.database_id)
+    if report_schedule.chart and report_schedule.chart.datasource:
+        database_ids.add(report_schedule.chart.datasource.database_id)
+    if report_schedule.dashboard:
+        database_ids.update(
+            datasource.database_id
+            for datasource in report_schedule.dashboard.datasources
+        )
+    return database_ids
+
+
+def get_async_options(
+    report_schedules: list[ReportSchedule], eta: datetime
+) -> dict[str, Any]:
+    async_options: dict[str, Any] = {"eta": eta}
+    # reports in a group are executed one after another, so the task must be
+    # allowed to run for the sum of their working timeouts
+    working_timeouts = [
+        report_schedule.working_timeout
+        for report_schedule in report_schedules
+        if report_schedule.working_timeout is not None
+    ]
+    if working_timeouts and app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"]:
+        async_options["time_limit"] = (
+            sum(working_timeouts) + app.config["ALERT_REPORTS_WORKING_TIME_OUT_LAG"]
+        )
+        async_options["soft_time_limit"] = (
+            sum(working_timeouts)
+            + app.config["ALERT_REPORTS_WORKING_SOFT_TIME_OUT_LAG"]
+        )
+    return async_options
+
+
 @celery_app.task(name="reports.scheduler")
 def scheduler() -> None:
     """
@@ -43,6 +114,9 @@ def scheduler() -> None:
         return
     with session_scope(nullpool=True) as session:
         active_schedules = ReportScheduleDAO.find_active(session)
+        due_schedules: dict[
+            tuple[datetime, Union[int, tuple[Any, ...]]], list[ReportSchedule]
+        ] = defaultdict(list)
         for active_schedule in active_schedules:
             for schedule in cron_schedule_window(
                 active_schedule.crontab, active_schedule.timezone
@@ -50,28 +124,43 @@ def scheduler() -> None:
                 logger.info(
                     "Scheduling alert %s eta: %s", active_schedule.name, schedule
                 )
-                async_options = {"eta": schedule}
-                if (
-                    active_schedule.working_timeout is not None
-                    and app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"]
-                ):
-                    async_options["time_limit"] = (
-                        active_schedule.working_timeout
-                        + app.config["ALERT_REPORTS_WORKING_TIME_OUT_LAG"]
-                    )
-                    async_options["soft_time_limit"] = (
-                        active_schedule.working_timeout
-                        + app.config["ALERT_REPORTS_WORKING_SOFT_TIME_OUT_LAG"]
-                    )
-                execute.apply_async((active_schedule.id,), **async_options)
+                artifact_key = (
+                    get_report_artifact_key(active_schedule)
+                    if app.config["ALERT_REPORTS_BATCH_EXECUTION"]
+                    else None
+                )
+                due_schedules[(schedule, artifact_key or active_schedule.id)].append(
+                    active_schedule
+                )
 
+        limiter = DatabaseDispatchLimiter(
+            app.config["ALERT_REPORTS_DATABASE_DISPATCH_INTERVAL"]
+        )
+        for (schedule, _), report_schedules in due_schedules.items():
+            eta = (
+                limiter.get_eta(schedule, get_database_ids(report_schedules[0]))
+                if limiter.interval
+                else schedule
+            )
+            async_options = get_async_options(report_schedules, eta)
+            if len(report_schedules) == 1:
+                execute.apply_async((report_schedules[0].id,), **async_options)
+            else:
+                logger.info(
+                    "Scheduling %i reports sharing their content, eta: %s",
+                    len(report_schedules),
+                    eta,
+                )
+                execute_group.apply_async(
+                    ([report_schedule.id for report_schedule in report_schedules],),
+                    **async_options,
+                )
 
-@celery_app.task(name="reports.execute", bind=True)
-def execute(self: Celery.task, report_schedule_id: int) -> None:
-    task_id = None
+
+def execute_report_schedule(
+    task: Celery.task, task_id: str, report_schedule_id: int, scheduled_dttm: Any
+) -> None:
     try:
-        task_id = execute.request.id
-        scheduled_dttm = execute.request.eta
         logger.info(
             "Executing alert/report, task id: %s, scheduled_dttm: %s",
             task_id,
@@ -86,7 +175,7 @@ def execute(self: Celery.task, report_schedule_id: int) -> None:
         logger.exception(
             "An unexpected occurred while executing the report: %s", task_id
         )
-        self.update_state(state="FAILURE")
+        task.update_state(state="FAILURE")
     except CommandException as ex:
         logger_func, level = get_logger_from_status(ex.status)
         logger_func(
@@ -95,7 +184,28 @@ def execute(self: Celery.task, report_schedule_id: int) -> None:
             exc_info=True,
         )
         if level == LoggerLevel.EXCEPTION:
-            self.update_state(state="FAILURE")
+            task.update_state(state="FAILURE")
+
+
+@celery_app.task(name="reports.execute", bind=True)
+def execute(self: Celery.task, report_schedule_id: int) -> None:
+    execute_report_schedule(
+        self, execute.request.id, report_schedule_id, execute.request.eta
+    )
+
+
+@celery_app.task(name="reports.execute_group", bind=True)
+def execute_group(self: Celery.task, report_schedule_ids: list[int]) -> None:
+    """
+    Execute reports that render the same content: it's rendered by the first report
+    and reused by the others.
+    """
+    g.report_artifacts = {}
+    for report_schedule_id in report_schedule_ids:
+        # each execution has its own logs
+        execute_report_schedule(
+            self, str(uuid4()), report_schedule_id, execute_group.request.eta
+        )
 
 
 @celery_app.task(name="reports.prune_log")
@@ -77,6 +77,7 @@ class AsyncQueryManager:
         self._stream_prefix: str = ""
         self._stream_limit: Optional[int]
         self._stream_limit_firehose: Optional[int]
+        self._long_polling_timeout: int = 0
         self._jwt_cookie_name: str = ""
         self._jwt_cookie_secure: bool = False
         self._jwt_cookie_domain: Optional[str]
@@ -109,6 +110,7 @@ class AsyncQueryManager:
         self._stream_limit_firehose = config[
             "GLOBAL_ASYNC_QUERIES_REDIS_STREAM_LIMIT_FIREHOSE"
         ]
+        self._long_polling_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"]
         self._jwt_cookie_name = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_NAME"]
         self._jwt_cookie_secure = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SECURE"]
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
@@ -167,11 +169,23 @@ class AsyncQueryManager:
         )
 
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self, channel: str, last_id: Optional[str], timeout: int = 0
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel after ``last_id``. When there are none and a
+        timeout is given, wait for up to ``timeout`` milliseconds, capped by
+        ``GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT``, for new events.
+        """
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._redis.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if not results and (timeout := min(timeout, self._long_polling_timeout)) > 0:
+            streams = self._redis.xread(
+                {stream_name: last_id or "0-0"},
+                count=self.MAX_EVENT_COUNT,
+                block=timeout,
+            )
+            results = streams[0][1] if streams else []
         return [] if not results else list(map(parse_event, results))
 
     def update_job(
@@ -192,5 +206,8 @@ class AsyncQueryManager:
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
         logger.debug(event_data)
 
-        self._redis.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._redis.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        # both streams are written in a single round trip
+        pipeline = self._redis.pipeline(transaction=False)
+        pipeline.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
+        pipeline.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        pipeline.execute()
@@ -37,6 +37,7 @@ import traceback
 import uuid
 import zlib
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
@@ -60,7 +61,16 @@ import pandas as pd
 import sqlalchemy as sa
 from cryptography.hazmat.backends import default_backend
 from cryptography.x509 import Certificate, load_pem_x509_certificate
-from flask import current_app, flash, g, Markup, request
+from flask import (
+    copy_current_request_context,
+    current_app,
+    flash,
+    g,
+    has_app_context,
+    has_request_context,
+    Markup,
+    request,
+)
 from flask_appbuilder import SQLA
 from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __
@@ -118,6 +128,7 @@ TIME_COMPARISON = "__"
 JS_MAX_INTEGER = 9007199254740991  # Largest int Java Script can handle 2^53-1
 
 InputType = TypeVar("InputType")  # pylint: disable=invalid-name
+OutputType = TypeVar("OutputType")  # pylint: disable=invalid-name
 
 ADHOC_FILTERS_REGEX = re.compile("^adhoc_filters")
 
@@ -1473,6 +1484,62 @@ def override_user(user: User | None, force: bool = True) -> Iterator[Any]:
         delattr(g, "user")
 
 
+def parallel_map(
+    func: Callable[[InputType], OutputType],
+    items: Iterable[InputType],
+    max_workers: int,
+) -> list[OutputType]:
+    """
+    Apply a function to each item using a bounded pool of threads, returning the
+    results in order.
+
+    Each call runs in a new application context of the current app with a copy of
+    `flask.g` (including the current user), and in a copy of the current request
+    context if there is one, so it sees the same security context as the caller.
+    Calls made from a worker thread, or with a single worker, run sequentially.
+
+    :param func: The function to apply
+    :param items: The items to apply the function to
+    :param max_workers: The maximum number of threads
+    :returns: The results of the function for each item
+    """
+    items = list(items)
+    if (
+        max_workers <= 1
+        or len(items) <= 1
+        or not has_app_context()
+        or g.get("parallel_worker")
+    ):
+        return [func(item) for item in items]
+
+    # pylint: disable=protected-access
+    app = current_app._get_current_object()  # type: ignore
+    g_vars = {name: g.get(name) for name in g}
+
+    def run(item: InputType) -> OutputType:
+        with app.app_context():
+            for name, value in g_vars.items():
+                setattr(g, name, value)
+            g.parallel_worker = True
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # the request context has to be copied for each call, as a context can only
+        # be pushed by a single thread at a time
+        futures: list[Future[OutputType]] = [
+            executor.submit(
+                cast(
+                    Callable[[InputType], OutputType], copy_current_request_context(run)
+                )
+                if has_request_context()
+                else run,
+                item,
+            )
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
 def parse_ssl_cert(certificate: str) -> Certificate:
     """
     Parses the contents of a certificate and returns a valid certificate object
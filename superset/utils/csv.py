@@ -17,6 +17,7 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -64,21 +65,67 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escapes the headers and the string values of a DataFrame, see ``escape_value``.
+
+    The values are escaped column by column with vectorized string operations, the
+    DataFrame passed in is not modified.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
     # Escape csv headers
-    df = df.rename(columns=escape_values)
+    df = df.rename(columns=escape_values, copy=False)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    for idx, (_, column) in enumerate(df.items()):
+        if column.dtype != np.dtype(object):
+            continue
+
+        # only strings are escaped, the column can also hold eg. bytes or numbers
+        is_string = column.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        if not is_string.any():
+            continue
+
+        strings = column[is_string].str
+        needs_escaping = np.zeros(len(column), dtype=bool)
+        needs_escaping[is_string] = (
+            strings.match(problematic_chars_re) & ~strings.match(negative_number_re)
+        ).to_numpy(dtype=bool)
+        if needs_escaping.any():
+            values = column.to_numpy(copy=True)
+            # Escape pipe to be extra safe, and precede the value with a single
+            # quote, as in ``escape_value``
+            values[needs_escaping] = (
+                "'" + column[needs_escaping].str.replace("|", "\\|", regex=False)
+            ).to_numpy()
+            df.isetitem(idx, values)
 
-    return df.to_csv(**kwargs)
+    return df
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return escape_df(df).to_csv(**kwargs)
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int = 10_000,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Like ``df_to_escaped_csv``, but yields the CSV in chunks of ``chunk_size`` rows,
+    so large exports can be streamed without building the whole CSV in memory.
+    """
+    df = escape_df(df)
+    header = kwargs.pop("header", True)
+    kwargs.pop("path_or_buf", None)
+    for start in range(0, max(len(df.index), 1), chunk_size):
+        yield df.iloc[start : start + chunk_size].to_csv(
+            header=header if start == 0 else False, **kwargs
+        )
 
 
 def get_chart_csv_data(
@@ -101,16 +148,23 @@ def get_chart_csv_data(
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = simplejson.loads(content.decode("utf-8"))
+    return chart_data_to_dataframe(result["result"][0])
+
+
+def chart_data_to_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build a dataframe from the JSON result of a chart data query.
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +172,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in query["indexnames"]
     )
     return df
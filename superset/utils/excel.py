@@ -14,10 +14,38 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import datetime
 import io
-from typing import Any
+import numbers
+import tempfile
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any, IO, Optional
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
+from flask_babel import gettext as _
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_timedelta64_dtype,
+)
+
+from superset.exceptions import ExportTooLargeError
+
+# the maximum number of rows of a worksheet
+EXCEL_MAX_ROWS = 1_048_576
+
+# the types of values xlsxwriter writes as they are, others are written as strings
+CELL_TYPES = (
+    str,
+    np.bool_,
+    numbers.Real,
+    Decimal,
+    datetime.date,
+    datetime.timedelta,
+)
 
 
 def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
@@ -27,3 +55,134 @@ def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
         df.to_excel(writer, **kwargs)
 
     return output.getvalue()
+
+
+def df_to_excel_file(  # pylint: disable=too-many-arguments
+    df: pd.DataFrame,
+    sheet_name: str = "Sheet1",
+    index: bool = True,
+    header: bool = True,
+    batch_size: int = 10_000,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> IO[bytes]:
+    """
+    Write a DataFrame to an XLSX temporary file, using the constant memory mode of
+    xlsxwriter.
+
+    Unlike ``df_to_excel``, which builds the whole workbook in memory, rows are
+    flushed to disk as they are written, in batches of ``batch_size`` rows. The
+    output matches the one of ``df_to_excel``, except that the cells of a
+    ``MultiIndex`` aren't merged.
+
+    :param max_rows: the maximum number of rows of the DataFrame
+    :param max_bytes: the maximum size of the XLSX file
+    :raises ExportTooLargeError: if the DataFrame has more rows than ``max_rows``
+        or than a worksheet can hold, or if the file is larger than ``max_bytes``
+    """
+    max_rows = min(max_rows or EXCEL_MAX_ROWS, EXCEL_MAX_ROWS - int(header))
+    if len(df.index) > max_rows:
+        raise ExportTooLargeError(
+            _(
+                "The XLSX export has %(rows)s rows, more than the limit of "
+                "%(max_rows)s rows",
+                rows=len(df.index),
+                max_rows=max_rows,
+            )
+        )
+
+    output = tempfile.TemporaryFile()
+    try:
+        _write_workbook(output, df, sheet_name, index, header, batch_size)
+    except BaseException:
+        output.close()
+        raise
+
+    size = output.seek(0, io.SEEK_END)
+    if max_bytes is not None and size > max_bytes:
+        output.close()
+        raise ExportTooLargeError(
+            _(
+                "The XLSX export is %(size)s bytes, more than the limit of "
+                "%(max_bytes)s bytes",
+                size=size,
+                max_bytes=max_bytes,
+            )
+        )
+    output.seek(0)
+    return output
+
+
+def _write_workbook(  # pylint: disable=too-many-arguments
+    output: IO[bytes],
+    df: pd.DataFrame,
+    sheet_name: str,
+    index: bool,
+    header: bool,
+    batch_size: int,
+) -> None:
+    workbook = xlsxwriter.Workbook(
+        output,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            "nan_inf_to_errors": True,
+            "remove_timezone": True,
+        },
+    )
+    worksheet = workbook.add_worksheet(sheet_name)
+    # the format pandas uses for headers and index values
+    bold = workbook.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
+    )
+
+    row = 0
+    index_levels = df.index.nlevels if index else 0
+    if header:
+        if index:
+            for col, name in enumerate(df.index.names):
+                if name is not None:
+                    worksheet.write(row, col, _to_cell(name), bold)
+        worksheet.write_row(row, index_levels, list(map(_to_cell, df.columns)), bold)
+        row += 1
+
+    # constant memory mode requires writing the rows in order
+    for start in range(0, len(df.index), batch_size):
+        batch = df.iloc[start : start + batch_size]
+        if index:
+            batch = batch.reset_index(allow_duplicates=True)
+        other_types = [
+            idx
+            for idx, dtype in enumerate(batch.dtypes)
+            if not is_numeric_dtype(dtype)
+            and not is_datetime64_any_dtype(dtype)
+            and not is_timedelta64_dtype(dtype)
+        ]
+        batch = batch.astype(object).where(batch.notna(), None)
+        for idx in other_types:
+            batch.isetitem(idx, batch.iloc[:, idx].map(_to_cell))
+        for values in batch.itertuples(index=False, name=None):
+            worksheet.write_row(row, 0, values[:index_levels], bold)
+            worksheet.write_row(row, index_levels, values[index_levels:])
+            row += 1
+
+    workbook.close()
+
+
+def _to_cell(value: Any) -> Any:
+    """
+    Convert a value xlsxwriter can't write, eg. a list or a UUID, to a string, like
+    ``DataFrame.to_excel`` does.
+    """
+    if value is None or isinstance(value, CELL_TYPES):
+        return value
+    return str(value)
+
+
+def iter_file(file: IO[bytes], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yield the content of a file in chunks, closing it when done.
+    """
+    with file:
+        while chunk := file.read(chunk_size):
+            yield chunk
@@ -16,11 +16,16 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import json
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -35,6 +40,8 @@ from superset.extensions import stats_logger_manager
 from superset.utils.core import get_user_id, LoggerLevel
 
 if TYPE_CHECKING:
+    from flask import Flask
+
     from superset.stats_logger import BaseStatsLogger
 
 logger = logging.getLogger(__name__)
@@ -320,7 +327,7 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
+    def log(  # pylint: disable=too-many-arguments
         self,
         user_id: int | None,
         action: str,
@@ -334,24 +341,18 @@ class DBEventLogger(AbstractEventLogger):
         # pylint: disable=import-outside-toplevel
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id,
-                slice_id=slice_id,
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+        logs = [
+            Log(**row)
+            for row in self._get_rows(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
             )
-            logs.append(log)
+        ]
         try:
             sesh = current_app.appbuilder.get_session
             sesh.bulk_save_objects(logs)
@@ -359,3 +360,163 @@ class DBEventLogger(AbstractEventLogger):
         except SQLAlchemyError as ex:
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+
+    @staticmethod
+    def _get_rows(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        rows = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            rows.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id,
+                    "slice_id": slice_id,
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return rows
+
+
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches from a background
+    thread, so requests don't wait for their logs to be written.
+
+    Logs are written when ``batch_size`` of them are queued, or ``flush_interval``
+    seconds after the first one was queued. When ``max_queue_size`` logs are already
+    waiting new ones are dropped, and counted in ``dropped``. Queued logs are written
+    before the process exits.
+
+    To use it set ``EVENT_LOGGER = BufferedDBEventLogger()`` in the config.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._app: Flask | None = None
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        rows = self._get_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        self._start()
+        dttm = datetime.utcnow()
+        for row in rows:
+            try:
+                self._queue.put_nowait({**row, "dttm": dttm})
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def shutdown(self, timeout: float = 10) -> None:
+        """
+        Write the queued logs and stop the background thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None or self._pid != os.getpid():
+                return
+
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("BufferedDBEventLogger failed to write queued event(s)")
+            return
+        thread.join(timeout)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # the thread doesn't survive a fork, and the parent writes its logs
+                self._queue = queue.Queue(self._queue.maxsize)
+                self._thread = None
+                self._pid = os.getpid()
+
+            if self._thread is None:
+                # pylint: disable=protected-access
+                self._app = current_app._get_current_object()  # type: ignore
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="BufferedDBEventLogger",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            row = self._queue.get()
+            if row is None:
+                break
+
+            batch = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            self._write(batch)
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Log
+
+        assert self._app
+        with self._app.app_context():
+            sesh = self._app.appbuilder.get_session
+            try:
+                sesh.bulk_insert_mappings(Log, rows)
+                sesh.commit()
+            except SQLAlchemyError as ex:
+                sesh.rollback()
+                logging.error("BufferedDBEventLogger failed to log event(s)")
+                logging.exception(ex)
@@ -18,9 +18,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
-from time import sleep
-from typing import Any, TYPE_CHECKING
+from time import monotonic, sleep
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask import current_app
 from selenium.common.exceptions import (
@@ -110,6 +115,194 @@ def find_unexpected_errors(driver: WebDriver) -> list[str]:
     return error_messages
 
 
+# Returns the render status of the charts on the page once all of them are done, or
+# null while any of them is still loading. Only the charts that are displayed count,
+# charts in inactive dashboard tabs don't load until their tab is shown. Dashboards
+# don't virtualize charts for web drivers, so the displayed charts are all mounted.
+# The timestamps are relative to the start of the navigation, in milliseconds.
+CHARTS_READY_SCRIPT = """
+const isDisplayed = element => element.getClientRects().length > 0;
+const charts = Array.from(document.querySelectorAll("[data-chart-status]"));
+const displayed = charts.filter(isDisplayed);
+if (
+  charts.length === 0 ||
+  Array.from(document.querySelectorAll(".loading")).some(isDisplayed) ||
+  displayed.some(chart => !arguments[0].includes(chart.dataset.chartStatus))
+) {
+  return null;
+}
+return {
+  charts: displayed.map(chart => ({
+    id: chart.dataset.chartId,
+    status: chart.dataset.chartStatus,
+    ready: Number(chart.dataset.chartUpdatedAt) - performance.timeOrigin,
+  })),
+};
+"""
+# "success" is set when the data is received, before the chart is drawn
+CHART_READY_STATUSES = ["rendered", "failed", "stopped"]
+
+
+def wait_for_charts_ready(driver: WebDriver, url: str) -> bool:
+    """
+    Wait for all the charts on the page to signal that they are done, and report how
+    long each chart and the whole page took to be ready.
+
+    Returns ``False`` if the page wasn't ready within ``SCREENSHOT_READY_WAIT``.
+    """
+    stats_logger = current_app.config["STATS_LOGGER"]
+    try:
+        charts = WebDriverWait(
+            driver, current_app.config["SCREENSHOT_READY_WAIT"], poll_frequency=0.2
+        ).until(
+            lambda driver: driver.execute_script(
+                CHARTS_READY_SCRIPT, CHART_READY_STATUSES
+            )
+        )[
+            "charts"
+        ]
+    except TimeoutException:
+        logger.warning("Timed out waiting for the charts to be ready at url %s", url)
+        stats_logger.incr("screenshot.ready_timeout")
+        return False
+    except WebDriverException:
+        logger.exception("Failed to check whether the charts are ready at url %s", url)
+        return False
+
+    for chart in charts:
+        logger.debug(
+            "Chart %s was %s after %.0f ms",
+            chart["id"],
+            chart["status"],
+            chart["ready"],
+        )
+        stats_logger.timing("screenshot.chart_time_to_ready", chart["ready"])
+    if charts:
+        stats_logger.timing(
+            "screenshot.time_to_ready", max(chart["ready"] for chart in charts)
+        )
+    return True
+
+
+@dataclass
+class PooledWebDriver:
+    key: tuple[Any, ...]
+    driver: WebDriver
+    created: float = field(default_factory=monotonic)
+    uses: int = 0
+
+
+class WebDriverPool:
+    """
+    Process-local pool of authenticated web drivers, keyed by driver type, user and
+    window size.
+
+    Starting a browser and logging it in takes a few seconds, which used to be paid
+    for every screenshot. Idle drivers are kept for reuse up to
+    ``WEBDRIVER_POOL_SIZE``. Each one is checked before being leased again, and
+    recycled after ``WEBDRIVER_POOL_MAX_USES`` screenshots or
+    ``WEBDRIVER_POOL_MAX_AGE`` seconds.
+    """
+
+    def __init__(self) -> None:
+        self._idle: list[PooledWebDriver] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def lease(
+        self,
+        key: tuple[Any, ...],
+        create: Callable[[], WebDriver],
+    ) -> Iterator[WebDriver]:
+        """
+        Lease a driver for the key, creating it if there's no healthy idle one. The
+        driver is returned to the pool when done with, unless it's due for recycling
+        or an error was raised.
+        """
+        if current_app.config["WEBDRIVER_POOL_SIZE"] <= 0:
+            driver = create()
+            try:
+                yield driver
+            finally:
+                self._destroy(driver)
+            return
+
+        pooled = self._acquire(key) or PooledWebDriver(key, create())
+        try:
+            yield pooled.driver
+        except BaseException:
+            self._destroy(pooled.driver)
+            raise
+        self._release(pooled)
+
+    def _acquire(self, key: tuple[Any, ...]) -> PooledWebDriver | None:
+        while True:
+            with self._lock:
+                if self._pid != os.getpid():
+                    # drivers can't be shared with the parent process after a fork
+                    self._idle.clear()
+                    self._pid = os.getpid()
+
+                # the most recently used driver is the most likely to be healthy
+                for i in reversed(range(len(self._idle))):
+                    if self._idle[i].key == key:
+                        pooled = self._idle.pop(i)
+                        break
+                else:
+                    return None
+
+            try:
+                # health check, the browser might have crashed while idle
+                pooled.driver.current_url  # pylint: disable=pointless-statement
+                return pooled
+            except WebDriverException:
+                logger.warning("Discarding an unresponsive pooled web driver")
+                self._destroy(pooled.driver)
+
+    def _release(self, pooled: PooledWebDriver) -> None:
+        pooled.uses += 1
+        if (
+            pooled.uses >= current_app.config["WEBDRIVER_POOL_MAX_USES"]
+            or monotonic() - pooled.created
+            >= current_app.config["WEBDRIVER_POOL_MAX_AGE"]
+        ):
+            self._destroy(pooled.driver)
+            return
+
+        try:
+            # unload the page, so idle browsers don't keep running it
+            pooled.driver.get("about:blank")
+        except WebDriverException:
+            self._destroy(pooled.driver)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+            evicted = self._idle[: -current_app.config["WEBDRIVER_POOL_SIZE"]]
+            del self._idle[: len(evicted)]
+        for pooled_ in evicted:
+            self._destroy(pooled_.driver)
+
+    @staticmethod
+    def _destroy(driver: WebDriver) -> None:
+        WebDriverProxy.destroy(
+            driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"]
+        )
+
+    def dispose(self) -> None:
+        """
+        Destroy all the idle drivers.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._destroy(pooled.driver)
+
+
+webdriver_pool = WebDriverPool()
+
+
 class WebDriverProxy:
     def __init__(self, driver_type: str, window: WindowSize | None = None):
         self._driver_type = driver_type
@@ -167,13 +360,61 @@ class WebDriverProxy:
             pass
 
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
-        driver = self.auth(user)
+        with webdriver_pool.lease(
+            (self._driver_type, user.id, self._window), lambda: self.auth(user)
+        ) as driver:
+            return self._get_screenshot(driver, url, element_name, user)
+
+    def _wait_for_charts(self, driver: WebDriver, url: str) -> None:
+        try:
+            # chart containers didn't render
+            logger.debug("Wait for chart containers to draw at url: %s", url)
+            WebDriverWait(driver, self._screenshot_locate_wait).until(
+                EC.visibility_of_all_elements_located(
+                    (By.CLASS_NAME, "slice_container")
+                )
+            )
+        except TimeoutException as ex:
+            logger.exception(
+                "Selenium timed out waiting for chart containers to draw at url %s",
+                url,
+            )
+            raise ex
+
+        try:
+            # charts took too long to load
+            logger.debug(
+                "Wait for loading element of charts to be gone at url: %s", url
+            )
+            WebDriverWait(driver, self._screenshot_load_wait).until_not(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, "loading"))
+            )
+        except TimeoutException as ex:
+            logger.exception(
+                "Selenium timed out waiting for charts to load at url %s", url
+            )
+            raise ex
+
+        selenium_animation_wait = current_app.config[
+            "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
+        ]
+        logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
+        sleep(selenium_animation_wait)
+
+    def _get_screenshot(
+        self, driver: WebDriver, url: str, element_name: str, user: User
+    ) -> bytes | None:
         driver.set_window_size(*self._window)
         driver.get(url)
         img: bytes | None = None
-        selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-        logger.debug("Sleeping for %i seconds", selenium_headstart)
-        sleep(selenium_headstart)
+        ready = False
+        if current_app.config["SCREENSHOT_WAIT_FOR_READY"]:
+            logger.debug("Wait for the charts to be ready at url: %s", url)
+            ready = wait_for_charts_ready(driver, url)
+        else:
+            selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+            logger.debug("Sleeping for %i seconds", selenium_headstart)
+            sleep(selenium_headstart)
 
         try:
             try:
@@ -188,40 +429,16 @@ class WebDriverProxy:
                 logger.exception("Selenium timed out requesting url %s", url)
                 raise ex
 
-            try:
-                # chart containers didn't render
-                logger.debug("Wait for chart containers to draw at url: %s", url)
-                WebDriverWait(driver, self._screenshot_locate_wait).until(
-                    EC.visibility_of_all_elements_located(
-                        (By.CLASS_NAME, "slice_container")
-                    )
-                )
-            except TimeoutException as ex:
-                logger.exception(
-                    "Selenium timed out waiting for chart containers to draw at url %s",
-                    url,
-                )
-                raise ex
-
-            try:
-                # charts took too long to load
+            if ready:
+                ready_animation_wait = current_app.config[
+                    "SCREENSHOT_READY_ANIMATION_WAIT"
+                ]
                 logger.debug(
-                    "Wait for loading element of charts to be gone at url: %s", url
-                )
-                WebDriverWait(driver, self._screenshot_load_wait).until_not(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "loading"))
-                )
-            except TimeoutException as ex:
-                logger.exception(
-                    "Selenium timed out waiting for charts to load at url %s", url
+                    "Wait %i seconds for chart animation", ready_animation_wait
                 )
-                raise ex
-
-            selenium_animation_wait = current_app.config[
-                "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-            ]
-            logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
-            sleep(selenium_animation_wait)
+                sleep(ready_animation_wait)
+            else:
+                self._wait_for_charts(driver, url)
             logger.debug(
                 "Taking a PNG screenshot of url %s as user %s",
                 url,
@@ -251,6 +468,4 @@ class WebDriverProxy:
             logger.exception(
                 "Encountered an unexpected error when requeating url %s", url
             )
-        finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
@@ -16,17 +16,29 @@
 # under the License.
 import io
 import json
+import logging
 import os
 import tempfile
 import zipfile
-from typing import Any, TYPE_CHECKING
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from flask import flash, g, redirect
 from flask_appbuilder import expose, SimpleFormView
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.decorators import has_access
 from flask_babel import lazy_gettext as _
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+)
+from sqlalchemy import types
 from werkzeug.wrappers import Response
 from wtforms.fields import StringField
 from wtforms.validators import ValidationError
@@ -40,6 +52,7 @@ from superset.extensions import event_logger
 from superset.sql_parse import Table
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils
+from superset.utils.dates import now_as_float
 from superset.views.base import DeleteMixin, SupersetModelView, YamlExportMixin
 
 from .forms import ColumnarToDatabaseForm, CsvToDatabaseForm, ExcelToDatabaseForm
@@ -51,6 +64,7 @@ if TYPE_CHECKING:
 
 config = app.config
 stats_logger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
 
 
 def sqlalchemy_uri_form_validator(_: _, field: StringField) -> None:
@@ -82,6 +96,165 @@ def upload_stream_write(form_file_field: "FileStorage", path: str) -> None:
             file_description.write(chunk)
 
 
+def upload_chunks(
+    database: models.Database,
+    table: Table,
+    chunks: Iterator[pd.DataFrame],
+    to_sql_kwargs: dict[str, Any],
+    upload_type: str,
+) -> None:
+    """
+    Upload the chunks of a file to a table, logging the progress of the upload and
+    reporting its throughput to the stats logger.
+    """
+    start = now_as_float()
+    rows = 0
+
+    def track_progress() -> Iterator[pd.DataFrame]:
+        nonlocal rows
+        for df in chunks:
+            yield df
+            # the chunk has been uploaded when the next one is requested
+            rows += len(df.index)
+            logger.info(
+                "Uploaded %d rows to %s (%.0f rows/s)",
+                rows,
+                table,
+                rows / max((now_as_float() - start) / 1000, 0.001),
+            )
+
+    database.db_engine_spec.df_chunks_to_sql(
+        database, table, track_progress(), to_sql_kwargs
+    )
+
+    duration = now_as_float() - start
+    stats_logger.timing(f"{upload_type}_upload.time", duration)
+    stats_logger.gauge(f"{upload_type}_upload.rows", rows)
+    stats_logger.gauge(
+        f"{upload_type}_upload.rows_per_second", rows / max(duration / 1000, 0.001)
+    )
+
+
+def get_common_dtypes(dtypes: Iterable[pd.Series]) -> dict[Any, Any]:
+    """
+    Return the dtype of each column that holds the values of all the chunks of a file,
+    given the dtypes inferred for each chunk, like ``pd.concat`` would: numeric
+    columns are promoted to the wider type and other conflicting types to ``object``.
+
+    Chunks are uploaded to a table created from the first one, so they need to be
+    read with these dtypes for a value that only shows up further down the file, eg.
+    a string in a column of numbers, to fit in the table.
+    """
+    common: dict[Any, Any] = {}
+    for chunk_dtypes in dtypes:
+        for column, dtype in chunk_dtypes.items():
+            previous = common.setdefault(column, dtype)
+            if previous == dtype:
+                continue
+            if (
+                isinstance(previous, np.dtype)
+                and isinstance(dtype, np.dtype)
+                and is_numeric_dtype(previous)
+                and is_numeric_dtype(dtype)
+                and not is_bool_dtype(previous)
+                and not is_bool_dtype(dtype)
+            ):
+                common[column] = np.result_type(previous, dtype)
+            else:
+                common[column] = np.dtype(object)
+    return common
+
+
+def get_changing_dtypes(dtypes: list[pd.Series]) -> dict[Any, Any]:
+    """
+    Return the common dtype of the columns whose dtype changes between the chunks of
+    a file, given the dtypes inferred for each chunk. The other columns can be read
+    with the dtype pandas infers, which is the same for every chunk.
+    """
+    return {
+        column: dtype
+        for column, dtype in get_common_dtypes(dtypes).items()
+        if any(chunk_dtypes.get(column) != dtype for chunk_dtypes in dtypes)
+    }
+
+
+def get_to_sql_dtypes(dtypes: dict[Any, Any]) -> dict[Any, Any]:
+    """
+    Return the SQL types of the columns whose dtype changes between the chunks of an
+    upload that can't be derived from their dtype. Pandas infers the SQL type of
+    ``object`` columns from their values, eg. numbers in the first chunk and strings
+    further down, so they are created as text for the values of all the chunks to
+    fit.
+    """
+    return {
+        column: types.Text()
+        for column, dtype in dtypes.items()
+        if is_object_dtype(dtype)
+    }
+
+
+def get_parquet_dtypes(
+    parquet_file: pq.ParquetFile,
+    columns: Optional[list[str]],
+) -> pd.Series:
+    """
+    Return the dtypes of the columns of a Parquet file when read whole, from its
+    metadata. Integer and boolean columns with nulls are read as ``float64`` and
+    ``object``, so chunks without nulls need to be cast to these.
+    """
+    dtypes = parquet_file.schema_arrow.empty_table().to_pandas().dtypes
+    metadata = parquet_file.metadata
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            name = column.path_in_schema
+            if name not in dtypes or (
+                column.is_stats_set
+                and column.statistics.has_null_count
+                and not column.statistics.null_count
+            ):
+                continue
+            if is_bool_dtype(dtypes[name]):
+                dtypes[name] = np.dtype(object)
+            elif is_integer_dtype(dtypes[name]):
+                dtypes[name] = np.dtype(np.float64)
+    return dtypes[columns] if columns else dtypes
+
+
+def read_parquet_chunks(
+    files: list[Any],
+    columns: Optional[list[str]],
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read Parquet files in chunks of ``chunk_size`` rows, with the index of each file
+    like ``pd.read_parquet``. Columns are cast to a dtype common to all the files,
+    found from their schemas.
+    """
+    parquet_files = [pq.ParquetFile(getattr(file, "stream", file)) for file in files]
+    dtypes = get_common_dtypes(
+        get_parquet_dtypes(parquet_file, columns) for parquet_file in parquet_files
+    )
+
+    for parquet_file in parquet_files:
+        offset = 0
+        for batch in parquet_file.iter_batches(
+            batch_size=chunk_size, columns=columns, use_pandas_metadata=True
+        ):
+            df = batch.to_pandas()
+            if isinstance(df.index, pd.RangeIndex):
+                df.index = pd.RangeIndex(offset, offset + len(df.index))
+            offset += len(df.index)
+            yield df.astype(dtypes)
+
+        if not offset:
+            # the table is still created for files without rows
+            yield parquet_file.read(
+                columns=columns, use_pandas_metadata=True
+            ).to_pandas().astype(dtypes)
+
+
 class DatabaseView(
     DatabaseMixin, SupersetModelView, DeleteMixin, YamlExportMixin
 ):  # pylint: disable=too-many-ancestors
@@ -191,45 +364,60 @@ class CsvToDatabaseView(CustomFormView):
 
         try:
             kwargs = {"dtype": json.loads(form.dtype.data)} if form.dtype.data else {}
-            df = pd.concat(
-                pd.read_csv(
-                    chunksize=1000,
-                    encoding="utf-8",
-                    filepath_or_buffer=form.csv_file.data,
-                    header=form.header.data if form.header.data else 0,
-                    index_col=form.index_col.data,
-                    infer_datetime_format=form.infer_datetime_format.data,
-                    iterator=True,
-                    keep_default_na=not form.null_values.data,
-                    usecols=form.use_cols.data if form.use_cols.data else None,
-                    na_values=form.null_values.data if form.null_values.data else None,
-                    nrows=form.nrows.data,
-                    parse_dates=form.parse_dates.data,
-                    sep=delimiter_input,
-                    skip_blank_lines=form.skip_blank_lines.data,
-                    skipinitialspace=form.skip_initial_space.data,
-                    skiprows=form.skiprows.data,
-                    **kwargs,
-                )
-            )
-
             database = (
                 db.session.query(models.Database)
                 .filter_by(id=form.data.get("database").data.get("id"))
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
-                database,
-                csv_table,
-                df,
-                to_sql_kwargs={
-                    "chunksize": 1000,
-                    "if_exists": form.if_exists.data,
-                    "index": form.dataframe_index.data,
-                    "index_label": form.index_label.data,
+            read_csv_kwargs = {
+                "chunksize": config["UPLOAD_CHUNK_ROWS"],
+                "encoding": "utf-8",
+                "filepath_or_buffer": form.csv_file.data,
+                "header": form.header.data if form.header.data else 0,
+                "index_col": form.index_col.data,
+                "infer_datetime_format": form.infer_datetime_format.data,
+                "iterator": True,
+                "keep_default_na": not form.null_values.data,
+                "usecols": form.use_cols.data if form.use_cols.data else None,
+                "na_values": form.null_values.data if form.null_values.data else None,
+                "nrows": form.nrows.data,
+                "parse_dates": form.parse_dates.data,
+                "sep": delimiter_input,
+                "skip_blank_lines": form.skip_blank_lines.data,
+                "skipinitialspace": form.skip_initial_space.data,
+                "skiprows": form.skiprows.data,
+            }
+
+            # a first pass finds the dtypes that fit the values of every chunk, for
+            # the columns whose dtype changes from one chunk to another
+            with pd.read_csv(**read_csv_kwargs, **kwargs) as chunks:
+                dtypes = get_changing_dtypes([df.dtypes for df in chunks])
+            form.csv_file.data.seek(0)
+            kwargs["dtype"] = {
+                **{
+                    column: dtype
+                    for column, dtype in dtypes.items()
+                    # dates are still parsed according to parse_dates
+                    if not is_datetime64_any_dtype(dtype)
                 },
-            )
+                **kwargs.get("dtype", {}),
+            }
+
+            with pd.read_csv(**read_csv_kwargs, **kwargs) as chunks:
+                upload_chunks(
+                    database,
+                    csv_table,
+                    chunks,
+                    {
+                        "chunksize": 1000,
+                        "dtype": get_to_sql_dtypes(dtypes),
+                        "if_exists": form.if_exists.data,
+                        "index": form.dataframe_index.data,
+                        "index_label": form.index_label.data,
+                    },
+                    "csv",
+                )
 
             # Connect table to the database that should be used for exploration.
             # E.g. if hive was used to upload a csv, presto will be a better option
@@ -355,16 +543,18 @@ class ExcelToDatabaseView(SimpleFormView):
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
+            # pandas can't read Excel files in chunks
+            upload_chunks(
                 database,
                 excel_table,
-                df,
-                to_sql_kwargs={
+                iter([df]),
+                {
                     "chunksize": 1000,
                     "if_exists": form.if_exists.data,
                     "index": form.index.data,
                     "index_label": form.index_label.data,
                 },
+                "excel",
             )
 
             # Connect table to the database that should be used for exploration.
@@ -471,10 +661,7 @@ class ColumnarToDatabaseView(SimpleFormView):
             flash(message, "danger")
             return redirect("/columnartodatabaseview/form")
 
-        read = pd.read_parquet
-        kwargs = {
-            "columns": form.usecols.data if form.usecols.data else None,
-        }
+        columns = form.usecols.data if form.usecols.data else None
 
         if not schema_allows_file_upload(database, columnar_table.schema):
             message = _(
@@ -488,25 +675,23 @@ class ColumnarToDatabaseView(SimpleFormView):
             return redirect("/columnartodatabaseview/form")
 
         try:
-            chunks = [read(file, **kwargs) for file in files]
-            df = pd.concat(chunks)
-
             database = (
                 db.session.query(models.Database)
                 .filter_by(id=form.data.get("database").data.get("id"))
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
+            upload_chunks(
                 database,
                 columnar_table,
-                df,
-                to_sql_kwargs={
+                read_parquet_chunks(files, columns, config["UPLOAD_CHUNK_ROWS"]),
+                {
                     "chunksize": 1000,
                     "if_exists": form.if_exists.data,
                     "index": form.index.data,
                     "index_label": form.index_label.data,
                 },
+                "columnar",
             )
 
             # Connect table to the database that should be used for exploration.
@@ -31,7 +31,7 @@ from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
 import superset.models.core as models
-from superset import app, dataframe, db, result_set, viz
+from superset import app, dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -47,6 +47,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import get_results_data_key, read_results_table
 from superset.superset_typing import FormData
 from superset.utils.core import DatasourceType
 from superset.utils.decorators import stats_timing
@@ -516,8 +517,23 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    rows: Optional[int] = None,
+    encode_data: bool = False,
 ) -> dict[str, Any]:
+    """
+    Deserialize a SQL Lab results payload read from the results backend.
+
+    :param payload: the serialized payload
+    :param query: the query the results belong to
+    :param use_msgpack: whether the payload was serialized with msgpack
+    :param rows: the maximum number of rows to return
+    :param encode_data: whether to return the data as encoded JSON instead of
+        records, for when the payload is only going to be serialized to JSON
+    :returns: the deserialized payload
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -527,19 +543,41 @@ def _deserialize_results_payload(
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
             try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
+                if data_format := ds_payload.pop("data_format", None):
+                    # the data is stored separately, only read the rows needed
+                    blob = results_backend.get(
+                        get_results_data_key(ds_payload["query"]["resultsKey"])
+                    )
+                    if not blob:
+                        raise SerializationError("Results data not found")
+                    pa_table = read_results_table(blob, data_format, rows=rows)
+                else:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+            except (pa.ArrowSerializationError, pa.ArrowInvalid) as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
 
         for column in ds_payload["selected_columns"]:
             if "name" in column:
                 column["column_name"] = column.get("name")
 
         db_engine_spec = query.database.db_engine_spec
+        if encode_data and not db_engine_spec.expands_data():
+            # skip building the records, the rows are encoded straight to JSON
+            if rows:
+                df = df.iloc[:rows]
+            ds_payload.update(
+                {
+                    "data": json.RawJSON(dataframe.df_to_json(df)),
+                    "columns": ds_payload["selected_columns"],
+                    "expanded_columns": [],
+                }
+            )
+            return ds_payload
+
+        ds_payload["data"] = dataframe.df_to_records(df) or []
         all_columns, data, expanded_columns = db_engine_spec.expand_data(
             ds_payload["selected_columns"], ds_payload["data"]
         )
@@ -109,6 +109,42 @@ class TestAsyncEventApi(SupersetTestCase):
         }
         self.assertEqual(response, expected)
 
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_long_polling(self, mock_uuid4):
+        app._got_first_request = False
+        async_query_manager.init_app(app)
+        self.login(username="admin")
+        event = (
+            "1607477697866-0",
+            {"data": '{"job_id": "10a0bd9a", "status": "done"}'},
+        )
+        channel_id = app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+        with mock.patch.object(
+            async_query_manager, "_long_polling_timeout", 10000
+        ), mock.patch.object(
+            async_query_manager._redis, "xrange", return_value=[]
+        ), mock.patch.object(
+            async_query_manager._redis, "xread", return_value=[[channel_id, [event]]]
+        ) as mock_xread:
+            rv = self.client.get(
+                "api/v1/async_event/?last_id=1607471525180-0&timeout=60000"
+            )
+            response = json.loads(rv.data.decode("utf-8"))
+
+        assert rv.status_code == 200
+        # the timeout is capped by GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT
+        mock_xread.assert_called_with(
+            {channel_id: "1607471525180-0"}, count=100, block=10000
+        )
+        self.assertEqual(
+            response,
+            {
+                "result": [
+                    {"id": "1607477697866-0", "job_id": "10a0bd9a", "status": "done"}
+                ]
+            },
+        )
+
     def test_events_no_login(self):
         app._got_first_request = False
         async_query_manager.init_app(app)
@@ -1055,6 +1055,58 @@ class TestCore(SupersetTestCase, InsertChartMixin):
             self.assertDictEqual(deserialized_payload, payload)
             expand_data.assert_called_once()
 
+    def test_results_data_format_deserialization(self):
+        data = [("a", 4, 4.0), ("b", 5, 5.0), ("c", 6, 6.0)]
+        cursor_descr = (("a", "string"), ("b", "int"), ("c", "float"))
+        db_engine_spec = BaseEngineSpec()
+        results = SupersetResultSet(data, cursor_descr, db_engine_spec)
+        (
+            serialized_data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = sql_lab._serialize_and_expand_data(
+            results, db_engine_spec, True, data_format="parquet"
+        )
+        payload = {
+            "query_id": 1,
+            "status": QueryStatus.SUCCESS,
+            "data": None,
+            "data_format": "parquet",
+            "columns": all_columns,
+            "selected_columns": selected_columns,
+            "expanded_columns": expanded_columns,
+            "query": {"resultsKey": "key"},
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, True)
+
+        query_mock = mock.Mock()
+        query_mock.database.db_engine_spec = db_engine_spec
+        results_backend = mock.Mock()
+        results_backend.get.return_value = serialized_data
+        with mock.patch("superset.views.utils.results_backend", results_backend):
+            deserialized_payload = superset.views.utils._deserialize_results_payload(
+                serialized_payload, query_mock, True, rows=2
+            )
+
+        results_backend.get.assert_called_once_with("key__data")
+        self.assertNotIn("data_format", deserialized_payload)
+        self.assertEqual(
+            deserialized_payload["data"],
+            [{"a": "a", "b": 4, "c": 4.0}, {"a": "b", "b": 5, "c": 5.0}],
+        )
+
+        with mock.patch("superset.views.utils.results_backend", results_backend):
+            deserialized_payload = superset.views.utils._deserialize_results_payload(
+                serialized_payload, query_mock, True, rows=2, encode_data=True
+            )
+
+        self.assertEqual(
+            json.loads(deserialized_payload["data"].encoded_json),
+            [{"a": "a", "b": 4, "c": 4.0}, {"a": "b", "b": 5, "c": 5.0}],
+        )
+        self.assertEqual(deserialized_payload["columns"], selected_columns)
+
     @mock.patch.dict(
         "superset.extensions.feature_flag_manager._feature_flags",
         {"FOO": lambda x: 1},
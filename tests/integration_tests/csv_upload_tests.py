@@ -26,6 +26,8 @@ from unittest import mock
 
 import pandas as pd
 import pytest
+from sqlalchemy import inspect
+from sqlalchemy.sql import sqltypes
 
 import superset.utils.database
 from superset.sql_parse import Table
@@ -45,6 +47,7 @@ test_client = app.test_client()
 CSV_UPLOAD_DATABASE = "csv_explore_db"
 CSV_FILENAME1 = "testCSV1.csv"
 CSV_FILENAME2 = "testCSV2.csv"
+CSV_FILENAME3 = "testCSV3.csv"
 EXCEL_FILENAME = "testExcel.xlsx"
 PARQUET_FILENAME1 = "testZip/testParquet1.parquet"
 PARQUET_FILENAME2 = "testZip/testParquet2.parquet"
@@ -107,6 +110,21 @@ def create_csv_files():
     os.remove(CSV_FILENAME2)
 
 
+@pytest.fixture()
+def create_csv_file_with_type_change():
+    with open(CSV_FILENAME3, "w+") as test_file:
+        for line in [
+            "a,b,c,d",
+            "john,1,1,True",
+            "paul,2,2,",
+            "max,x,1.5,False",
+            "bob,,3,",
+        ]:
+            test_file.write(f"{line}\n")
+    yield
+    os.remove(CSV_FILENAME3)
+
+
 @pytest.fixture()
 def create_excel_files():
     pd.DataFrame({"a": ["john", "paul"], "b": [1, 2]}).to_excel(EXCEL_FILENAME)
@@ -424,6 +442,39 @@ def test_import_csv(mock_event_logger):
     assert fail_msg in resp
 
 
+@pytest.mark.usefixtures("setup_csv_upload_with_context")
+@pytest.mark.usefixtures("create_csv_file_with_type_change")
+@mock.patch.dict(app.config, {"UPLOAD_CHUNK_ROWS": 2})
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
+def test_import_csv_type_change_across_chunks():
+    schema = utils.get_example_default_schema()
+    full_table_name = f"{schema}.{CSV_UPLOAD_TABLE}" if schema else CSV_UPLOAD_TABLE
+
+    # b and c only have integers in the first chunk, d has booleans and blanks in
+    # every chunk
+    resp = upload_csv(CSV_FILENAME3, CSV_UPLOAD_TABLE)
+    success_msg = f"CSV file {escaped_double_quotes(CSV_FILENAME3)} uploaded to table {escaped_double_quotes(full_table_name)}"
+    assert success_msg in resp
+
+    with get_upload_db().get_sqla_engine_with_context() as engine:
+        columns = {
+            column["name"]: column["type"]
+            for column in inspect(engine).get_columns(CSV_UPLOAD_TABLE, schema)
+        }
+        assert isinstance(columns["b"], sqltypes.Text)
+        assert not isinstance(columns["d"], sqltypes.String)
+        data = engine.execute(
+            f"SELECT a, b, c from {CSV_UPLOAD_TABLE} ORDER BY c"
+        ).fetchall()
+        assert data == [
+            ("john", "1", 1.0),
+            ("max", "x", 1.5),
+            ("paul", "2", 2.0),
+            ("bob", None, 3.0),
+        ]
+        engine.execute(f"DROP TABLE {full_table_name}")
+
+
 @pytest.mark.usefixtures("setup_csv_upload_with_context")
 @pytest.mark.usefixtures("create_excel_files")
 @mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
@@ -19,6 +19,7 @@ from unittest import mock
 
 import pytest
 import pandas as pd
+import pyarrow.parquet as pq
 from sqlalchemy.sql import select
 
 from superset.db_engine_specs.hive import HiveEngineSpec, upload_to_s3
@@ -238,6 +239,70 @@ def test_df_to_sql_if_exists_replace_with_schema(mock_upload_to_s3, mock_g):
     app.config = config
 
 
+@mock.patch("superset.db_engine_specs.hive.g", spec={})
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3")
+def test_df_chunks_to_sql(mock_upload_to_s3, mock_g):
+    uploaded = []
+
+    def upload_to_s3(filename, upload_prefix, table):
+        uploaded.append(pq.read_table(filename).to_pandas())
+        return "mock-location"
+
+    mock_upload_to_s3.side_effect = upload_to_s3
+    mock_g.user = True
+    mock_database = mock.MagicMock()
+    mock_execute = mock.MagicMock(return_value=True)
+    mock_database.get_sqla_engine_with_context.return_value.__enter__.return_value.execute = (
+        mock_execute
+    )
+
+    with app.app_context():
+        HiveEngineSpec.df_chunks_to_sql(
+            mock_database,
+            Table(table="foobar"),
+            iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]),
+            {"if_exists": "replace"},
+        )
+
+    assert len(uploaded) == 1
+    assert uploaded[0]["a"].tolist() == [1, 2, 3]
+    assert "`a` BIGINT" in str(mock_execute.call_args_list[-1][0][0])
+
+
+@mock.patch("superset.db_engine_specs.hive.g", spec={})
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3")
+def test_df_chunks_to_sql_type_change(mock_upload_to_s3, mock_g):
+    uploaded = []
+
+    def upload_to_s3(filename, upload_prefix, table):
+        uploaded.append(pq.read_table(filename).to_pandas())
+        return "mock-location"
+
+    mock_upload_to_s3.side_effect = upload_to_s3
+    mock_g.user = True
+    mock_database = mock.MagicMock()
+    mock_execute = mock.MagicMock(return_value=True)
+    mock_database.get_sqla_engine_with_context.return_value.__enter__.return_value.execute = (
+        mock_execute
+    )
+
+    with app.app_context():
+        HiveEngineSpec.df_chunks_to_sql(
+            mock_database,
+            Table(table="foobar"),
+            iter(
+                [
+                    pd.DataFrame({"a": pd.Series([None, None], dtype=object)}),
+                    pd.DataFrame({"a": pd.Series([1, "x"], dtype=object)}),
+                ]
+            ),
+            {"if_exists": "replace"},
+        )
+
+    assert uploaded[0]["a"].tolist() == [None, None, "1", "x"]
+    assert "`a` STRING" in str(mock_execute.call_args_list[-1][0][0])
+
+
 def test_is_readonly():
     def is_readonly(sql: str) -> bool:
         return HiveEngineSpec.is_readonly_query(ParsedQuery(sql))
@@ -19,7 +19,7 @@ from textwrap import dedent
 
 import numpy as np
 import pandas as pd
-from sqlalchemy.types import NVARCHAR
+from sqlalchemy.types import Integer, NVARCHAR, Text
 
 from superset.db_engine_specs.redshift import RedshiftEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -244,3 +244,25 @@ psql: error: could not connect to server: Operation timed out
         dtype = df.to_sql.call_args[1]["dtype"]
         assert isinstance(dtype["value"], NVARCHAR)
         assert dtype["value"].length == 65535
+
+    @mock.patch("superset.db_engine_specs.base.BaseEngineSpec.df_chunks_to_sql")
+    def test_df_chunks_to_sql_text_dtype(self, mock_df_chunks_to_sql):
+        mock_database = mock.MagicMock()
+        df = pd.DataFrame({"id": [1], "value": ["foo"]})
+        df = df.astype(dtype={"value": "string"})
+
+        RedshiftEngineSpec.df_chunks_to_sql(
+            mock_database,
+            Table(table="foobar"),
+            iter([df, df]),
+            to_sql_kwargs={"dtype": {"id": Text(), "other": Integer()}},
+        )
+
+        # text and string columns are created as nvarchar(65535)
+        _, _, chunks, to_sql_kwargs = mock_df_chunks_to_sql.call_args[0]
+        assert len(list(chunks)) == 2
+        dtype = to_sql_kwargs["dtype"]
+        assert isinstance(dtype["id"], NVARCHAR)
+        assert dtype["id"].length == 65535
+        assert isinstance(dtype["value"], NVARCHAR)
+        assert isinstance(dtype["other"], Integer)
@@ -27,6 +27,7 @@ from freezegun import freeze_time
 from superset import security_manager
 from superset.utils.log import (
     AbstractEventLogger,
+    BufferedDBEventLogger,
     DBEventLogger,
     get_event_logger_from_cfg_value,
 )
@@ -230,3 +231,32 @@ class TestEventLogger(unittest.TestCase):
             )
 
         assert logger.records[0]["user_id"] == None
+
+    def test_buffered_db_event_logger(self):
+        from superset import db
+        from superset.models.core import Log
+
+        logger = BufferedDBEventLogger()
+        with app.app_context():
+            logger.log(
+                None,
+                "buffered_event_logger_test",
+                None,
+                10,
+                None,
+                None,
+                records=[{"a": 1}, {"a": 2}],
+            )
+            logger.shutdown()
+
+            logs = (
+                db.session.query(Log)
+                .filter_by(action="buffered_event_logger_test")
+                .order_by(Log.id)
+                .all()
+            )
+            assert [log.json for log in logs] == ['{"a": 1}', '{"a": 2}']
+            assert all(log.duration_ms == 10 and log.dttm for log in logs)
+            for log in logs:
+                db.session.delete(log)
+            db.session.commit()
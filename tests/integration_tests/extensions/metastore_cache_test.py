@@ -120,3 +120,46 @@ def test_codec(
     with cm:
         cache.set(FIRST_KEY, input_)
         assert cache.get(FIRST_KEY) == expected_result
+
+
+def test_get_set_many(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE)
+    assert cache.set_many(
+        {FIRST_KEY: FIRST_KEY_UPDATED_VALUE, SECOND_KEY: SECOND_VALUE}
+    ) == [FIRST_KEY, SECOND_KEY]
+    assert cache.get_many(SECOND_KEY, "missing", FIRST_KEY) == [
+        SECOND_VALUE,
+        None,
+        FIRST_KEY_UPDATED_VALUE,
+    ]
+    assert cache.get_dict(FIRST_KEY, SECOND_KEY) == {
+        FIRST_KEY: FIRST_KEY_UPDATED_VALUE,
+        SECOND_KEY: SECOND_VALUE,
+    }
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+
+
+def test_prune(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    from superset.extensions import db
+    from superset.key_value.models import KeyValueEntry
+
+    def count_entries() -> int:
+        return (
+            db.session.query(KeyValueEntry)
+            .filter(KeyValueEntry.uuid.in_([cache.get_key(str(i)) for i in range(5)]))
+            .count()
+        )
+
+    cache.prune_max_rows = 2
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+    with freeze_time(dttm):
+        cache.set_many({str(i): i for i in range(4)}, timeout=10)
+    with freeze_time(dttm + timedelta(seconds=20)):
+        # at most `prune_max_rows` entries are pruned
+        cache.add("4", 4, timeout=10)
+        assert count_entries() == 3
+        # at most once every `prune_interval` seconds
+        cache.add("5", 5, timeout=10)
+        assert count_entries() == 3
+    cache.delete_many(*[str(i) for i in range(6)])
@@ -208,3 +208,84 @@ def test_execute_task_with_command_exception(
 
         db.session.delete(report_schedule)
         db.session.commit()
+
+
+@pytest.mark.usefixtures("owners")
+@patch("superset.tasks.scheduler.execute_group.apply_async")
+@patch("superset.tasks.scheduler.execute.apply_async")
+def test_scheduler_batch_execution(execute_mock, execute_group_mock, owners):
+    """
+    Reports scheduler: Test that reports rendering the same content are executed
+    together, and alerts separately
+    """
+    with app.app_context():
+        app.config["ALERT_REPORTS_BATCH_EXECUTION"] = True
+        report_schedules = [
+            insert_report_schedule(
+                type=type_,
+                name=f"report-{idx}",
+                crontab="0 9 * * *",
+                timezone="UTC",
+                owners=owners,
+            )
+            for idx, type_ in enumerate(
+                [
+                    ReportScheduleType.REPORT,
+                    ReportScheduleType.REPORT,
+                    ReportScheduleType.ALERT,
+                ]
+            )
+        ]
+
+        ids = [report_schedule.id for report_schedule in report_schedules]
+
+        with freeze_time("2020-01-01T09:00:00Z"):
+            scheduler()
+            execute_group_mock.assert_called_once()
+            assert execute_group_mock.call_args[0][0] == ([ids[0], ids[1]],)
+            assert execute_group_mock.call_args[1]["soft_time_limit"] == 7201
+            assert execute_group_mock.call_args[1]["time_limit"] == 7210
+            execute_mock.assert_called_once()
+            assert execute_mock.call_args[0][0] == (ids[2],)
+
+        for report_schedule in report_schedules:
+            db.session.delete(report_schedule)
+        db.session.commit()
+        app.config["ALERT_REPORTS_BATCH_EXECUTION"] = False
+
+
+@pytest.mark.usefixtures("owners")
+@patch("superset.tasks.scheduler.execute.apply_async")
+def test_scheduler_database_dispatch_interval(execute_mock, owners):
+    """
+    Reports scheduler: Test that tasks querying the same database are spread
+    """
+    from superset.utils.database import get_example_database
+
+    with app.app_context():
+        app.config["ALERT_REPORTS_DATABASE_DISPATCH_INTERVAL"] = 10
+        report_schedules = [
+            insert_report_schedule(
+                type=ReportScheduleType.ALERT,
+                name=f"alert-{idx}",
+                crontab="0 9 * * *",
+                timezone="UTC",
+                owners=owners,
+                database=get_example_database(),
+                sql="SELECT 1",
+            )
+            for idx in range(3)
+        ]
+
+        with freeze_time("2020-01-01T09:00:00Z"):
+            scheduler()
+            assert sorted(call[1]["eta"] for call in execute_mock.call_args_list) == [
+                FakeDatetime(2020, 1, 1, 9, 0),
+                FakeDatetime(2020, 1, 1, 9, 0, 10),
+                FakeDatetime(2020, 1, 1, 9, 0, 20),
+            ]
+
+        for report_schedule in report_schedules:
+            db.session.delete(report_schedule)
+        db.session.commit()
+        app.config["ALERT_REPORTS_DATABASE_DISPATCH_INTERVAL"] = 0
@@ -181,6 +181,22 @@ class TestSqlResultExportCommand(SupersetTestCase):
         assert result["count"] == 3
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.models.core.Database.get_df")
+    @patch.dict(
+        "superset.sqllab.commands.export.config",
+        {"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_CHUNK_SIZE": 2},
+    )
+    def test_run_streaming(self, get_df_mock: Mock) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        result = command.run()
+
+        assert list(result["data"]) == ["foo\n1\n2\n", "3\n"]
+        assert result["count"] == 3
+
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
     @patch("superset.models.core.Database.get_df")
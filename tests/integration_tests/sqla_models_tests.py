@@ -36,6 +36,7 @@ from superset.db_engine_specs.bigquery import BigQueryEngineSpec
 from superset.db_engine_specs.druid import DruidEngineSpec
 from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
 from superset.models.core import Database
+from superset.models.helpers import memoize_sqla_queries
 from superset.utils.core import (
     AdhocMetricExpressionType,
     FilterOperator,
@@ -189,6 +190,41 @@ class TestDatabaseModel(SupersetTestCase):
         self.assertTrue(table3.has_extra_cache_key_calls(query_obj))
         assert extra_cache_keys == ["abc"]
 
+    @patch("superset.jinja_context.g")
+    def test_extra_cache_keys_memoized_query(self, flask_g):
+        flask_g.user.username = "abc"
+        query_obj = {
+            "granularity": None,
+            "from_dttm": None,
+            "to_dttm": None,
+            "groupby": ["user"],
+            "metrics": [],
+            "is_timeseries": False,
+            "filter": [],
+            "extras": {},
+        }
+        table = SqlaTable(
+            id=1000,
+            table_name="test_extra_cache_keys_memoized_query_table",
+            sql="SELECT '{{ current_username() }}' as user",
+            database=get_example_database(),
+        )
+
+        with patch.object(
+            SqlaTable, "get_sqla_query", wraps=table.get_sqla_query
+        ) as get_sqla_query:
+            # the query built for the cache key is reused to run the query
+            with memoize_sqla_queries():
+                assert table.get_extra_cache_keys(query_obj) == ["abc"]
+                sql = table.get_query_str_extended(query_obj).sql
+                assert get_sqla_query.call_count == 1
+                table.get_query_str_extended({**query_obj, "row_limit": 10})
+                assert get_sqla_query.call_count == 2
+
+            # queries aren't reused outside of the block
+            assert table.get_query_str_extended(query_obj).sql == sql
+            assert get_sqla_query.call_count == 3
+
     @patch("superset.jinja_context.g")
     def test_jinja_metrics_and_calc_columns(self, flask_g):
         flask_g.user.username = "abc"
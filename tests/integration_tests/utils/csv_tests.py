@@ -81,3 +81,36 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_mixed_columns():
+    df = pd.DataFrame(
+        {"a": ["=x", 1, None, "-1"], "b": [1.5, 2.5, 3.5, 4.5]},
+        index=["w", "x", "y", "z"],
+    )
+    original = df.copy()
+
+    assert csv.df_to_escaped_csv(df, encoding="utf8") == (
+        ",a,b\nw,'=x,1.5\nx,1,2.5\ny,,3.5\nz,-1,4.5\n"
+    )
+    # the input frame is left untouched
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_df_to_escaped_csv_bytes_columns():
+    # BLOB columns are object columns of bytes only
+    df = pd.DataFrame({"a": [b"=x", None], "b": [b"y", "=z"]})
+
+    assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == (
+        "a,b\nb'=x',b'y'\n,'=z\n"
+    )
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame({"=a": ["@x", "y", "z"], "b": [1, 2, 3]})
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=2, index=False))
+    assert chunks == ["'=a,b\n'@x,1\ny,2\n", "z,3\n"]
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+    assert list(csv.df_to_escaped_csv_chunks(df.iloc[:0], index=False)) == ["'=a,b\n"]
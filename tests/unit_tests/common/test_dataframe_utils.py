@@ -48,3 +48,47 @@ def test_is_datetime_series():
             datetime.datetime(2018, 1, 1), datetime.datetime(2018, 2, 1)
         ).to_series()
     )
+
+
+def test_serialize_df():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "nullable_int": pd.Series([1, None, 3], dtype=object),
+            "float": [1.5, None, 3.5],
+            "str": ["a", None, "c"],
+            "bool": [True, False, None],
+            "dttm": pd.to_datetime(["2023-01-01", None, "2023-01-03"]),
+            "tz": pd.to_datetime(["2023-01-01", "2023-01-02", "2023-01-03"], utc=True),
+            "date": [datetime.date(2023, 1, 1), None, datetime.date(2023, 1, 3)],
+        }
+    )
+
+    for compression in (None, "zstd"):
+        blob = dataframe_utils.serialize_df(df, compression)
+        assert isinstance(blob, bytes)
+        decoded = dataframe_utils.deserialize_df(blob)
+        pd.testing.assert_frame_equal(decoded, df)
+
+        # the decoded DataFrame can be modified in place
+        decoded.loc[0, "int"] = 10
+        assert decoded["int"].tolist() == [10, 2, 3]
+
+    pivoted = df.set_index(["str", "dttm"])
+    pd.testing.assert_frame_equal(
+        dataframe_utils.deserialize_df(dataframe_utils.serialize_df(pivoted)),
+        pivoted,
+    )
+
+
+def test_serialize_df_unsupported():
+    assert dataframe_utils.serialize_df(pd.DataFrame({1: [1], "a": [2]})) is None
+    assert (
+        dataframe_utils.serialize_df(pd.DataFrame([[1, 2]], columns=["a", "a"])) is None
+    )
+    assert dataframe_utils.serialize_df(pd.DataFrame({"a": [1, "a", 1.5]})) is None
+    assert dataframe_utils.serialize_df(pd.DataFrame({"a": [2**70, 1]})) is None
+    assert dataframe_utils.serialize_df(pd.DataFrame({"a": [[1, 2], [3]]})) is None
+    assert (
+        dataframe_utils.serialize_df(pd.DataFrame({"a": [{"b": 1}, {"c": 2}]})) is None
+    )
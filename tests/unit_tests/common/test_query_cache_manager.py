@@ -0,0 +1,50 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+from pytest_mock import MockFixture
+
+
+def test_encode_decode_df(mocker: MockFixture) -> None:
+    from superset.common.utils import query_cache_manager
+
+    mocker.patch.dict(
+        query_cache_manager.config,
+        {
+            "DATA_CACHE_DATAFRAME_FORMAT": "arrow",
+            "DATA_CACHE_DATAFRAME_COMPRESSION": "zstd",
+        },
+    )
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+
+    value = query_cache_manager.encode_df(df)
+    assert value["df_format"] == "arrow"
+    assert isinstance(value["df"], bytes)
+    stats_logger.gauge.assert_called_once_with(
+        "cache.df_encoded_size", len(value["df"])
+    )
+    pd.testing.assert_frame_equal(query_cache_manager.decode_df(value), df)
+
+    # DataFrames that can't be serialized are stored as they are
+    unsupported = pd.DataFrame({1: [1]})
+    assert query_cache_manager.encode_df(unsupported) == {"df": unsupported}
+    stats_logger.incr.assert_called_once_with("cache.df_encode_fallback")
+
+    # entries written without a format still load
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_DATAFRAME_FORMAT": None})
+    assert query_cache_manager.encode_df(df) == {"df": df}
+    assert query_cache_manager.decode_df({"df": df}) is df
@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+
+import pandas as pd
+from pytest_mock import MockFixture
+
+
+def test_processing_time_offsets_parallel(mocker: MockFixture, app_context: None):
+    """
+    Test that time offsets queried in worker threads are joined in order.
+    """
+    from superset.common import query_context_processor
+    from superset.common.query_context_processor import QueryContextProcessor
+    from superset.common.query_object import QueryObject
+    from superset.models.helpers import QueryResult
+
+    mocker.patch.dict(
+        query_context_processor.config, {"CHART_DATA_MAX_QUERY_WORKERS": 4}
+    )
+
+    def query(query_obj: dict) -> QueryResult:
+        return QueryResult(
+            df=pd.DataFrame(
+                {
+                    "__timestamp": pd.date_range(query_obj["from_dttm"], periods=3),
+                    "sum__num": [10, 20, 30],
+                }
+            ),
+            query=f"query from {query_obj['from_dttm']:%Y-%m-%d}",
+            duration=timedelta(0),
+        )
+
+    query_context = mocker.MagicMock()
+    query_context.datasource.query.side_effect = query
+    processor = QueryContextProcessor(query_context)
+    mocker.patch.object(processor, "query_cache_key", return_value=None)
+    mocker.patch.object(processor, "get_time_grain", return_value="P1D")
+    mocker.patch.object(processor, "normalize_df", side_effect=lambda df, _: df)
+
+    query_object = QueryObject(
+        granularity="ds",
+        metrics=["sum__num"],
+        row_limit=None,
+        time_range="2020-01-01 : 2020-01-04",
+        time_offsets=["1 day ago", "1 year ago"],
+    )
+    df = pd.DataFrame(
+        {
+            "__timestamp": pd.date_range(datetime(2020, 1, 1), periods=3),
+            "sum__num": [1, 2, 3],
+        }
+    )
+
+    result = processor.processing_time_offsets(df, query_object)
+    assert result["queries"] == ["query from 2019-12-31", "query from 2019-01-01"]
+    assert result["cache_keys"] == [None, None]
+    assert result["df"].to_dict(orient="list") == {
+        "__timestamp": list(pd.date_range(datetime(2020, 1, 1), periods=3)),
+        "sum__num": [1, 2, 3],
+        "sum__num__1 day ago": [10, 20, 30],
+        "sum__num__1 year ago": [10, 20, 30],
+    }
+
+
+def test_get_data_csv_streaming(mocker: MockFixture, app_context: None):
+    """
+    Test that CSV data is streamed in chunks, unless it has to be post-processed.
+    """
+    from superset.common import query_context_processor
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    mocker.patch.dict(
+        query_context_processor.config,
+        {"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_CHUNK_SIZE": 2},
+    )
+    query_context = mocker.MagicMock()
+    query_context.result_format = ChartDataResultFormat.CSV
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.datasource.data = {"verbose_map": {}}
+    processor = QueryContextProcessor(query_context)
+    df = pd.DataFrame({"a": ["=x", "y", "z"]})
+
+    assert list(processor.get_data(df)) == ["a\n'=x\ny\n", "z\n"]
+
+    query_context.result_type = ChartDataResultType.POST_PROCESSED
+    assert processor.get_data(df) == "a\n'=x\ny\nz\n"
+
+
+def test_get_data_xlsx_streaming(mocker: MockFixture, app_context: None):
+    """
+    Test that XLSX data is streamed from a file, and that its size is reported.
+    """
+    from superset.common import query_context_processor
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    mocker.patch.dict(
+        query_context_processor.config,
+        {
+            "EXCEL_STREAMING_EXPORT": True,
+            "EXCEL_EXPORT_MAX_ROWS": None,
+            "EXCEL_EXPORT_MAX_BYTES": None,
+        },
+    )
+    stats_logger = mocker.patch.object(query_context_processor, "stats_logger")
+    query_context = mocker.MagicMock()
+    query_context.result_format = ChartDataResultFormat.XLSX
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.datasource.data = {"verbose_map": {}}
+    processor = QueryContextProcessor(query_context)
+
+    data = b"".join(processor.get_data(pd.DataFrame({"a": [1, 2, 3]})))
+    assert data.startswith(b"PK")
+    stats_logger.gauge.assert_any_call("excel_export.size", len(data))
+    stats_logger.gauge.assert_any_call("excel_export.rows", 3)
+
+    query_context.result_type = ChartDataResultType.POST_PROCESSED
+    assert isinstance(processor.get_data(pd.DataFrame({"a": [1, 2, 3]})), bytes)
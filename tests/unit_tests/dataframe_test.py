@@ -21,7 +21,7 @@ import pytest
 from pandas import Timestamp
 from pandas._libs.tslibs import NaT
 
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_json, df_to_records
 from superset.superset_typing import DbapiDescription
 
 
@@ -203,3 +203,48 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_df_to_records_big_integers() -> None:
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "int": np.array([1, 2**60, -(2**60)], dtype=np.int64),
+            "uint": np.array([1, 2, 2**63], dtype=np.uint64),
+            "object": [2**70, "a", None],
+        }
+    )
+    assert df_to_records(df) == [
+        {"int": 1, "uint": 1, "object": str(2**70)},
+        {"int": str(2**60), "uint": 2, "object": "a"},
+        {"int": str(-(2**60)), "uint": str(2**63), "object": None},
+    ]
+
+
+def test_df_to_json() -> None:
+    import numpy as np
+    import pandas as pd
+    import simplejson as json
+
+    from superset.utils.core import json_iso_dttm_ser
+
+    df = pd.DataFrame(
+        {
+            "int": [1, 2**60],
+            "float": [1.5, np.nan],
+            "bool": [True, False],
+            "str": ['say "hi"', "\U0001F600"],
+            "dttm": [Timestamp("2023-01-01"), NaT],
+            "nested": [[1, 2], {"a": 1}],
+        }
+    )
+
+    assert df_to_json(df) == json.dumps(
+        df_to_records(df),
+        default=json_iso_dttm_ser,
+        ignore_nan=True,
+        separators=(",", ":"),
+    )
+    assert df_to_json(df.iloc[:0]) == "[]"
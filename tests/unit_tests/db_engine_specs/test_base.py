@@ -16,10 +16,12 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel, protected-access
 
+from collections.abc import Iterator
 from textwrap import dedent
 from typing import Any, Optional
 
 import pytest
+from pytest_mock import MockFixture
 from sqlalchemy import types
 
 from superset.superset_typing import ResultSetColumnType, SQLAColumnType
@@ -168,3 +170,90 @@ def test_convert_inspector_columns(
     from superset.db_engine_specs.base import convert_inspector_columns
 
     assert convert_inspector_columns(cols) == expected_result
+
+
+@pytest.mark.parametrize(
+    "limit,expected",
+    [
+        (None, [[(0,), (1,)], [(2,), (3,)], [(4,)]]),
+        (3, [[(0,), (1,)], [(2,)]]),
+        (4, [[(0,), (1,)], [(2,), (3,)]]),
+    ],
+)
+def test_fetch_data_in_batches(
+    limit: Optional[int], expected: list[list[tuple[Any, ...]]]
+) -> None:
+    """
+    Test that results are fetched in batches, up to the limit.
+    """
+    import sqlite3
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    cursor = sqlite3.connect(":memory:").cursor()
+    cursor.execute(
+        "WITH RECURSIVE t(c) AS (SELECT 0 UNION ALL SELECT c + 1 FROM t WHERE c < 4) "
+        "SELECT c FROM t"
+    )
+
+    assert list(BaseEngineSpec.fetch_data_in_batches(cursor, 2, limit)) == expected
+
+
+def test_df_chunks_to_sql(mocker: MockFixture) -> None:
+    """
+    Test that the table is created from the first chunk, and the others appended.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_parse import Table
+
+    engine = create_engine("sqlite://")
+    engine.execute("CREATE TABLE t (a INTEGER)")
+    database = mocker.MagicMock()
+    database.get_sqla_engine_with_context.return_value.__enter__.return_value = engine
+
+    chunks = iter(
+        [
+            pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+            pd.DataFrame({"a": [3], "b": [None]}),
+        ]
+    )
+    BaseEngineSpec.df_chunks_to_sql(
+        database, Table("t"), chunks, {"if_exists": "replace", "index": False}
+    )
+
+    assert engine.execute("SELECT a, b FROM t").fetchall() == [
+        (1, "x"),
+        (2, "y"),
+        (3, None),
+    ]
+
+
+def test_df_chunks_to_sql_failure(mocker: MockFixture) -> None:
+    """
+    Test that the chunks are uploaded in a single transaction, so a chunk that fails
+    doesn't leave the table half loaded.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_parse import Table
+
+    engine = create_engine("sqlite://")
+    engine.execute("CREATE TABLE t (a INTEGER)")
+    database = mocker.MagicMock()
+    database.get_sqla_engine_with_context.return_value.__enter__.return_value = engine
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        yield pd.DataFrame({"a": [1, 2]})
+        raise ValueError("Invalid chunk")
+
+    with pytest.raises(ValueError):
+        BaseEngineSpec.df_chunks_to_sql(
+            database, Table("t"), chunks(), {"if_exists": "append", "index": False}
+        )
+
+    assert engine.execute("SELECT a FROM t").fetchall() == []
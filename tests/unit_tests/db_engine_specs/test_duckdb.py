@@ -19,6 +19,7 @@ from datetime import datetime
 from typing import Optional
 
 import pytest
+from pytest_mock import MockFixture
 
 from tests.unit_tests.db_engine_specs.utils import assert_convert_dttm
 from tests.unit_tests.fixtures.common import dttm
@@ -38,3 +39,31 @@ def test_convert_dttm(
     from superset.db_engine_specs.duckdb import DuckDBEngineSpec as spec
 
     assert_convert_dttm(spec, target_type, expected_result, dttm)
+
+
+def test_fetch_data_arrow(mocker: MockFixture) -> None:
+    """
+    Test that only the record batches needed for the limit are read.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    schema = pa.schema([("a", pa.int64())])
+    read = []
+
+    def batches():
+        for i in range(5):
+            read.append(i)
+            yield pa.record_batch([pa.array([2 * i, 2 * i + 1])], schema=schema)
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_record_batch.return_value = pa.RecordBatchReader.from_batches(
+        schema, batches()
+    )
+
+    table = DuckDBEngineSpec.fetch_data_arrow(cursor, 3)
+
+    assert table.to_pydict() == {"a": [0, 1, 2]}
+    assert read == [0, 1]
+    cursor.fetch_arrow_table.assert_not_called()
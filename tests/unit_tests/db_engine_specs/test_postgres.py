@@ -173,3 +173,54 @@ SELECT * FROM some_table;
         str(excinfo.value)
         == "Users are not allowed to set a search path for security reasons."
     )
+
+
+def test_get_df_to_sql_method(mocker: MockFixture) -> None:
+    """
+    Test that uploads use ``COPY`` with psycopg2 only.
+    """
+    from superset.db_engine_specs.postgres import copy_from_stdin, PostgresEngineSpec
+
+    engine = mocker.MagicMock()
+    engine.dialect.name = "postgresql"
+    engine.dialect.driver = "psycopg2"
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) is copy_from_stdin
+
+    engine.dialect.driver = "pg8000"
+    engine.dialect.supports_multivalues_insert = True
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) == "multi"
+
+
+def test_copy_from_stdin(mocker: MockFixture) -> None:
+    """
+    Test that rows are sent in the text format of ``COPY``.
+    """
+    from sqlalchemy.dialects.postgresql import dialect
+
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    table = mocker.MagicMock()
+    table.name = "my table"
+    table.schema = "public"
+    conn = mocker.MagicMock()
+    conn.dialect = dialect()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    copied = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(
+        (sql, buffer.read())
+    )
+
+    rows = copy_from_stdin(
+        table,
+        conn,
+        ["a", "b"],
+        iter([(1, "tab\there"), (None, "back\\slash\nnewline")]),
+    )
+
+    assert rows == 2
+    assert copied == [
+        (
+            'COPY public."my table" (a, b) FROM STDIN',
+            "1\ttab\\there\n\\N\tback\\\\slash\\nnewline\n",
+        )
+    ]
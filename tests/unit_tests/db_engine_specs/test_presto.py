@@ -21,6 +21,7 @@ from unittest import mock
 import pytest
 import pytz
 from pyhive.sqlalchemy_presto import PrestoDialect
+from pytest_mock import MockerFixture
 from sqlalchemy import sql, text, types
 from sqlalchemy.engine.url import make_url
 
@@ -151,3 +152,136 @@ def test_where_latest_partition(
     )
 
     assert str(actual) == expected
+
+
+def test_latest_partition_cached(app_context: None) -> None:
+    """
+    Test that the latest partition is only looked up once per table.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.presto import PrestoEngineSpec as spec
+    from superset.extensions import partition_cache
+
+    database = mock.MagicMock(id=1)
+    database.get_indexes.return_value = [{"column_names": ["ds"]}]
+    database.get_extra.return_value = {}
+    database.get_df.return_value = pd.DataFrame({"ds": ["2023-05-01"]})
+
+    assert spec.latest_partition("table", "schema", database) == (
+        ["ds"],
+        ("2023-05-01",),
+    )
+    assert spec.latest_partition("table", "schema", database, show_first=True) == (
+        ["ds"],
+        ("2023-05-01",),
+    )
+    database.get_df.assert_called_once()
+
+    database.get_df.return_value = pd.DataFrame({"ds": ["2023-05-02"]})
+    partition_cache.invalidate(1, "schema", "table")
+    assert spec.latest_partition("table", "schema", database) == (
+        ["ds"],
+        ("2023-05-02",),
+    )
+    partition_cache.invalidate(1)
+
+
+@pytest.mark.parametrize(
+    "app",
+    [{"DATA_CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"}}],
+    indirect=True,
+)
+def test_latest_partition_shared_cache(app_context: None) -> None:
+    """
+    Test that a process missing its partition cache reuses the latest partition
+    memoized in the data cache.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.presto import PrestoEngineSpec as spec
+    from superset.extensions import cache_manager, partition_cache
+
+    database = mock.MagicMock(id=1)
+    database.get_indexes.return_value = [{"column_names": ["ds"]}]
+    database.get_extra.return_value = {}
+    database.get_df.return_value = pd.DataFrame({"ds": ["2023-05-01"]})
+
+    assert spec.latest_partition("table", "schema", database) == (
+        ["ds"],
+        ("2023-05-01",),
+    )
+    # as if another process looked up the same table
+    partition_cache.invalidate(1)
+    assert spec.latest_partition("table", "schema", database) == (
+        ["ds"],
+        ("2023-05-01",),
+    )
+    database.get_df.assert_called_once()
+    partition_cache.invalidate(1)
+    cache_manager.data_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        {
+            "PRESTO_ADAPTIVE_POLLING": True,
+            "PRESTO_POLL_INTERVAL": 1,
+            "PRESTO_POLL_MAX_INTERVAL": 4,
+            "PRESTO_PROGRESS_UPDATE_INTERVAL": 60,
+            "PRESTO_PROGRESS_UPDATE_DELTA": 10,
+        }
+    ],
+    indirect=True,
+)
+def test_handle_cursor_adaptive_polling(
+    mocker: MockerFixture, app_context: None
+) -> None:
+    """
+    Test that polls back off while the query isn't making progress, and that small
+    progress changes aren't written.
+    """
+    from superset.common.db_query_status import QueryStatus
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+
+    sleep = mocker.patch("superset.db_engine_specs.presto.time.sleep")
+    mocker.patch.object(PrestoEngineSpec, "get_tracking_url", return_value=None)
+    query = mocker.MagicMock(
+        id=1, progress=0, status=QueryStatus.RUNNING, database=mocker.MagicMock()
+    )
+    query.database.connect_args = {}
+    session = mocker.MagicMock()
+    session.query().filter_by().one.return_value = query
+
+    progress = []
+
+    def poll(completed_splits: int) -> dict[str, Any]:
+        return {
+            "stats": {
+                "state": "RUNNING",
+                "completedSplits": completed_splits,
+                "totalSplits": 100,
+            }
+        }
+
+    def record_progress() -> None:
+        progress.append(query.progress)
+
+    session.commit.side_effect = record_progress
+    cursor = mocker.MagicMock()
+    cursor.poll.side_effect = [
+        poll(1),
+        poll(1),
+        poll(1),
+        poll(1),
+        poll(1),
+        poll(5),
+        poll(20),
+        None,
+    ]
+
+    PrestoEngineSpec.handle_cursor(cursor, query, session)
+
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4, 4, 4, 1, 1]
+    assert progress == [0, 0, 0, 0, 0, 0, 20]
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import Mock
+
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import NullPool
+
+from superset.extensions.engine_registry import EngineRegistry, InstrumentedQueuePool
+
+
+def get_registry(max_engines: int = 10) -> EngineRegistry:
+    app = Mock()
+    app.config = {
+        "DATABASE_ENGINE_POOLING": True,
+        "DATABASE_ENGINE_POOL_PARAMS": {"pool_size": 2, "max_overflow": 0},
+        "DATABASE_ENGINE_POOL_MAX_ENGINES": max_engines,
+        "STATS_LOGGER": Mock(),
+    }
+    registry = EngineRegistry()
+    registry.init_app(app)
+    return registry
+
+
+def test_get_engine_reuses_engines() -> None:
+    """
+    Test that engines are reused for the same URL and parameters.
+    """
+    registry = get_registry()
+    url = make_url("sqlite://")
+
+    engine = registry.get_engine(1, url, {})
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == 2
+    assert registry.get_engine(1, url, {}) is engine
+    assert registry.get_engine(2, url, {}) is not engine
+    assert registry.get_engine(1, url, {"connect_args": {"a": 1}}) is not engine
+
+    # parameters configured for the database take precedence over the defaults
+    engine = registry.get_engine(1, url, {"pool_size": 3})
+    assert engine.pool.size() == 3
+
+
+def test_dispose() -> None:
+    """
+    Test that the engines of a database are disposed when it changes.
+    """
+    registry = get_registry()
+    url = make_url("sqlite://")
+    engine = registry.get_engine(1, url, {})
+    other = registry.get_engine(2, url, {})
+
+    registry.database_after_change(Mock(), Mock(), Mock(id=1))
+    assert registry.get_engine(1, url, {}) is not engine
+    assert registry.get_engine(2, url, {}) is other
+
+
+def test_max_engines() -> None:
+    """
+    Test that the least recently used engines are evicted.
+    """
+    registry = get_registry(max_engines=2)
+    url = make_url("sqlite://")
+    first = registry.get_engine(1, url, {})
+    second = registry.get_engine(2, url, {})
+    assert registry.get_engine(1, url, {}) is first
+
+    registry.get_engine(3, url, {})
+    assert registry.get_engine(1, url, {}) is first
+    assert registry.get_engine(2, url, {}) is not second
+
+
+def test_checkout_metrics() -> None:
+    """
+    Test that checkouts are reported to the stats logger.
+    """
+    registry = get_registry()
+    engine = registry.get_engine(1, make_url("sqlite://"), {})
+
+    with engine.connect():
+        pass
+
+    stats_logger = InstrumentedQueuePool.stats_logger
+    stats_logger.incr.assert_called_with("engine_pool.connect")
+    assert stats_logger.timing.call_args[0][0] == "engine_pool.checkout_wait"
+    stats_logger.gauge.assert_called_with("engine_pool.checked_out", 1)
+
+
+def test_get_engine_not_pooled() -> None:
+    """
+    Test that engines of unsaved databases, or with parameters that can't be
+    serialized, aren't pooled.
+    """
+    registry = get_registry()
+    url = make_url("sqlite://")
+    params = {"connect_args": {"factory": object()}}
+
+    engine = registry.get_engine(None, url, {})
+    assert isinstance(engine.pool, NullPool)
+    assert registry.get_engine(None, url, {}) is not engine
+
+    engine = registry.get_engine(1, url, params)
+    assert isinstance(engine.pool, NullPool)
+    assert registry.get_engine(1, url, params) is not engine
+    assert not registry._engines  # pylint: disable=protected-access
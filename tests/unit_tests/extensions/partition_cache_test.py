@@ -0,0 +1,187 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from unittest.mock import Mock
+
+import pytest
+from freezegun import freeze_time
+
+from superset.extensions.partition_cache import PartitionCache
+
+
+def get_cache(timeout: int = 60, max_entries: int = 10) -> PartitionCache:
+    app = Mock()
+    app.config = {
+        "PARTITION_CACHE_TIMEOUT": timeout,
+        "PARTITION_CACHE_MAX_ENTRIES": max_entries,
+        "STATS_LOGGER": Mock(),
+    }
+    cache = PartitionCache()
+    cache.init_app(app)
+    return cache
+
+
+def test_get() -> None:
+    """
+    Test that lookups are cached per database, schema, table and lookup.
+    """
+    cache = get_cache()
+    database = Mock(id=1)
+    load = Mock(return_value=["2023-01-01"])
+
+    assert cache.get(database, "schema", "table", "latest", load) == ["2023-01-01"]
+    assert cache.get(database, "schema", "table", "latest", load) == ["2023-01-01"]
+    assert load.call_count == 1
+
+    cache.get(Mock(id=2), "schema", "table", "latest", load)
+    cache.get(database, "other", "table", "latest", load)
+    cache.get(database, "schema", "other", "latest", load)
+    cache.get(database, "schema", "table", "other", load)
+    assert load.call_count == 5
+    cache.stats_logger.incr.assert_any_call("partition_cache.hit")
+
+
+def test_get_expired() -> None:
+    """
+    Test that lookups are cached for ``PARTITION_CACHE_TIMEOUT`` seconds.
+    """
+    cache = get_cache(timeout=60)
+    database = Mock(id=1)
+    load = Mock(return_value=["2023-01-01"])
+
+    with freeze_time("2023-01-01 00:00:00") as frozen:
+        cache.get(database, "schema", "table", "latest", load)
+        frozen.tick(59)
+        cache.get(database, "schema", "table", "latest", load)
+        assert load.call_count == 1
+        frozen.tick(2)
+        cache.get(database, "schema", "table", "latest", load)
+        assert load.call_count == 2
+
+
+def test_get_disabled() -> None:
+    """
+    Test that nothing is cached when the cache is disabled or the database unsaved.
+    """
+    load = Mock(return_value=["2023-01-01"])
+
+    cache = get_cache(timeout=0)
+    cache.get(Mock(id=1), "schema", "table", "latest", load)
+    cache.get(Mock(id=1), "schema", "table", "latest", load)
+    assert load.call_count == 2
+
+    cache = get_cache()
+    cache.get(Mock(id=None), "schema", "table", "latest", load)
+    cache.get(Mock(id=None), "schema", "table", "latest", load)
+    assert load.call_count == 4
+
+
+def test_get_error() -> None:
+    """
+    Test that failed lookups aren't cached.
+    """
+    cache = get_cache()
+    database = Mock(id=1)
+    load = Mock(side_effect=[Exception("error"), ["2023-01-01"]])
+
+    with pytest.raises(Exception, match="error"):
+        cache.get(database, "schema", "table", "latest", load)
+    assert cache.get(database, "schema", "table", "latest", load) == ["2023-01-01"]
+
+
+def test_get_concurrent() -> None:
+    """
+    Test that concurrent lookups of the same key run a single query.
+    """
+    cache = get_cache()
+    database = Mock(id=1)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load() -> list[str]:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["2023-01-01"]
+
+    results: list[list[str]] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get(database, "schema", "table", "latest", load)
+            )
+        )
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [["2023-01-01"]] * 5
+
+
+def test_invalidate() -> None:
+    """
+    Test invalidating the lookups of a database, schema or table.
+    """
+    cache = get_cache()
+    database = Mock(id=1)
+    load = Mock(return_value=["2023-01-01"])
+    for schema, table in [("a", "t1"), ("a", "t2"), ("b", "t1")]:
+        cache.get(database, schema, table, "latest", load)
+    cache.get(Mock(id=2), "a", "t1", "latest", load)
+    assert load.call_count == 4
+
+    cache.invalidate(1, "a", "t1")
+    cache.get(database, "a", "t1", "latest", load)
+    cache.get(database, "a", "t2", "latest", load)
+    assert load.call_count == 5
+
+    cache.invalidate(1, "a")
+    cache.get(database, "a", "t2", "latest", load)
+    cache.get(database, "b", "t1", "latest", load)
+    assert load.call_count == 6
+
+    cache.database_after_change(Mock(), Mock(), database)
+    cache.get(database, "b", "t1", "latest", load)
+    cache.get(Mock(id=2), "a", "t1", "latest", load)
+    assert load.call_count == 7
+
+
+def test_max_entries() -> None:
+    """
+    Test that the least recently used lookups are evicted.
+    """
+    cache = get_cache(max_entries=2)
+    database = Mock(id=1)
+    load = Mock(return_value=["2023-01-01"])
+    cache.get(database, "schema", "t1", "latest", load)
+    cache.get(database, "schema", "t2", "latest", load)
+    cache.get(database, "schema", "t1", "latest", load)
+    cache.get(database, "schema", "t3", "latest", load)
+    assert load.call_count == 3
+
+    cache.get(database, "schema", "t1", "latest", load)
+    assert load.call_count == 3
+    cache.get(database, "schema", "t2", "latest", load)
+    assert load.call_count == 4
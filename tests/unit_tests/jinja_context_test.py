@@ -153,3 +153,73 @@ SELECT 1
 -- end
 ) AS dataset_1"""
     )
+
+
+def test_compiled_template_cache(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that templates are compiled once and evicted in LRU order.
+    """
+    # pylint: disable=import-outside-toplevel
+    from jinja2.sandbox import SandboxedEnvironment
+
+    from superset.jinja_context import CompiledTemplateCache
+
+    environment = SandboxedEnvironment()
+    from_string = mocker.spy(environment, "from_string")
+    cache = CompiledTemplateCache(environment, max_size=2)
+
+    template = cache.get("SELECT {{ 1 + 1 }}")
+    assert template.render() == "SELECT 2"
+    assert cache.get("SELECT {{ 1 + 1 }}") is template
+    cache.get("SELECT {{ 2 }}")
+    cache.get("SELECT {{ 3 }}")
+    assert cache.get("SELECT {{ 2 }}") is not None
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # the least recently used template was evicted
+    assert cache.get("SELECT {{ 1 + 1 }}") is not template
+    assert from_string.call_count == 4
+
+
+def test_template_processor_uses_cache(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that template processors share the compiled templates.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.jinja_context import get_template_cache, JinjaTemplateProcessor
+
+    database = mocker.MagicMock()
+    sql = "SELECT * FROM t WHERE a IN {{ [1, 2] | where_in }}"
+    first = JinjaTemplateProcessor(database=database)
+    second = JinjaTemplateProcessor(database=database)
+    misses = get_template_cache().misses
+
+    assert first.process_template(sql) == "SELECT * FROM t WHERE a IN (1, 2)"
+    assert second.process_template(sql) == "SELECT * FROM t WHERE a IN (1, 2)"
+    assert get_template_cache().misses == misses + 1
+
+
+def test_template_processor_custom_environment(
+    mocker: MockFixture, app_context: None
+) -> None:
+    """
+    Test that a processor customizing its environment doesn't change the one of
+    the other processors.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.jinja_context import get_template_cache, JinjaTemplateProcessor
+
+    database = mocker.MagicMock()
+    sql = "SELECT {{ answer | default('none') }}"
+    custom = JinjaTemplateProcessor(database=database)
+    custom._env.globals["answer"] = 42
+    custom._env.filters["where_in"] = lambda values: "custom"
+    other = JinjaTemplateProcessor(database=database)
+
+    assert custom.process_template(sql) == "SELECT 42"
+    assert other.process_template(sql) == "SELECT none"
+    assert (
+        custom.process_template("{{ [1] | where_in }}") == "custom"
+        and other.process_template("{{ [1] | where_in }}") == "(1)"
+    )
+    assert "answer" not in get_template_cache().environment.globals
@@ -230,3 +230,25 @@ def test_get_prequeries(mocker: MockFixture) -> None:
         conn.cursor().execute.assert_has_calls(
             [mocker.call("set a=1"), mocker.call("set b=2")]
         )
+
+
+def test_get_sqla_engine_pooled(mocker: MockFixture) -> None:
+    """
+    Test that pooled engines are used when enabled, except through SSH tunnels.
+    """
+    from sqlalchemy.pool import NullPool
+
+    engine_registry = mocker.patch("superset.models.core.engine_registry")
+    engine_registry.enabled = True
+
+    database = Database(id=1, database_name="db", sqlalchemy_uri="sqlite://")
+    engine = database._get_sqla_engine()
+    assert engine is engine_registry.get_engine.return_value
+    engine_registry.get_engine.assert_called_with(1, mocker.ANY, {})
+
+    engine = database._get_sqla_engine(pooled=False)
+    assert isinstance(engine.pool, NullPool)
+
+    engine_registry.enabled = False
+    engine = database._get_sqla_engine()
+    assert isinstance(engine.pool, NullPool)
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, protected-access
+import json
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockFixture
+
+
+def get_report_state(mocker: MockFixture) -> Any:
+    from superset.reports.commands.execute import BaseReportState
+
+    report_schedule = mocker.MagicMock(
+        chart_id=1,
+        force_screenshot=False,
+        chart=mocker.MagicMock(
+            query_context=json.dumps({"queries": [{}]}),
+            params=json.dumps({"viz_type": "echarts_timeseries_line"}),
+        ),
+    )
+    mocker.patch("superset.reports.commands.execute.get_executor").return_value = (
+        None,
+        "admin",
+    )
+    mocker.patch(
+        "superset.reports.commands.execute.security_manager", new=mocker.MagicMock()
+    )
+    return BaseReportState(mocker.MagicMock(), report_schedule, datetime.now(), uuid4())
+
+
+@pytest.mark.parametrize(
+    "app", [{"ALERT_REPORTS_IN_PROCESS_DATA": True}], indirect=True
+)
+def test_get_csv_data_in_process(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the CSV of a report is generated in-process from the saved query
+    context, without requesting the chart data API.
+    """
+    state = get_report_state(mocker)
+    get_chart_csv_data = mocker.patch(
+        "superset.reports.commands.execute.get_chart_csv_data"
+    )
+    schema = mocker.patch(
+        "superset.reports.commands.execute.ChartDataQueryContextSchema"
+    )
+    command = mocker.patch("superset.reports.commands.execute.ChartDataCommand")
+    command.return_value.run.return_value = {
+        "queries": [{"result_format": "csv", "data": "a,b\n1,2\n"}]
+    }
+
+    assert state._get_csv_data() == b"a,b\n1,2\n"
+    get_chart_csv_data.assert_not_called()
+    json_body = schema.return_value.load.call_args.args[0]
+    assert json_body["result_format"] == "csv"
+    assert json_body["result_type"] == "post_processed"
+    assert json_body["force"] is False
+
+    # multiple queries are bundled in a zip file
+    command.return_value.run.return_value = {
+        "queries": [
+            {"result_format": "csv", "data": "a\n1\n"},
+            {"result_format": "csv", "data": "b\n2\n"},
+        ]
+    }
+    assert state._get_csv_data().startswith(b"PK")
+
+
+@pytest.mark.parametrize(
+    "app", [{"ALERT_REPORTS_IN_PROCESS_DATA": True}], indirect=True
+)
+def test_get_embedded_data_in_process(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the embedded table of a report is built from the in-process result.
+    """
+    from superset.utils.core import GenericDataType
+
+    state = get_report_state(mocker)
+    mocker.patch("superset.reports.commands.execute.ChartDataQueryContextSchema")
+    command = mocker.patch("superset.reports.commands.execute.ChartDataCommand")
+    command.return_value.run.return_value = {
+        "queries": [
+            {
+                "result_format": "json",
+                "data": [{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+                "colnames": ["name", "value"],
+                "indexnames": [0, 1],
+                "coltypes": [GenericDataType.STRING, GenericDataType.NUMERIC],
+            }
+        ]
+    }
+
+    df = state._get_embedded_data()
+    assert list(df.columns) == [("name",), ("value",)]
+    assert df[("value",)].tolist() == [1, 2]
+
+
+def test_get_artifact(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the content of reports executed as a group is rendered once, and that
+    failures aren't shared.
+    """
+    from flask import g
+
+    from superset.reports.models import ReportScheduleType
+
+    state = get_report_state(mocker)
+    state._report_schedule.type = ReportScheduleType.REPORT
+    state._report_schedule.extra = {}
+    generate = mocker.MagicMock(side_effect=[ValueError(), [b"image"]])
+
+    g.report_artifacts = {}
+    with pytest.raises(ValueError):
+        state._get_artifact("screenshots", generate)
+    assert state._get_artifact("screenshots", generate) == [b"image"]
+    assert state._get_artifact("screenshots", generate) == [b"image"]
+    assert generate.call_count == 2
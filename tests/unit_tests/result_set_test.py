@@ -140,3 +140,161 @@ def test_stringify_with_null_timestamps():
     )
 
     assert np.array_equal(result_set, expected)
+
+
+def test_arrow_type_hints() -> None:
+    """
+    Test that the engine spec type hints are used when building the columns, and
+    that values not matching the hint fall back to type inference.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, 1.5, "a", True), (None, 2.0, None, 1)]
+    description = [
+        ("int_col", 23, None, None, None, None, None),
+        ("float_col", 701, None, None, None, None, None),
+        ("str_col", 1043, None, None, None, None, None),
+        ("mixed_col", 1043, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(data, description, PostgresEngineSpec)  # type: ignore
+
+    assert result_set.table.schema.types == [
+        pa.int64(),
+        pa.float64(),
+        pa.string(),
+        pa.string(),
+    ]
+    assert result_set.to_pandas_df().to_dict("list") == {
+        "int_col": [1, None],
+        "float_col": [1.5, 2.0],
+        "str_col": ["a", None],
+        "mixed_col": ["True", "1"],
+    }
+
+
+def test_arrow_table() -> None:
+    """
+    Test that a native Arrow result from the driver is used as-is.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    table = pa.table({"a": [1, 2], "b": [[1, 2], [3]]})
+    description = [("a", "INT"), ("a", "ARRAY")]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert [column["name"] for column in result_set.columns] == ["a", "a__1"]
+    assert result_set.to_pandas_df().to_dict("list") == {
+        "a": [1, 2],
+        "a__1": ["[1, 2]", "[3]"],
+    }
+
+
+def test_stringify_mixed_types() -> None:
+    """
+    Test that each type in a mixed column is serialized the same way as before:
+    sequences as JSON and everything else through ``str``.
+    """
+    from superset.result_set import to_object_array
+
+    array = to_object_array(
+        [
+            [1, {"a": None}],
+            ("b", 2),
+            {"c": 3},
+            b"bytes",
+            "é".encode(),
+            1.5,
+            pd.NA,
+            None,
+        ]
+    )
+
+    assert stringify_values(array).tolist() == [
+        '[1, {"a": null}]',
+        '["b", 2]',
+        "{'c': 3}",
+        "bytes",
+        '"\\u00e9"',
+        "1.5",
+        None,
+        None,
+    ]
+
+
+def test_from_batches() -> None:
+    """
+    Test building a result set from batches where the types inferred for a column
+    differ between batches.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    batches = [
+        [(1, None, 1), (2, None, 2)],
+        [(3, "a", "b")],
+        [(4, "b", [1])],
+    ]
+    description = [("a", "INT"), ("b", "VARCHAR"), ("c", "VARCHAR")]
+    result_set = SupersetResultSet.from_batches(
+        batches, description, BaseEngineSpec  # type: ignore
+    )
+
+    assert result_set.size == 4
+    assert result_set.to_pandas_df().to_dict("list") == {
+        "a": [1, 2, 3, 4],
+        "b": [None, None, "a", "b"],
+        "c": ["1", "2", "b", "[1]"],
+    }
+
+    result_set = SupersetResultSet.from_batches(
+        [], description, BaseEngineSpec  # type: ignore
+    )
+    assert result_set.size == 0
+
+
+def test_from_batches_promote_types() -> None:
+    """
+    Test that types that differ between batches are promoted to a common type, like
+    the type inferred when all the values are in the same batch.
+    """
+    from decimal import Decimal
+
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    batches = [
+        [(1, Decimal("1.5"), 1, None)],
+        [(2, Decimal("1234.56"), 2**40, Decimal("1.5"))],
+        [(2.5, None, 3, None)],
+    ]
+    description = [("a", "FLOAT"), ("b", "DECIMAL"), ("c", "INT"), ("d", "DECIMAL")]
+    batched = SupersetResultSet.from_batches(
+        batches, description, BaseEngineSpec  # type: ignore
+    )
+    unbatched = SupersetResultSet(
+        [row for batch in batches for row in batch],
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert batched.pa_table.schema == unbatched.pa_table.schema
+    assert batched.pa_table.schema.types == [
+        pa.float64(),
+        pa.decimal128(6, 2),
+        pa.int64(),
+        pa.decimal128(2, 1),
+    ]
+    assert batched.to_pandas_df().to_dict("list") == {
+        "a": [1.0, 2.0, 2.5],
+        "b": [Decimal("1.50"), Decimal("1234.56"), None],
+        "c": [1, 2**40, 3],
+        "d": [None, Decimal("1.5"), None],
+    }
@@ -17,6 +17,7 @@
 
 import pytest
 from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
 
 from superset.exceptions import SupersetSecurityException
 from superset.extensions import appbuilder
@@ -88,3 +89,211 @@ def test_raise_for_access_query_default_schema(
         == """You need access to the following tables: `public.ab_user`,
             `all_database_access` or `all_datasource_access` permission"""
     )
+
+
+def test_get_rls_filters_cached(
+    mocker: MockFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the RLS filters are resolved once per request, and that they're
+    invalidated when a filter changes.
+    """
+    from flask import g
+    from flask_appbuilder.security.sqla.models import Role
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
+    from superset.extensions import security_manager
+    from superset.models.core import Database
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    engine = session.get_bind()
+    RowLevelSecurityFilter.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="role")
+    table = SqlaTable(
+        table_name="my_table",
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="filter",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add(rls_filter)
+    session.flush()
+
+    g.user = mocker.MagicMock()
+    mocker.patch.object(security_manager, "get_user_roles", return_value=[role])
+    query_rls_filters = mocker.spy(security_manager, "_query_rls_filters")
+
+    assert [f.clause for f in security_manager.get_rls_filters(table)] == ["a = 1"]
+    assert [f.clause for f in security_manager.get_rls_filters(table)] == ["a = 1"]
+    assert query_rls_filters.call_count == 1
+
+    # changing only the tables of the filter invalidates the filters
+    rls_filter.tables = []
+    session.flush()
+    assert security_manager.get_rls_filters(table) == []
+    assert query_rls_filters.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        {
+            "RLS_FILTERS_CACHE_TIMEOUT": 60,
+            "CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"},
+        }
+    ],
+    indirect=True,
+)
+def test_get_rls_filters_shared_cache(
+    mocker: MockFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the RLS filters are shared across requests through the cache, and
+    that changing a filter invalidates them.
+    """
+    from flask import g
+
+    from superset.extensions import security_manager
+
+    g.user = mocker.MagicMock()
+    role = mocker.MagicMock(id=1)
+    table = mocker.MagicMock(id=2)
+    mocker.patch.object(security_manager, "get_user_roles", return_value=[role])
+    query_rls_filters = mocker.patch.object(
+        security_manager, "_query_rls_filters", return_value=[(1, None, "a = 1")]
+    )
+
+    assert security_manager.get_rls_filters(table) == [(1, None, "a = 1")]
+    # a new request
+    g.pop("rls_filters")
+    assert security_manager.get_rls_filters(table) == [(1, None, "a = 1")]
+    query_rls_filters.assert_called_once_with([1], 2)
+
+    security_manager.rls_filters_after_change(None, None, None)  # type: ignore
+    assert security_manager.get_rls_filters(table) == [(1, None, "a = 1")]
+    assert query_rls_filters.call_count == 2
+
+    # what was cached before the change was committed is stale
+    g.pop("rls_filters")
+    security_manager.get_session().commit()
+    assert security_manager.get_rls_filters(table) == [(1, None, "a = 1")]
+    assert query_rls_filters.call_count == 3
+
+
+def test_user_view_menu_names_cached(
+    mocker: MockFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the view menus of a user are resolved once per request, that
+    ``can_access`` is evaluated against them, and that they're invalidated when the
+    roles of the user change.
+    """
+    from flask import g
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        Role,
+        User,
+        ViewMenu,
+    )
+
+    from superset.extensions import security_manager
+
+    engine = session.get_bind()
+    User.metadata.create_all(engine)  # pylint: disable=no-member
+
+    pvm = PermissionView(
+        permission=Permission(name="database_access"),
+        view_menu=ViewMenu(name="[my_db].(id:1)"),
+    )
+    role = Role(name="role", permissions=[pvm])
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        username="alice",
+        email="alice@example.org",
+        roles=[role],
+    )
+    session.add(user)
+    session.flush()
+
+    g.user = user
+    query_view_menu_names = mocker.spy(security_manager, "_query_view_menu_names")
+
+    assert security_manager.user_view_menu_names("database_access") == {
+        "[my_db].(id:1)"
+    }
+    assert security_manager.can_access("database_access", "[my_db].(id:1)")
+    assert not security_manager.can_access("database_access", "[other].(id:2)")
+    assert security_manager.get_accessible_databases() == [1]
+    assert query_view_menu_names.call_count == 1
+
+    # changing only the permissions of the role invalidates the view menus
+    role.permissions = []
+    session.flush()
+    assert not security_manager.can_access("database_access", "[my_db].(id:1)")
+    assert query_view_menu_names.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        {
+            "PERMISSIONS_CACHE_TIMEOUT": 60,
+            "CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"},
+        }
+    ],
+    indirect=True,
+)
+def test_user_view_menu_names_shared_cache(
+    mocker: MockFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the view menus of a user are shared across requests through the
+    cache, and that changing permissions invalidates them.
+    """
+    from flask import g
+
+    from superset.extensions import security_manager
+
+    g.user = mocker.MagicMock(id=1, is_anonymous=False)
+    query_view_menu_names = mocker.patch.object(
+        security_manager,
+        "_query_view_menu_names",
+        return_value=frozenset({"[my_db].(id:1)"}),
+    )
+
+    assert security_manager.user_view_menu_names("database_access") == {
+        "[my_db].(id:1)"
+    }
+    # a new request
+    g.pop("user_view_menu_names")
+    assert security_manager.user_view_menu_names("database_access") == {
+        "[my_db].(id:1)"
+    }
+    query_view_menu_names.assert_called_once_with(1, "database_access")
+
+    security_manager.permissions_after_change(None, None, None)  # type: ignore
+    assert security_manager.user_view_menu_names("database_access") == {
+        "[my_db].(id:1)"
+    }
+    assert query_view_menu_names.call_count == 2
+
+    # what was cached before the change was committed is stale
+    g.pop("user_view_menu_names")
+    security_manager.get_session().commit()
+    assert security_manager.user_view_menu_names("database_access") == {
+        "[my_db].(id:1)"
+    }
+    assert query_view_menu_names.call_count == 3
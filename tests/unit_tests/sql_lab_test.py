@@ -39,6 +39,7 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     database.apply_limit_to_sql.return_value = "SELECT 42 AS answer LIMIT 2"
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
@@ -81,6 +82,7 @@ def test_execute_sql_statement_with_rls(
     )
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
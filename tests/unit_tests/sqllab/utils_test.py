@@ -0,0 +1,48 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import pyarrow as pa
+import pytest
+
+from superset.sqllab.utils import read_results_table, write_results_table
+
+
+@pytest.mark.parametrize("data_format", ["arrow", "parquet"])
+@pytest.mark.parametrize("compression", ["zstd", "lz4", None])
+def test_results_table_roundtrip(data_format: str, compression: str) -> None:
+    """
+    Test that the results data can be read back in full or partially.
+    """
+    table = pa.table({"a": list(range(100_000)), "b": [str(i) for i in range(100_000)]})
+    blob = write_results_table(table, data_format, compression)
+
+    assert read_results_table(blob, data_format).equals(table)
+    assert read_results_table(blob, data_format, rows=70_000).equals(
+        table.slice(0, 70_000)
+    )
+    assert read_results_table(blob, data_format, rows=0).num_rows == 0
+
+
+def test_results_table_invalid_format() -> None:
+    """
+    Test that unknown formats are rejected.
+    """
+    with pytest.raises(ValueError):
+        write_results_table(pa.table({"a": [1]}), "csv")
+    with pytest.raises(ValueError):
+        read_results_table(b"", "csv")
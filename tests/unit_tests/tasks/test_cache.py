@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
+
+
+def test_warm_up_in_process(
+    mocker: MockFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the in-process warm up dedupes charts by cache key, skips fresh charts
+    and warms up the most viewed charts first, in at most
+    `CACHE_WARMUP_MAX_WORKERS_PER_DATABASE` lanes per database.
+    """
+    from superset.models.core import Log
+    from superset.models.slice import Slice
+    from superset.tasks import cache
+
+    Slice.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    for chart_id, viz_type in [(1, "echarts_timeseries"), (2, "table"), (3, "pie")]:
+        session.add(
+            Slice(
+                id=chart_id,
+                slice_name=f"chart {chart_id}",
+                viz_type=viz_type,
+                datasource_type="table",
+            )
+        )
+    # chart 3 is the most viewed
+    for chart_id in [3, 3, 2]:
+        session.add(Log(slice_id=chart_id, dttm=datetime.now()))
+    session.flush()
+
+    mocker.patch.object(
+        cache,
+        "get_cache_keys",
+        side_effect=lambda chart: {1: ["a"], 2: ["b"], 3: ["c"]}[chart.id],
+    )
+    mocker.patch.object(
+        cache.QueryCacheManager,
+        "has",
+        side_effect=lambda key, region: key == "a",
+    )
+    command = mocker.patch.object(cache, "ChartWarmUpCacheCommand")
+    command.return_value.run.return_value = {"viz_error": None}
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(
+        cache.app.config,
+        {"STATS_LOGGER": stats_logger, "CACHE_WARMUP_MAX_WORKERS_PER_DATABASE": 1},
+    )
+    parallel_map = mocker.spy(cache, "parallel_map")
+
+    results = cache.warm_up_in_process(
+        [
+            {"chart_id": 1, "dashboard_id": 1},
+            {"chart_id": 2, "dashboard_id": 1},
+            {"chart_id": 3, "dashboard_id": 1},
+            {"chart_id": 3, "dashboard_id": 2},
+            {"chart_id": 4},
+        ],
+        None,
+    )
+
+    assert results == {
+        "warmed": ['{"chart_id": 3}', '{"chart_id": 2}'],
+        "skipped": ['{"chart_id": 1}'],
+        "errors": ['{"chart_id": 4}'],
+    }
+    assert {call.args for call in command.call_args_list} == {
+        (3, None, None),
+        (2, None, None),
+    }
+    # the charts of a database share a single lane
+    assert [list(lane) for lane in parallel_map.call_args.args[1]] == [
+        [{"chart_id": 3}, {"chart_id": 2}]
+    ]
+    stats_logger.gauge.assert_any_call("cache_warmup.hits", 1)
+    stats_logger.gauge.assert_any_call("cache_warmup.misses", 2)
+    stats_logger.gauge.assert_any_call("cache_warmup.errors", 1)
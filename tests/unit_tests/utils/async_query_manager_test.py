@@ -0,0 +1,79 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+
+from pytest_mock import MockerFixture
+
+from superset.utils.async_query_manager import AsyncQueryManager
+
+
+def get_async_query_manager(mocker: MockerFixture) -> AsyncQueryManager:
+    manager = AsyncQueryManager()
+    manager._redis = mocker.MagicMock()
+    manager._stream_prefix = "async-events-"
+    manager._stream_limit = 1000
+    manager._stream_limit_firehose = 1000000
+    return manager
+
+
+def test_update_job(mocker: MockerFixture) -> None:
+    """
+    Test that the events of a job are written to both streams in one round trip.
+    """
+    manager = get_async_query_manager(mocker)
+    pipeline = manager._redis.pipeline.return_value
+    job_metadata = {"channel_id": "abc", "job_id": "123"}
+
+    manager.update_job(job_metadata, "done", result_url="/api/v1/chart/data/1")
+
+    event_data = {
+        "data": json.dumps(
+            {**job_metadata, "status": "done", "result_url": "/api/v1/chart/data/1"}
+        )
+    }
+    manager._redis.pipeline.assert_called_once_with(transaction=False)
+    assert pipeline.xadd.call_args_list == [
+        mocker.call("async-events-abc", event_data, "*", 1000),
+        mocker.call("async-events-full", event_data, "*", 1000000),
+    ]
+    pipeline.execute.assert_called_once()
+    manager._redis.xadd.assert_not_called()
+
+
+def test_read_events_long_polling(mocker: MockerFixture) -> None:
+    """
+    Test that reads only wait for new events when there are none.
+    """
+    manager = get_async_query_manager(mocker)
+    manager._long_polling_timeout = 10000
+    event = ("1607477697866-0", {"data": '{"status": "done"}'})
+
+    manager._redis.xrange.return_value = [event]
+    assert manager.read_events("abc", None, 5000) == [
+        {"id": "1607477697866-0", "status": "done"}
+    ]
+    manager._redis.xread.assert_not_called()
+
+    manager._redis.xrange.return_value = []
+    manager._redis.xread.return_value = []
+    assert manager.read_events("abc", None) == []
+    manager._redis.xread.assert_not_called()
+
+    assert manager.read_events("abc", None, 5000) == []
+    manager._redis.xread.assert_called_with(
+        {"async-events-abc": "0-0"}, count=100, block=5000
+    )
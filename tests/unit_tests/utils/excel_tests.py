@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import io
+import zipfile
+from datetime import datetime
+from typing import IO, Optional
+from xml.etree import ElementTree
+
+import numpy as np
+import pandas as pd
+import pytest
+
+NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def read_cells(file: IO[bytes]) -> dict[str, Optional[str]]:
+    """
+    Return the values of the cells of the first worksheet, by reference.
+    """
+    with zipfile.ZipFile(file) as archive:
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    return {
+        cell.attrib["r"]: cell.findtext("x:v", namespaces=NS)
+        or cell.findtext("x:is/x:t", namespaces=NS)
+        for cell in root.iterfind(".//x:c", NS)
+    }
+
+
+def test_df_to_excel_file() -> None:
+    from superset.utils.excel import df_to_excel_file, iter_file
+
+    df = pd.DataFrame(
+        {
+            "name": ["a", None, "c"],
+            "value": [1.5, np.nan, 3],
+            "ts": [datetime(2023, 1, 1), pd.NaT, datetime(2023, 1, 3)],
+        }
+    )
+
+    file = df_to_excel_file(df, batch_size=2)
+    cells = read_cells(io.BytesIO(b"".join(iter_file(file, chunk_size=100))))
+    assert file.closed
+
+    assert cells == {
+        "B1": "name",
+        "C1": "value",
+        "D1": "ts",
+        "A2": "0",
+        "B2": "a",
+        "C2": "1.5",
+        "D2": "44927",
+        "A3": "1",
+        "A4": "2",
+        "B4": "c",
+        "C4": "3",
+        "D4": "44929",
+    }
+
+
+def test_df_to_excel_file_named_index() -> None:
+    from superset.utils.excel import df_to_excel_file
+
+    df = pd.DataFrame({"value": [1, 2]}, index=pd.Index(["x", "y"], name="key"))
+
+    assert read_cells(df_to_excel_file(df)) == {
+        "A1": "key",
+        "B1": "value",
+        "A2": "x",
+        "B2": "1",
+        "A3": "y",
+        "B3": "2",
+    }
+    assert read_cells(df_to_excel_file(df, index=False, header=False)) == {
+        "A1": "1",
+        "A2": "2",
+    }
+
+
+def test_df_to_excel_file_other_types() -> None:
+    """
+    Test that values xlsxwriter can't write are written as strings.
+    """
+    from uuid import UUID
+
+    from superset.utils.excel import df_to_excel_file
+
+    uuid = UUID("3fa85f64-5717-4562-b3fc-2c963f66afa6")
+    df = pd.DataFrame(
+        {
+            "list": [[1, 2], None],
+            "dict": [{"a": 1}, None],
+            "uuid": [uuid, None],
+            "period": [pd.Period("2023-01", freq="M"), None],
+            "bytes": [b"x", None],
+            "mixed": [1, "a"],
+        }
+    )
+
+    with df_to_excel_file(df, index=False) as file:
+        cells = read_cells(file)
+
+    assert cells == {
+        "A1": "list",
+        "B1": "dict",
+        "C1": "uuid",
+        "D1": "period",
+        "E1": "bytes",
+        "F1": "mixed",
+        "A2": "[1, 2]",
+        "B2": "{'a': 1}",
+        "C2": str(uuid),
+        "D2": "2023-01",
+        "E2": "b'x'",
+        "F2": "1",
+        "F3": "a",
+    }
+
+
+def test_df_to_excel_file_limits() -> None:
+    from superset.exceptions import ExportTooLargeError
+    from superset.utils.excel import df_to_excel_file
+
+    df = pd.DataFrame({"value": range(100)})
+
+    with pytest.raises(ExportTooLargeError) as excinfo:
+        df_to_excel_file(df, max_rows=99)
+    assert excinfo.value.status == 413
+
+    with pytest.raises(ExportTooLargeError):
+        df_to_excel_file(df, max_bytes=1000)
+
+    df_to_excel_file(df, max_rows=100, max_bytes=100_000).close()
@@ -16,6 +16,10 @@
 # under the License.
 
 
+from typing import Any
+
+from pytest_mock import MockerFixture
+
 from superset.utils.log import get_logger_from_status
 
 
@@ -35,3 +39,43 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that logs are written in batches from a background thread.
+    """
+    from superset.utils.log import BufferedDBEventLogger
+
+    batches: list[list[dict[str, Any]]] = []
+    mocker.patch.object(
+        BufferedDBEventLogger, "_write", side_effect=lambda rows: batches.append(rows)
+    )
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=60)
+    for i in range(3):
+        event_logger.log(1, "action", None, 10, i, None, records=[{"i": i}])
+
+    # the last log is written on shutdown, before the flush interval elapsed
+    event_logger.shutdown()
+    assert [[row["slice_id"] for row in batch] for batch in batches] == [[0, 1], [2]]
+    assert batches[0][0]["json"] == '{"i": 0}'
+    assert batches[0][0]["action"] == "action"
+    assert batches[0][0]["user_id"] == 1
+    assert batches[0][0]["dttm"]
+
+
+def test_buffered_db_event_logger_full(
+    mocker: MockerFixture, app_context: None
+) -> None:
+    """
+    Test that logs are dropped when the queue is full.
+    """
+    from superset.utils.log import BufferedDBEventLogger
+
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager")
+    mocker.patch.object(BufferedDBEventLogger, "_start")
+    event_logger = BufferedDBEventLogger(max_queue_size=2)
+    event_logger.log(1, "action", None, 10, None, None, records=[{}, {}, {}])
+
+    assert event_logger.dropped == 1
+    stats_logger.instance.incr.assert_called_once_with("event_logger.dropped")
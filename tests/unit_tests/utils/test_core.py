@@ -22,6 +22,7 @@ import pytest
 from superset.utils.core import (
     cast_to_boolean,
     is_test,
+    parallel_map,
     parse_boolean_string,
     QueryObjectFilterClause,
     remove_extra_adhoc_filters,
@@ -171,3 +172,36 @@ def test_other_values():
     assert cast_to_boolean([]) is False
     assert cast_to_boolean({}) is False
     assert cast_to_boolean(object()) is False
+
+
+def test_parallel_map(app_context: None) -> None:
+    """
+    Test that ``parallel_map`` runs calls in worker threads with a copy of
+    ``flask.g``, returning the results in order.
+    """
+    import threading
+
+    from flask import g
+
+    g.user = "admin"
+
+    def func(item: int) -> tuple[int, str, bool]:
+        # nested calls run sequentially
+        assert parallel_map(lambda x: x, [1, 2], max_workers=2) == [1, 2]
+        return (
+            item * 2,
+            g.user,
+            threading.current_thread() is threading.main_thread(),
+        )
+
+    results = parallel_map(func, range(4), max_workers=2)
+    assert [result[:2] for result in results] == [(i * 2, "admin") for i in range(4)]
+    assert not any(result[2] for result in results)
+
+    # sequential
+    results = parallel_map(func, range(4), max_workers=1)
+    assert all(result[2] for result in results)
+
+    # exceptions are raised in the caller
+    with pytest.raises(ZeroDivisionError):
+        parallel_map(lambda x: 1 / x, [1, 0], max_workers=2)
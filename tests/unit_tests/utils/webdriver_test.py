@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+import pytest
+from pytest_mock import MockFixture
+
+
+@pytest.mark.parametrize(
+    "app",
+    [{"WEBDRIVER_POOL_SIZE": 1, "WEBDRIVER_POOL_MAX_USES": 3}],
+    indirect=True,
+)
+def test_webdriver_pool(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that drivers are reused per key, recycled after the maximum number of uses,
+    and discarded when unhealthy or when an error is raised.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    from superset.utils.webdriver import WebDriverPool, WebDriverProxy
+
+    destroy = mocker.patch.object(WebDriverProxy, "destroy")
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+    pool = WebDriverPool()
+
+    with pool.lease(("chrome", 1, (800, 600)), create) as driver:
+        first = driver
+    with pool.lease(("chrome", 1, (800, 600)), create) as driver:
+        assert driver is first
+    assert create.call_count == 1
+
+    # another user gets another driver, which evicts the idle one
+    with pool.lease(("chrome", 2, (800, 600)), create) as driver:
+        assert driver is not first
+    destroy.assert_called_once_with(first, 5)
+
+    # recycled after the maximum number of uses
+    with pool.lease(("chrome", 2, (800, 600)), create) as second:
+        pass
+    with pool.lease(("chrome", 2, (800, 600)), create) as driver:
+        assert driver is second
+    assert destroy.call_args.args[0] is second
+
+    # an unhealthy driver is replaced
+    with pool.lease(("chrome", 2, (800, 600)), create) as third:
+        pass
+    type(third).current_url = mocker.PropertyMock(side_effect=WebDriverException())
+    with pool.lease(("chrome", 2, (800, 600)), create) as driver:
+        assert driver is not third
+    assert destroy.call_args.args[0] is third
+
+    # a driver that raised is destroyed
+    with pytest.raises(ValueError):
+        with pool.lease(("chrome", 2, (800, 600)), create) as fourth:
+            raise ValueError()
+    assert destroy.call_args.args[0] is fourth
+
+    with pool.lease(("chrome", 2, (800, 600)), create) as driver:
+        pass
+    assert create.call_count == 5
+    pool.dispose()
+    assert destroy.call_args.args[0] is driver
+
+
+def test_webdriver_pool_disabled(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that drivers are destroyed after every use when the pool is disabled.
+    """
+    from superset.utils.webdriver import WebDriverPool, WebDriverProxy
+
+    destroy = mocker.patch.object(WebDriverProxy, "destroy")
+    pool = WebDriverPool()
+    with pool.lease(("chrome", 1, (800, 600)), mocker.MagicMock) as driver:
+        pass
+    destroy.assert_called_once_with(driver, 5)
+
+
+@pytest.mark.parametrize(
+    "app",
+    [{"SCREENSHOT_WAIT_FOR_READY": True, "SCREENSHOT_READY_ANIMATION_WAIT": 0}],
+    indirect=True,
+)
+def test_get_screenshot_waits_for_ready(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that screenshots wait for the charts to signal they are ready instead of
+    sleeping, and that the time to ready is reported.
+    """
+    from flask import current_app
+
+    from superset.utils.webdriver import WebDriverProxy
+
+    sleep = mocker.patch("superset.utils.webdriver.sleep")
+    timing = mocker.patch.object(current_app.config["STATS_LOGGER"], "timing")
+    driver = mocker.MagicMock()
+    driver.execute_script.side_effect = [
+        None,
+        {
+            "charts": [
+                {"id": "1", "status": "rendered", "ready": 800.0},
+                {"id": "2", "status": "failed", "ready": 1200.0},
+            ]
+        },
+    ]
+    element = mocker.MagicMock(screenshot_as_png=b"image")
+    driver.find_element.return_value = element
+
+    proxy = WebDriverProxy("chrome")
+    wait_for_charts = mocker.patch.object(proxy, "_wait_for_charts")
+    user = mocker.MagicMock(username="admin")
+    assert proxy._get_screenshot(driver, "http://dashboard", "grid", user) == b"image"
+
+    wait_for_charts.assert_not_called()
+    sleep.assert_called_once_with(0)
+    assert driver.execute_script.call_count == 2
+    # charts that received their data but aren't drawn yet aren't ready
+    assert "success" not in driver.execute_script.call_args[0][1]
+    timing.assert_has_calls(
+        [
+            mocker.call("screenshot.chart_time_to_ready", 800.0),
+            mocker.call("screenshot.chart_time_to_ready", 1200.0),
+            mocker.call("screenshot.time_to_ready", 1200.0),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "app",
+    [{"SCREENSHOT_WAIT_FOR_READY": True, "SCREENSHOT_READY_WAIT": 0}],
+    indirect=True,
+)
+def test_get_screenshot_ready_timeout(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that screenshots of pages that don't signal readiness fall back to waiting
+    for the charts to load.
+    """
+    from superset.utils.webdriver import WebDriverProxy
+
+    mocker.patch("superset.utils.webdriver.sleep")
+    driver = mocker.MagicMock()
+    driver.execute_script.return_value = None
+
+    proxy = WebDriverProxy("chrome")
+    wait_for_charts = mocker.patch.object(proxy, "_wait_for_charts")
+    user = mocker.MagicMock(username="admin")
+    proxy._get_screenshot(driver, "http://dashboard", "grid", user)
+
+    wait_for_charts.assert_called_once_with(driver, "http://dashboard")
@@ -0,0 +1,49 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+def test_get_changing_dtypes(app_context: None) -> None:
+    """
+    Test that only the columns whose dtype changes between chunks get a common dtype,
+    and only those that become ``object`` are created as text, so the SQL type of
+    other ``object`` columns is still inferred by pandas.
+    """
+    import numpy as np
+    import pandas as pd
+    from sqlalchemy import types
+
+    from superset.views.database.views import get_changing_dtypes, get_to_sql_dtypes
+
+    dtypes = get_changing_dtypes(
+        [
+            pd.DataFrame(
+                {"a": [True], "b": [None], "c": [1], "d": [1], "e": [1]}
+            ).dtypes,
+            pd.DataFrame(
+                {"a": ["x"], "b": [None], "c": [1.5], "d": [1], "e": ["x"]}
+            ).dtypes,
+        ]
+    )
+
+    assert dtypes == {
+        "a": np.dtype(object),
+        "c": np.dtype(np.float64),
+        "e": np.dtype(object),
+    }
+    to_sql_dtypes = get_to_sql_dtypes(dtypes)
+    assert list(to_sql_dtypes) == ["a", "e"]
+    assert all(isinstance(dtype, types.Text) for dtype in to_sql_dtypes.values())